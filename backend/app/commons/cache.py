@@ -0,0 +1,204 @@
+"""
+메모리 캐시 (TTL + LRU + stale-while-revalidate)
+
+카페24 상품/카테고리처럼 자주 바뀌지 않는 데이터를 프로세스 메모리에 보관합니다.
+- 항목마다 TTL 지정 (종류별로 다르게)
+- 항목 수 / 전체 크기(바이트)를 넘으면 가장 오래 안 쓴 항목부터 제거 (LRU)
+- TTL이 지난 항목은 stale 기간 동안 바로 돌려주고, 뒤에서 새로 불러옴
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+
+@dataclass
+class CacheEntry:
+    """캐시 항목"""
+
+    value: Any
+    size: int  # 대략적인 크기 (바이트)
+    expires_at: float  # 이 시각까지는 fresh
+    stale_until: float  # 이 시각까지는 stale로 제공 가능
+    stored_at: float = 0.0  # 저장한 시각 (얼마나 오래된 값인지 계산용)
+
+
+class TTLCache:
+    """TTL + LRU 캐시"""
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        max_bytes: int = 50 * 1024 * 1024,
+        stale_ttl: float = 0.0,
+        sizeof: Callable[[Any], int] = lambda value: 1,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stale_ttl = stale_ttl  # TTL이 지난 뒤에도 제공할 시간 (초)
+        self._sizeof = sizeof
+
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        # 같은 키를 동시에 불러오지 않도록 진행 중인 로드 보관
+        self._loading: dict[Hashable, asyncio.Task] = {}
+        # 백그라운드 갱신 태스크 (GC 방지용 참조)
+        self._background: set[asyncio.Task] = set()
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """fresh 항목이 있는지 (통계/LRU 순서 미반영)"""
+        entry = self._entries.get(key)
+        return entry is not None and time.monotonic() < entry.expires_at
+
+    def _lookup(self, key: Hashable) -> Optional[CacheEntry]:
+        """만료 안 된 항목 찾기 (stale 포함, 통계 미반영)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry.stale_until:
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def peek(self, key: Hashable) -> Optional[tuple[Any, float]]:
+        """항목과 저장 후 지난 시간(초) 반환 (stale 포함, 통계/LRU 순서 미반영)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        now = time.monotonic()
+        if now >= entry.stale_until:
+            return None
+        return entry.value, now - entry.stored_at
+
+    def get(self, key: Hashable) -> Any:
+        """fresh 항목만 반환 (없거나 만료되면 None)"""
+        entry = self._lookup(key)
+        if entry is None or time.monotonic() >= entry.expires_at:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry.value
+
+    def set(self, key: Hashable, value: Any, ttl: float):
+        """항목 저장"""
+        if key in self._entries:
+            self._remove(key)
+
+        size = self._sizeof(value)
+        if size > self.max_bytes:
+            return
+
+        now = time.monotonic()
+        self._entries[key] = CacheEntry(
+            value=value,
+            size=size,
+            expires_at=now + ttl,
+            stale_until=now + ttl + self.stale_ttl,
+            stored_at=now,
+        )
+        self._bytes += size
+        self._evict()
+
+    def delete(self, key: Hashable):
+        """항목 삭제"""
+        if key in self._entries:
+            self._remove(key)
+
+    def clear(self):
+        """전체 삭제"""
+        self._entries.clear()
+        self._bytes = 0
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def _evict(self):
+        """용량 초과 시 오래 안 쓴 항목부터 제거"""
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.evictions += 1
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]], ttl: float) -> Any:
+        """같은 키의 동시 로드는 하나로 합침"""
+        task = self._loading.get(key)
+        if task is None:
+            task = asyncio.create_task(loader())
+            self._loading[key] = task
+
+            def _done(t: asyncio.Task):
+                self._loading.pop(key, None)
+                if not t.cancelled() and t.exception() is None:
+                    self.set(key, t.result(), ttl)
+
+            task.add_done_callback(_done)
+        return await asyncio.shield(task)
+
+    async def load(self, key: Hashable, loader: Callable[[], Awaitable[Any]], ttl: float) -> Any:
+        """캐시를 거치지 않고 불러와서 저장 (미리 불러오기용, 통계 미반영)"""
+        return await self._load(key, loader, ttl)
+
+    def _revalidate(self, key: Hashable, loader: Callable[[], Awaitable[Any]], ttl: float):
+        """stale 항목을 백그라운드에서 새로 불러옴"""
+        if key in self._loading:
+            return
+
+        async def _refresh():
+            try:
+                await self._load(key, loader, ttl)
+            except Exception as e:
+                # 실패하면 stale 값을 계속 사용
+                print(f"[CACHE] 백그라운드 갱신 실패 ({key}): {e}")
+
+        task = asyncio.create_task(_refresh())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: float,
+    ) -> Any:
+        """
+        캐시에서 조회, 없으면 loader로 불러와서 저장
+
+        - fresh: 바로 반환
+        - stale: 바로 반환 + 백그라운드 갱신
+        - miss: loader 결과를 기다려서 반환
+        """
+        entry = self._lookup(key)
+        if entry is not None:
+            if time.monotonic() < entry.expires_at:
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+                self._revalidate(key, loader, ttl)
+            return entry.value
+
+        self.misses += 1
+        return await self._load(key, loader, ttl)
+
+    def stats(self) -> dict:
+        """캐시 통계"""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
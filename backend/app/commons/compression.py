@@ -0,0 +1,135 @@
+"""
+응답 압축 (gzip / brotli)
+
+상품 목록 JSON은 설명(HTML)이 많아서 5~10배 정도 줄어듭니다.
+- Accept-Encoding을 보고 br → gzip 순으로 선택 (brotli 패키지가 없으면 gzip만)
+- 일정 크기(compression_min_size) 미만은 압축하지 않음
+- 이미 Content-Encoding이 있는 응답(미리 압축해 둔 캐시 본문)은 그대로 통과
+"""
+import gzip
+from typing import Optional
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.commons.config import get_settings
+
+try:
+    import brotli
+except ImportError:  # brotli가 없으면 gzip만 사용
+    brotli = None
+
+# 압축 우선순위 (앞쪽이 더 잘 줄어듦)
+SUPPORTED_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+# 압축할 만한 Content-Type
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Accept-Encoding 헤더로 사용할 압축 방식 선택
+
+    q=0으로 거부한 방식은 제외합니다. 받을 수 있는 게 없으면 None (압축 안 함)
+    """
+    if not accept_encoding or not get_settings().compression_enabled:
+        return None
+
+    accepted: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name] = q
+
+    wildcard = accepted.get("*", 0.0)
+    for encoding in SUPPORTED_ENCODINGS:
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """지정한 방식으로 압축"""
+    settings = get_settings()
+    if encoding == "br":
+        return brotli.compress(data, quality=settings.compression_brotli_quality)
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=settings.compression_gzip_level, mtime=0)
+    raise ValueError(f"지원하지 않는 압축 방식: {encoding}")
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    """압축할 만한 Content-Type인지"""
+    return bool(content_type) and content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    """
+    응답 압축 미들웨어 (캐시되지 않는 일반 응답용)
+
+    본문을 한 번에 보내는 응답만 압축하고, 스트리밍 응답은 그대로 보냅니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.settings = get_settings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message):
+            nonlocal start, passthrough
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if "content-encoding" in headers or not is_compressible(headers.get("content-type")):
+                    passthrough = True
+                    await send(message)
+                else:
+                    # 본문을 보고 결정하기 위해 잠시 보류
+                    start = message
+                return
+
+            if passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            if message.get("more_body", False):
+                # 스트리밍 응답은 압축하지 않음
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            headers = MutableHeaders(raw=start["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            if len(body) >= self.settings.compression_min_size:
+                body = compress(body, encoding)
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    # 바이트가 달라지므로 약한 ETag로 (If-None-Match는 약한 비교)
+                    headers["ETag"] = f"W/{etag}"
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
@@ -29,6 +29,77 @@ class Settings(BaseSettings):
     debug: bool = True
     secret_key: str = "change-this-secret-key"
 
+    # HTTP 클라이언트 설정 (외부 API 커넥션 풀)
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0  # 유휴 커넥션 유지 시간 (초)
+    http2_enabled: bool = False  # h2 패키지 필요 (pip install httpx[http2])
+
+    # 카페24 API 타임아웃 (초)
+    cafe24_connect_timeout: float = 5.0
+    cafe24_read_timeout: float = 10.0
+    cafe24_pool_timeout: float = 5.0  # 커넥션 풀 대기 시간
+
+    # 카페24 호출 제한 (leaky bucket, X-Api-Call-Limit 헤더로 자동 보정)
+    cafe24_call_limit_bucket: int = 40  # 버킷 크기
+    cafe24_call_limit_leak_rate: float = 2.0  # 초당 비워지는 호출 수
+    cafe24_call_limit_reserve: int = 5  # 주문 요청 전용 여유분
+    cafe24_max_concurrency: int = 10  # 동시 요청 수
+    cafe24_queue_timeout: float = 30.0  # 호출 대기열 최대 대기 시간 (초)
+    cafe24_max_429_retries: int = 3
+
+    # 상품 캐시 (TTL 초, stale 기간 동안은 만료된 값을 주고 뒤에서 갱신)
+    product_cache_enabled: bool = True
+    product_cache_list_ttl: float = 60.0
+    product_cache_detail_ttl: float = 300.0
+    product_cache_category_ttl: float = 600.0
+    product_cache_stale_ttl: float = 300.0
+    product_cache_max_entries: int = 2000
+    product_cache_max_bytes: int = 64 * 1024 * 1024
+
+    # 직렬화된 상품 응답 본문 캐시 (바이트)
+    product_body_cache_max_bytes: int = 32 * 1024 * 1024
+
+    # 상품 목록 응답 후 앞쪽 N개 상품 상세 미리 불러오기 (미러가 준비되기 전/꺼져 있을 때)
+    product_prefetch_enabled: bool = True
+    product_prefetch_top_n: int = 4
+    product_prefetch_concurrency: int = 2
+    product_prefetch_max_pending: int = 20
+
+    # 하위 카테고리 포함 조회 시 카테고리별 동시 요청 수
+    product_fanout_concurrency: int = 6
+
+    # 상품 카탈로그 미러 (전체 상품을 메모리에 보관)
+    catalog_mirror_enabled: bool = True
+    catalog_mirror_refresh_interval: float = 300.0  # 전체 갱신 주기 (초)
+    catalog_mirror_max_products: int = 20000
+
+    # 장바구니 저장소 (memory / sqlite / redis)
+    cart_store: str = "memory"
+    cart_ttl: int = 60 * 60 * 24 * 7  # 마지막 사용 후 유지 시간 (초, 쿠키 유효기간과 같음)
+    cart_store_max_entries: int = 100_000  # memory: 최대 장바구니 수
+    cart_store_max_bytes: int = 64 * 1024 * 1024  # memory: 최대 크기
+    cart_sqlite_path: str = "carts.db"
+    cart_redis_url: str = "redis://localhost:6379/0"
+    cart_sweep_interval: float = 60.0  # 만료된 장바구니 정리 주기 (초)
+    # 장바구니 담기에 쓸 상품 정보(미러/캐시)의 최대 나이 (초, 가격/재고는 결제 전 다시 확인)
+    cart_snapshot_max_age: float = 600.0
+
+    # 응답 압축 (gzip / brotli)
+    compression_enabled: bool = True
+    compression_min_size: int = 1024  # 이 크기(바이트) 미만은 압축 안 함
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 5
+
+    # 카페24 토큰 만료 몇 초 전에 백그라운드로 갱신할지
+    cafe24_token_refresh_margin: int = 300
+
+    # 토스페이먼츠 API 타임아웃 (초, 작업별)
+    toss_connect_timeout: float = 5.0
+    toss_confirm_timeout: float = 30.0  # 결제 승인은 카드사 응답까지 기다림
+    toss_lookup_timeout: float = 5.0
+    toss_cancel_timeout: float = 30.0
+
     # 카페24 API 기본 URL (mall_id로 동적 생성)
     @property
     def cafe24_api_url(self) -> str:
@@ -0,0 +1,31 @@
+"""
+페이지 커서 (keyset 페이지네이션)
+
+마지막으로 받은 항목의 정렬 키를 불투명한 문자열로 만들어 next_cursor로 내려주고,
+다음 요청에서 그 키 다음부터 조회합니다.
+offset과 달리 앞쪽 항목 수와 관계없이 한 페이지만큼만 읽고,
+조회 중에 항목이 추가/삭제되어도 페이지가 밀리지 않습니다.
+"""
+import base64
+import binascii
+import json
+from typing import Any
+from app.commons.exceptions import InvalidCursorException
+from app.commons.response import json_bytes
+
+
+def encode_cursor(payload: dict[str, Any]) -> str:
+    """커서 데이터 → URL에 그대로 쓸 수 있는 문자열"""
+    return base64.urlsafe_b64encode(json_bytes(payload)).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """커서 문자열 → 커서 데이터 (형식이 잘못되면 400)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError, UnicodeDecodeError):
+        raise InvalidCursorException()
+    if not isinstance(payload, dict):
+        raise InvalidCursorException()
+    return payload
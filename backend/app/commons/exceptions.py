@@ -34,6 +34,13 @@ class CartNotFoundException(HTTPException):
         super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
 
 
+class CartItemNotFoundException(HTTPException):
+    """장바구니 아이템을 찾을 수 없음"""
+
+    def __init__(self, detail: str = "장바구니 아이템을 찾을 수 없습니다."):
+        super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+
+
 class ProductNotFoundException(HTTPException):
     """상품을 찾을 수 없음"""
 
@@ -41,6 +48,48 @@ class ProductNotFoundException(HTTPException):
         super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
 
 
+class OutOfStockException(HTTPException):
+    """품절된 상품/옵션"""
+
+    def __init__(self, detail: str = "품절된 상품입니다."):
+        super().__init__(status_code=status.HTTP_409_CONFLICT, detail=detail)
+
+
+class CartChangedException(HTTPException):
+    """결제 이후 장바구니 가격/재고가 바뀌어 결제 금액과 맞지 않음"""
+
+    def __init__(self, detail: str = "장바구니 가격이나 재고가 변경되었습니다. 다시 확인 후 결제해주세요."):
+        super().__init__(status_code=status.HTTP_409_CONFLICT, detail=detail)
+
+
+class CartConflictException(HTTPException):
+    """같은 장바구니를 동시에 변경하는 요청이 많아 저장하지 못함"""
+
+    def __init__(self, detail: str = "장바구니가 동시에 변경되고 있습니다. 잠시 후 다시 시도해주세요."):
+        super().__init__(status_code=status.HTTP_409_CONFLICT, detail=detail)
+
+
+class CategoryNotFoundException(HTTPException):
+    """카테고리를 찾을 수 없음"""
+
+    def __init__(self, detail: str = "카테고리를 찾을 수 없습니다."):
+        super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+
+
+class InvalidCursorException(HTTPException):
+    """잘못된 페이지 커서"""
+
+    def __init__(self, detail: str = "잘못된 커서입니다. 첫 페이지부터 다시 조회하세요."):
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+class CatalogNotReadyException(HTTPException):
+    """상품 카탈로그(미러)가 아직 준비되지 않음"""
+
+    def __init__(self, detail: str = "상품 정보를 불러오는 중입니다. 잠시 후 다시 시도하세요."):
+        super().__init__(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail)
+
+
 class OrderNotFoundException(HTTPException):
     """주문을 찾을 수 없음"""
 
@@ -0,0 +1,49 @@
+"""
+공유 HTTP 클라이언트 생성
+
+외부 API(카페24, 토스)마다 커넥션 풀을 가진 AsyncClient 하나를 만들어 재사용합니다.
+요청마다 클라이언트를 새로 만들면 매번 TCP/TLS 핸드셰이크가 발생합니다.
+"""
+from typing import Optional
+import httpx
+from app.commons.config import get_settings
+
+
+def _http2_available() -> bool:
+    """h2 패키지 설치 여부 확인"""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def create_async_client(
+    timeout: httpx.Timeout,
+    base_url: str = "",
+    headers: Optional[dict] = None,
+) -> httpx.AsyncClient:
+    """
+    keep-alive 커넥션 풀을 사용하는 AsyncClient 생성
+
+    풀 크기, keep-alive 유지 시간, HTTP/2 사용 여부는 설정에서 읽습니다.
+    """
+    settings = get_settings()
+
+    http2 = settings.http2_enabled
+    if http2 and not _http2_available():
+        print("[WARN] h2 패키지가 없어 HTTP/1.1로 연결합니다. (pip install httpx[http2])")
+        http2 = False
+
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry,
+    )
+    return httpx.AsyncClient(
+        base_url=base_url,
+        timeout=timeout,
+        limits=limits,
+        http2=http2,
+        headers=headers,
+    )
@@ -3,8 +3,19 @@ API 응답 형식 정의
 
 모든 API 응답에서 일관된 형식을 사용합니다.
 """
+import hashlib
+import json
+from dataclasses import dataclass, field
 from typing import Any, Optional, Generic, TypeVar
+from fastapi import Response
 from pydantic import BaseModel
+from app.commons.compression import compress, negotiate_encoding
+from app.commons.config import get_settings
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 사용
+    orjson = None
 
 T = TypeVar("T")
 
@@ -34,6 +45,97 @@ def success_response(data: Any = None, message: str = "성공") -> dict:
     return {"success": True, "message": message, "data": data}
 
 
+def json_bytes(content: Any) -> bytes:
+    """JSON 직렬화 (orjson 있으면 사용)"""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+@dataclass(frozen=True)
+class SerializedBody:
+    """직렬화된 응답 본문 + ETag (본문 해시) + 미리 압축한 본문"""
+
+    body: bytes
+    etag: str
+    # 압축 방식 → 압축된 본문 (한 번 압축해 두고 재사용)
+    encoded: dict[str, bytes] = field(default_factory=dict, compare=False, repr=False)
+
+    @property
+    def size(self) -> int:
+        """원본 + 압축본 전체 크기 (캐시 용량 계산용)"""
+        return len(self.body) + sum(len(b) for b in self.encoded.values())
+
+    def encode(self, encoding: str) -> bytes:
+        """압축된 본문 (처음 요청될 때 압축해서 보관)"""
+        data = self.encoded.get(encoding)
+        if data is None:
+            data = compress(self.body, encoding)
+            self.encoded[encoding] = data
+        return data
+
+
+def serialize_body(content: Any) -> SerializedBody:
+    """응답 본문을 JSON 바이트로 만들고 ETag 계산"""
+    body = json_bytes(content)
+    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+    return SerializedBody(body=body, etag=f'"{digest}"')
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def not_modified_response(etag: str, cache_control: str = "no-cache") -> Response:
+    """304 Not Modified 응답 (본문 없음)"""
+    return Response(
+        status_code=304,
+        headers={"ETag": etag, "Cache-Control": cache_control},
+    )
+
+
+def json_response(
+    body: SerializedBody,
+    if_none_match: Optional[str] = None,
+    cache_control: str = "no-cache",
+    accept_encoding: Optional[str] = None,
+) -> Response:
+    """
+    이미 직렬화된 JSON 본문으로 응답
+
+    FastAPI의 jsonable_encoder / json.dumps 과정을 거치지 않습니다.
+    If-None-Match가 ETag와 같으면 본문 없이 304를 반환합니다.
+    Accept-Encoding에 맞춰 미리 압축해 둔 본문을 보냅니다. (압축 미들웨어는 건너뜀)
+    """
+    encoding = None
+    if len(body.body) >= get_settings().compression_min_size:
+        encoding = negotiate_encoding(accept_encoding)
+
+    # 압축본은 바이트가 다르므로 약한 ETag (If-None-Match는 약한 비교)
+    etag = f"W/{body.etag}" if encoding else body.etag
+    if etag_matches(if_none_match, body.etag):
+        response = not_modified_response(etag, cache_control)
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+        return Response(content=body.encode(encoding), media_type="application/json", headers=headers)
+    return Response(content=body.body, media_type="application/json", headers=headers)
+
+
 def error_response(message: str = "오류가 발생했습니다.") -> dict:
     """에러 응답 생성"""
     return {"success": False, "message": message, "data": None}
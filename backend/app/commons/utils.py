@@ -5,6 +5,7 @@
 """
 import uuid
 from datetime import datetime
+from decimal import Decimal, InvalidOperation
 from typing import Any
 
 
@@ -23,6 +24,14 @@ def format_price(amount: int) -> str:
     return f"{amount:,}원"
 
 
+def price_to_int(amount: str) -> int:
+    """가격 문자열 → 원 단위 정수 ("39000.00" → 39000)"""
+    try:
+        return int(Decimal(amount))
+    except (InvalidOperation, ValueError):
+        return 0
+
+
 def safe_get(data: dict, *keys: str, default: Any = None) -> Any:
     """
     중첩된 딕셔너리에서 안전하게 값 가져오기
@@ -4,39 +4,65 @@
 장바구니 관련 API 엔드포인트
 """
 from typing import Optional
-from fastapi import APIRouter, Cookie, Response
+from fastapi import APIRouter, Cookie, Header, Response
 from app.services.cart_service import cart_service
-from app.models.cart import AddToCartRequest, UpdateCartItemRequest
-from app.commons.response import success_response
+from app.commons.config import get_settings
+from app.models.cart import AddToCartRequest, BatchCartRequest, UpdateCartItemRequest
+from app.commons.exceptions import CartNotFoundException
+from app.commons.response import (
+    success_response,
+    etag_matches,
+    json_response,
+    not_modified_response,
+)
 
 router = APIRouter(prefix="/cart", tags=["장바구니"])
+settings = get_settings()
+
+
+def _set_cart_cookie(response: Response, cart_id: str):
+    """장바구니 쿠키 설정 (장바구니가 처음 만들어졌을 때)"""
+    response.set_cookie(
+        key="cart_id",
+        value=cart_id,
+        max_age=settings.cart_ttl,  # 장바구니 만료 시간과 같게
+        httponly=True,
+        samesite="lax",
+    )
 
 
 @router.get("")
 async def get_cart(
     response: Response,
     cart_id: Optional[str] = Cookie(None, description="장바구니 ID (쿠키)"),
+    if_none_match: Optional[str] = Header(None),
 ):
     """
     장바구니 조회
 
     현재 장바구니 내용을 조회합니다.
-    장바구니가 없으면 새로 생성합니다.
+    장바구니가 없으면 만들지 않고 빈 장바구니(id가 빈 문자열)를 반환합니다. (쿠키도 설정하지 않음)
+    장바구니는 처음 상품을 담을 때 만들어집니다.
 
     **쿠키:** cart_id - 장바구니 식별자
+
+    ETag를 반환하며, 장바구니가 바뀌지 않았으면(If-None-Match 일치) 304를 반환합니다.
     """
-    cart = cart_service.get_or_create_cart(cart_id)
-
-    # 새 장바구니면 쿠키 설정
-    if cart_id != cart.id:
-        response.set_cookie(
-            key="cart_id",
-            value=cart.id,
-            max_age=60 * 60 * 24 * 7,  # 7일
-            httponly=True,
-            samesite="lax",
+    cart = await cart_service.get_cart(cart_id)
+    if cart is None:
+        # 크롤러/헬스 체크 등 장바구니가 없는 조회는 미리 만들어 둔 본문을 그대로 보냄
+        return json_response(
+            cart_service.empty_cart_body(),
+            if_none_match,
+            cache_control="private, no-cache",
         )
 
+    etag = cart_service.get_etag(cart)
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag, cache_control="private, no-cache")
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+
     return success_response(data=cart.model_dump())
 
 
@@ -57,26 +83,81 @@ async def add_to_cart(
         "quantity": 1
     }
     ```
+
+    장바구니가 없으면 이때 만들고 쿠키를 설정합니다.
     """
-    # 장바구니가 없으면 생성
-    cart = cart_service.get_or_create_cart(cart_id)
-
-    if cart_id != cart.id:
-        response.set_cookie(
-            key="cart_id",
-            value=cart.id,
-            max_age=60 * 60 * 24 * 7,
-            httponly=True,
-            samesite="lax",
-        )
+    updated_cart = await cart_service.add_item(cart_id, request)
+    if cart_id != updated_cart.id:
+        _set_cart_cookie(response, updated_cart.id)
 
-    updated_cart = await cart_service.add_item(cart.id, request)
     return success_response(
         data=updated_cart.model_dump(),
         message="장바구니에 추가되었습니다.",
     )
 
 
+@router.post("/items:batch")
+async def batch_cart_items(
+    request: BatchCartRequest,
+    response: Response,
+    cart_id: Optional[str] = Cookie(None),
+):
+    """
+    장바구니 일괄 변경
+
+    재주문, 코디 한 번에 담기, 로그인 후 장바구니 합치기처럼 여러 상품을 한 번에 변경합니다.
+    작업은 순서대로 적용되며, 하나라도 실패하면 아무것도 바뀌지 않습니다. (최대 100개)
+
+    **요청 본문:**
+    ```json
+    {
+        "operations": [
+            {"op": "add", "product_id": "123", "variant_id": "옵션ID (선택)", "quantity": 2},
+            {"op": "update", "item_id": "장바구니 아이템 ID", "quantity": 3},
+            {"op": "remove", "item_id": "장바구니 아이템 ID"}
+        ]
+    }
+    ```
+
+    **참고:** add의 quantity는 생략하면 1, update의 quantity는 필수이며 0으로 설정하면 삭제됩니다.
+    장바구니가 없으면 전부 적용된 경우에만 새로 만들고 쿠키를 설정합니다.
+    """
+    updated_cart = await cart_service.apply_operations(cart_id, request.operations)
+    if cart_id != updated_cart.id:
+        _set_cart_cookie(response, updated_cart.id)
+
+    return success_response(
+        data=updated_cart.model_dump(),
+        message="장바구니가 변경되었습니다.",
+    )
+
+
+@router.post("/validate")
+async def validate_cart(
+    cart_id: Optional[str] = Cookie(None),
+):
+    """
+    결제 전 장바구니 확인
+
+    담긴 상품의 가격/재고를 카페24에서 한 번에 다시 확인합니다.
+    (장바구니에 담을 때는 몇 분 전 상품 정보를 쓸 수 있으므로 결제 직전에 호출)
+
+    - 가격이 바뀐 아이템은 새 가격으로 바뀝니다. (`reason: price_changed`)
+    - 품절/판매 종료된 아이템은 삭제됩니다. (`reason: sold_out` / `not_found`)
+
+    `changes`가 비어 있지 않으면 결제 금액이 바뀌었으므로 사용자에게 다시 확인받아야 합니다.
+    장바구니가 없으면 404를 반환합니다.
+    """
+    if not cart_id:
+        raise CartNotFoundException()
+
+    result = await cart_service.revalidate(cart_id)
+    return success_response(
+        data=result.model_dump(),
+        message="장바구니 상품 정보가 바뀌었습니다." if result.changes else "결제할 수 있습니다.",
+    )
+
+
 @router.put("/items/{item_id}")
 async def update_cart_item(
     item_id: str,
@@ -104,7 +185,7 @@ async def update_cart_item(
             message="장바구니가 없습니다.",
         )
 
-    updated_cart = cart_service.update_item(cart_id, item_id, request.quantity)
+    updated_cart = await cart_service.update_item(cart_id, item_id, request.quantity)
     return success_response(
         data=updated_cart.model_dump(),
         message="수량이 변경되었습니다.",
@@ -128,7 +209,7 @@ async def remove_cart_item(
             message="장바구니가 없습니다.",
         )
 
-    updated_cart = cart_service.remove_item(cart_id, item_id)
+    updated_cart = await cart_service.remove_item(cart_id, item_id)
     return success_response(
         data=updated_cart.model_dump(),
         message="상품이 삭제되었습니다.",
@@ -150,7 +231,7 @@ async def clear_cart(
             message="장바구니가 없습니다.",
         )
 
-    updated_cart = cart_service.clear_cart(cart_id)
+    updated_cart = await cart_service.clear_cart(cart_id)
     return success_response(
         data=updated_cart.model_dump(),
         message="장바구니를 비웠습니다.",
@@ -58,6 +58,7 @@ async def create_order(
 async def get_orders(
     page: int = Query(1, ge=1, description="페이지 번호"),
     limit: int = Query(10, ge=1, le=50, description="페이지당 주문 수"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
 ):
     """
     주문 목록 조회
@@ -67,14 +68,15 @@ async def get_orders(
     **파라미터:**
     - page: 페이지 번호
     - limit: 페이지당 주문 수
+    - cursor: 이전 응답의 `next_cursor` (지정하면 page 대신 그 다음부터 조회)
+
+    응답 `data`의 `next_cursor`로 다음 페이지를 조회합니다. (마지막 페이지면 null, 상품 목록과 같은 형식)
 
     **참고:** 현재는 인증 없이 모든 주문을 반환합니다.
     실제 서비스에서는 사용자별 필터링이 필요합니다.
     """
-    orders = order_service.get_orders(page=page, limit=limit)
-    return success_response(
-        data=[o.model_dump() for o in orders],
-    )
+    result = order_service.get_orders(page=page, limit=limit, cursor=cursor)
+    return success_response(data=result.model_dump())
 
 
 @router.get("/{order_id}")
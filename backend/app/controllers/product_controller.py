@@ -3,19 +3,60 @@
 
 상품 조회 관련 API 엔드포인트
 """
-from typing import Optional
-from fastapi import APIRouter, Query
+from typing import Literal, Optional
+from fastapi import APIRouter, Header, HTTPException, Query, status
+from app.models.product import ProductFilter
 from app.services.product_service import product_service
-from app.commons.response import success_response
+from app.commons.response import success_response, json_response
 
 router = APIRouter(prefix="/products", tags=["상품"])
 
 
+def _parse_fields(fields: Optional[str]) -> Optional[tuple[str, ...]]:
+    """fields 파라미터 검증 (모르는 필드면 400)"""
+    try:
+        return product_service.parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+def _parse_filter(
+    min_price: Optional[int],
+    max_price: Optional[int],
+    tags: Optional[list[str]],
+    available: Optional[bool],
+) -> Optional[ProductFilter]:
+    """필터 파라미터 → ProductFilter (조건이 없으면 None)"""
+    tag_values = sorted({t.strip() for value in tags or [] for t in value.split(",") if t.strip()})
+    product_filter = ProductFilter(
+        min_price=min_price,
+        max_price=max_price,
+        tags=tuple(tag_values),
+        available=available,
+    )
+    return None if product_filter.is_empty else product_filter
+
+
+# 배치 조회 최대 상품 수
+MAX_BATCH_IDS = 100
+
+
 @router.get("")
 async def get_products(
     page: int = Query(1, ge=1, description="페이지 번호"),
     limit: int = Query(10, ge=1, le=100, description="페이지당 상품 수"),
     category: Optional[int] = Query(None, description="카테고리 번호"),
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (쉼표 구분)"),
+    min_price: Optional[int] = Query(None, ge=0, description="최소 가격 (원)"),
+    max_price: Optional[int] = Query(None, ge=0, description="최대 가격 (원)"),
+    tag: Optional[list[str]] = Query(None, description="태그 (여러 개면 하나라도 있는 상품)"),
+    available: Optional[bool] = Query(None, description="판매 중인 상품만 (true) / 품절만 (false)"),
+    sort: Optional[Literal["newest", "price_asc", "price_desc", "name"]] = Query(
+        None, description="정렬 (기본: 상품번호 내림차순)"
+    ),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
 ):
     """
     상품 목록 조회
@@ -26,6 +67,18 @@ async def get_products(
     - page: 페이지 번호 (1부터 시작)
     - limit: 페이지당 상품 수 (최대 100)
     - category: 특정 카테고리의 상품만 조회
+    - fields: 필요한 필드만 조회 (예: `id,title,price,featured_image`)
+      카페24에서도 해당 필드만 받아오므로 응답이 작고 빠릅니다.
+    - min_price, max_price: 가격 범위 (원, 양 끝 포함)
+    - tag: 태그 필터 (`tag=신상&tag=세일` 또는 `tag=신상,세일`)
+    - available: 판매 여부
+    - cursor: 이전 응답의 `next_cursor` (지정하면 page 대신 그 다음부터 조회)
+    - sort: 정렬 (`newest` 등록일 최신순, `price_asc` 낮은 가격순, `price_desc` 높은 가격순, `name` 이름순)
+
+    필터를 하나라도 지정하면 응답에 `facets`(태그/카테고리/판매 여부별 개수, 가격 범위)가 포함됩니다.
+    각 항목의 개수는 그 항목의 조건만 빼고 센 값입니다.
+
+    ETag를 반환하며, If-None-Match가 같으면 304를 반환합니다.
 
     **응답 예시:**
     ```json
@@ -36,32 +89,121 @@ async def get_products(
             "total": 100,
             "page": 1,
             "limit": 10,
-            "has_next": true
+            "has_next": true,
+            "next_cursor": "eyJzIjoiIiwiayI6Wy0xMl19"
         }
     }
     ```
     """
-    result = await product_service.get_products(
+    body = await product_service.get_products_body(
         page=page,
         limit=limit,
         category_no=category,
+        fields=_parse_fields(fields),
+        product_filter=_parse_filter(min_price, max_price, tag, available),
+        sort=sort,
+        cursor=cursor,
     )
-    return success_response(data=result.model_dump())
+    return json_response(body, if_none_match, accept_encoding=accept_encoding)
 
 
 @router.get("/categories")
-async def get_categories():
+async def get_categories(
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+):
     """
     카테고리 목록 조회
 
     모든 상품 카테고리를 조회합니다.
     """
-    categories = await product_service.get_categories()
-    return success_response(data=[c.model_dump() for c in categories])
+    body = await product_service.get_categories_body()
+    return json_response(body, if_none_match, accept_encoding=accept_encoding)
+
+
+@router.get("/categories/{category_id}")
+async def get_category(category_id: str):
+    """
+    카테고리 상세 조회
+
+    카테고리 정보와 최상위부터의 경로(breadcrumb)를 조회합니다.
+
+    **파라미터:**
+    - category_id: 카테고리 번호
+    """
+    category, breadcrumb = await product_service.get_category(category_id)
+    return success_response(data={
+        "category": category.model_dump(),
+        "breadcrumb": [c.model_dump() for c in breadcrumb],
+    })
+
+
+@router.get("/search")
+async def search_products(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어"),
+    page: int = Query(1, ge=1, description="페이지 번호"),
+    limit: int = Query(20, ge=1, le=100, description="페이지당 상품 수"),
+):
+    """
+    상품 검색
+
+    상품명, 태그, 카테고리명에서 검색합니다. (관련도 높은 순)
+    띄어쓰기와 관계없이 글자 2개 단위로 찾으므로 "반팔티"로 "반팔 티셔츠"도 찾습니다.
+
+    **예시:** `/api/products/search?q=반팔티`
+    """
+    result = await product_service.search_products(q, page, limit)
+    return success_response(data=result.model_dump())
+
+
+@router.get("/batch")
+async def get_products_batch(
+    ids: str = Query(..., description="상품 ID 목록 (쉼표 구분, 최대 100개)"),
+):
+    """
+    여러 상품 한 번에 조회
+
+    장바구니, 추천 목록처럼 여러 상품 정보가 필요할 때 사용합니다.
+    요청한 순서대로 반환하며, 없는 상품은 found=false로 표시됩니다.
+
+    **예시:** `/api/products/batch?ids=12,15,20`
+
+    **응답 예시:**
+    ```json
+    {
+        "success": true,
+        "data": [
+            {"id": "12", "found": true, "product": {...}},
+            {"id": "15", "found": false, "product": null}
+        ]
+    }
+    ```
+    """
+    product_ids = [i.strip() for i in ids.split(",") if i.strip()]
+    if len(product_ids) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"상품 ID는 최대 {MAX_BATCH_IDS}개까지 조회할 수 있습니다.",
+        )
+
+    products = await product_service.get_products_batch(product_ids)
+    return success_response(data=[
+        {
+            "id": product_id,
+            "found": product is not None,
+            "product": product,
+        }
+        for product_id, product in zip(product_ids, products)
+    ])
 
 
 @router.get("/{product_id}")
-async def get_product(product_id: str):
+async def get_product(
+    product_id: str,
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (쉼표 구분)"),
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+):
     """
     상품 상세 조회
 
@@ -69,6 +211,7 @@ async def get_product(product_id: str):
 
     **파라미터:**
     - product_id: 상품 ID (카페24의 product_no)
+    - fields: 필요한 필드만 조회 (예: `id,title,price`)
 
     **응답에 포함되는 정보:**
     - 상품명, 설명
@@ -76,5 +219,5 @@ async def get_product(product_id: str):
     - 이미지
     - 옵션 (사이즈, 색상 등)
     """
-    product = await product_service.get_product(product_id)
-    return success_response(data=product.model_dump())
+    body = await product_service.get_product_body(product_id, _parse_fields(fields))
+    return json_response(body, if_none_match, accept_encoding=accept_encoding)
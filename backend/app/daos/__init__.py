@@ -1,5 +1,6 @@
 # DAOs 모듈
-# 외부 API 호출 담당 (카페24, 토스페이먼츠)
+# 외부 API 호출 / 저장소 담당 (카페24, 토스페이먼츠, 장바구니 저장소)
 
 from .cafe24_dao import Cafe24DAO
 from .toss_dao import TossDAO
+from .cart_store import CartStore, create_cart_store
@@ -6,16 +6,40 @@
 - 주문 생성/조회
 - 카테고리 조회
 """
+import asyncio
 import json
+import time
 import httpx
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Awaitable, Callable, Optional
 from app.commons.config import get_settings
+from app.commons.http_client import create_async_client
+from app.daos.call_limiter import (
+    CallLimitScheduler,
+    PRIORITY_HIGH,
+    PRIORITY_NORMAL,
+    PRIORITY_LOW,
+)
 from app.commons.exceptions import Cafe24APIException, Cafe24AuthException
 
 # 토큰 저장 파일 경로
 TOKEN_FILE = Path(__file__).parent.parent.parent / "token.json"
 
+# 카페24 expires_at은 타임존 없는 한국 시간으로 내려옴
+KST = timezone(timedelta(hours=9))
+
+# 컬렉션별 최대 페이지 크기
+PRODUCT_PAGE_SIZE = 100
+CATEGORY_PAGE_SIZE = 100
+ORDER_PAGE_SIZE = 1000
+# 카페24 offset 최대값 (이보다 깊은 페이지는 offset으로 조회 불가)
+MAX_OFFSET = 8000
+
+# 백그라운드 토큰 갱신 루프의 최소/최대 대기 시간 (초)
+TOKEN_CHECK_MIN_INTERVAL = 10
+TOKEN_CHECK_MAX_INTERVAL = 60
+
 
 class Cafe24DAO:
     """카페24 API 클라이언트"""
@@ -24,6 +48,20 @@ class Cafe24DAO:
         self.settings = get_settings()
         self._access_token: Optional[str] = None
         self._refresh_token: Optional[str] = None
+        self._expires_at: Optional[float] = None  # Access Token 만료 시각 (epoch 초)
+        # 진행 중인 토큰 갱신 (동시 갱신 요청을 하나로 합침)
+        self._refresh_task: Optional[asyncio.Task] = None
+        # 만료 전에 토큰을 미리 갱신하는 백그라운드 태스크
+        self._token_refresher: Optional[asyncio.Task] = None
+        # 공유 HTTP 클라이언트 (앱 lifespan에서 열고 닫음)
+        self._client: Optional[httpx.AsyncClient] = None
+        # 호출 제한(X-Api-Call-Limit)을 지키는 요청 스케줄러
+        self.limiter = CallLimitScheduler(
+            bucket_size=self.settings.cafe24_call_limit_bucket,
+            leak_rate=self.settings.cafe24_call_limit_leak_rate,
+            reserve=self.settings.cafe24_call_limit_reserve,
+            max_concurrency=self.settings.cafe24_max_concurrency,
+        )
         # 서버 시작 시 토큰 로드
         self._load_tokens()
 
@@ -37,6 +75,48 @@ class Cafe24DAO:
         """카페24 OAuth URL"""
         return f"https://{self.settings.cafe24_mall_id}.cafe24api.com/api/v2/oauth"
 
+    # ========== HTTP 클라이언트 ==========
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """카페24용 커넥션 풀 클라이언트 생성"""
+        timeout = httpx.Timeout(
+            self.settings.cafe24_read_timeout,
+            connect=self.settings.cafe24_connect_timeout,
+            pool=self.settings.cafe24_pool_timeout,
+        )
+        return create_async_client(timeout=timeout)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        공유 HTTP 클라이언트
+
+        lifespan 밖(스크립트 등)에서 호출되면 처음 사용할 때 생성합니다.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+        return self._client
+
+    async def open(self):
+        """클라이언트 열기 + 백그라운드 토큰 갱신 시작 (앱 시작 시)"""
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+        if self._token_refresher is None or self._token_refresher.done():
+            self._token_refresher = asyncio.create_task(self._token_refresh_loop())
+
+    async def close(self):
+        """백그라운드 작업 중지 + 클라이언트 닫기 (앱 종료 시)"""
+        if self._token_refresher is not None:
+            self._token_refresher.cancel()
+            try:
+                await self._token_refresher
+            except asyncio.CancelledError:
+                pass
+            self._token_refresher = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     def _load_tokens(self):
         """토큰 로드 (파일 → .env 순서)"""
         # 1. 파일에서 로드 시도
@@ -46,6 +126,7 @@ class Cafe24DAO:
                     data = json.load(f)
                     self._access_token = data.get("access_token")
                     self._refresh_token = data.get("refresh_token")
+                    self._expires_at = data.get("expires_at")
                     print(f"토큰 로드 완료 (파일)")
                     return
             except Exception as e:
@@ -64,17 +145,44 @@ class Cafe24DAO:
                 json.dump({
                     "access_token": self._access_token,
                     "refresh_token": self._refresh_token,
+                    "expires_at": self._expires_at,
                 }, f)
             print(f"토큰 저장 완료")
         except Exception as e:
             print(f"토큰 저장 실패: {e}")
 
-    def set_tokens(self, access_token: str, refresh_token: str):
-        """토큰 설정 및 저장"""
+    def set_tokens(
+        self,
+        access_token: str,
+        refresh_token: str,
+        expires_at: Optional[float] = None,
+    ):
+        """
+        토큰 설정 및 저장
+
+        expires_at 없이 같은 토큰을 다시 설정하면 기존 만료 시각을 유지합니다.
+        """
+        if expires_at is not None or access_token != self._access_token:
+            self._expires_at = expires_at
         self._access_token = access_token
         self._refresh_token = refresh_token
         self._save_tokens()
 
+    @staticmethod
+    def _parse_expires_at(data: dict) -> Optional[float]:
+        """토큰 응답에서 만료 시각(epoch 초) 계산"""
+        if data.get("expires_in"):
+            return time.time() + int(data["expires_in"])
+        if data.get("expires_at"):
+            try:
+                expires_at = datetime.fromisoformat(data["expires_at"])
+            except ValueError:
+                return None
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=KST)
+            return expires_at.timestamp()
+        return None
+
     def _get_headers(self) -> dict:
         """API 요청 헤더"""
         if not self._access_token:
@@ -102,75 +210,285 @@ class Cafe24DAO:
 
     async def get_access_token(self, auth_code: str) -> dict:
         """인증 코드로 Access Token 발급"""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.auth_url}/token",
-                data={
-                    "grant_type": "authorization_code",
-                    "code": auth_code,
-                    "redirect_uri": self.settings.cafe24_redirect_uri,
-                },
-                auth=(
-                    self.settings.cafe24_client_id,
-                    self.settings.cafe24_client_secret,
-                ),
-            )
+        response = await self.client.post(
+            f"{self.auth_url}/token",
+            data={
+                "grant_type": "authorization_code",
+                "code": auth_code,
+                "redirect_uri": self.settings.cafe24_redirect_uri,
+            },
+            auth=(
+                self.settings.cafe24_client_id,
+                self.settings.cafe24_client_secret,
+            ),
+        )
 
-            if response.status_code != 200:
-                raise Cafe24AuthException(f"토큰 발급 실패: {response.text}")
+        if response.status_code != 200:
+            raise Cafe24AuthException(f"토큰 발급 실패: {response.text}")
 
-            data = response.json()
-            self.set_tokens(data["access_token"], data["refresh_token"])
-            return data
+        data = response.json()
+        self.set_tokens(
+            data["access_token"],
+            data["refresh_token"],
+            expires_at=self._parse_expires_at(data),
+        )
+        return data
 
     async def refresh_access_token(self) -> dict:
-        """Refresh Token으로 Access Token 갱신"""
+        """
+        Refresh Token으로 Access Token 갱신
+
+        동시에 여러 곳에서 호출해도 갱신 요청은 한 번만 보내고,
+        기다리던 호출들은 모두 같은 결과를 받습니다.
+        (refresh token은 한 번 쓰면 무효화되므로 중복 갱신하면 안 됨)
+        """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_access_token())
+        # 기다리던 요청이 취소돼도 갱신 자체는 끝까지 진행
+        return await asyncio.shield(self._refresh_task)
+
+    async def _refresh_access_token(self) -> dict:
+        """토큰 갱신 요청 (refresh_access_token을 통해서만 호출)"""
         if not self._refresh_token:
             raise Cafe24AuthException("Refresh token이 없습니다.")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.auth_url}/token",
-                data={
-                    "grant_type": "refresh_token",
-                    "refresh_token": self._refresh_token,
-                },
-                auth=(
-                    self.settings.cafe24_client_id,
-                    self.settings.cafe24_client_secret,
-                ),
-            )
+        response = await self.client.post(
+            f"{self.auth_url}/token",
+            data={
+                "grant_type": "refresh_token",
+                "refresh_token": self._refresh_token,
+            },
+            auth=(
+                self.settings.cafe24_client_id,
+                self.settings.cafe24_client_secret,
+            ),
+        )
 
-            if response.status_code != 200:
-                raise Cafe24AuthException(f"토큰 갱신 실패: {response.text}")
+        if response.status_code != 200:
+            raise Cafe24AuthException(f"토큰 갱신 실패: {response.text}")
 
-            data = response.json()
-            self.set_tokens(
-                data["access_token"],
-                data.get("refresh_token", self._refresh_token)
-            )
-            return data
+        data = response.json()
+        self.set_tokens(
+            data["access_token"],
+            data.get("refresh_token", self._refresh_token),
+            expires_at=self._parse_expires_at(data),
+        )
+        return data
 
-    async def _request_with_retry(self, method: str, url: str, **kwargs) -> httpx.Response:
+    def _next_token_check_delay(self) -> float:
+        """다음 만료 확인까지 대기 시간"""
+        if not self._expires_at:
+            return TOKEN_CHECK_MAX_INTERVAL
+        refresh_at = self._expires_at - self.settings.cafe24_token_refresh_margin
+        delay = refresh_at - time.time()
+        return max(TOKEN_CHECK_MIN_INTERVAL, min(delay, TOKEN_CHECK_MAX_INTERVAL))
+
+    async def _token_refresh_loop(self):
+        """
+        만료 전에 토큰을 미리 갱신 (백그라운드)
+
+        사용자 요청이 401 → 갱신 → 재시도 왕복을 겪지 않도록
+        만료 cafe24_token_refresh_margin초 전에 갱신합니다.
+        """
+        margin = self.settings.cafe24_token_refresh_margin
+        while True:
+            try:
+                if (
+                    self._refresh_token
+                    and self._expires_at
+                    and time.time() >= self._expires_at - margin
+                ):
+                    print("토큰 만료 임박, 백그라운드 갱신...")
+                    await self.refresh_access_token()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"백그라운드 토큰 갱신 실패: {e}")
+            await asyncio.sleep(self._next_token_check_delay())
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> Optional[float]:
+        """429 응답의 Retry-After 헤더 (초)"""
+        try:
+            return float(response.headers.get("Retry-After", ""))
+        except ValueError:
+            return None
+
+    async def _send(self, method: str, url: str, priority: int, **kwargs) -> httpx.Response:
+        """
+        호출 제한 스케줄러를 거쳐 요청 전송
+
+        버킷에 여유가 없으면 우선순위 순서대로 대기하고,
+        429를 받으면 버킷이 빌 때까지 기다렸다가 다시 보냅니다.
+        """
+        for attempt in range(self.settings.cafe24_max_429_retries + 1):
+            try:
+                await self.limiter.acquire(priority, timeout=self.settings.cafe24_queue_timeout)
+            except asyncio.TimeoutError:
+                raise Cafe24APIException("카페24 요청이 많아 대기 시간을 초과했습니다.")
+
+            response = None
+            try:
+                response = await self.client.request(method, url, headers=self._get_headers(), **kwargs)
+            finally:
+                if response is not None and response.status_code == 429:
+                    self.limiter.penalize(self._retry_after(response))
+                    self.limiter.release()
+                else:
+                    self.limiter.release(response.headers if response is not None else None)
+
+            if response.status_code != 429:
+                return response
+            print(f"카페24 호출 제한 초과 (429), 대기 후 재시도 ({attempt + 1})")
+
+        return response
+
+    async def _request_with_retry(
+        self,
+        method: str,
+        url: str,
+        priority: int = PRIORITY_NORMAL,
+        **kwargs,
+    ) -> httpx.Response:
         """
         API 요청 (토큰 만료 시 자동 갱신)
 
         401 에러 발생 시 토큰을 갱신하고 재시도합니다.
+        priority가 높은 요청(주문)은 호출 제한에 걸릴 때 먼저 나갑니다.
         """
-        async with httpx.AsyncClient() as client:
-            # 첫 번째 시도
-            response = await client.request(method, url, headers=self._get_headers(), **kwargs)
-
-            # 401 (토큰 만료) → 갱신 후 재시도
-            if response.status_code == 401:
-                print("토큰 만료됨, 갱신 시도...")
-                try:
+        # 첫 번째 시도
+        response = await self._send(method, url, priority, **kwargs)
+
+        # 401 (토큰 만료) → 갱신 후 재시도
+        if response.status_code == 401:
+            print("토큰 만료됨, 갱신 시도...")
+            try:
+                # 그사이 다른 요청이 이미 갱신했다면 새 토큰으로 재시도만 함
+                used_auth = response.request.headers.get("Authorization")
+                if used_auth == f"Bearer {self._access_token}":
                     await self.refresh_access_token()
-                    response = await client.request(method, url, headers=self._get_headers(), **kwargs)
-                except Exception as e:
-                    raise Cafe24AuthException(f"토큰 갱신 실패: {e}")
+                response = await self._send(method, url, priority, **kwargs)
+            except Exception as e:
+                raise Cafe24AuthException(f"토큰 갱신 실패: {e}")
+
+        return response
+
+    # ========== 페이지네이션 ==========
+
+    async def _paginate(
+        self,
+        fetch_page: Callable[[int, Optional[int]], Awaitable[list[dict]]],
+        page_size: int,
+        id_key: Optional[str] = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[dict]:
+        """
+        컬렉션 전체를 한 건씩 순회
+
+        fetch_page(offset, since_id)로 한 페이지씩 가져옵니다.
+        - id_key가 있으면 offset 대신 마지막 ID 다음부터 조회 (깊은 페이지도 같은 비용)
+        - prefetch면 현재 페이지를 처리하는 동안 다음 페이지를 미리 요청
+        한 번에 한두 페이지만 메모리에 있으므로 전체 크기와 관계없이 메모리가 일정합니다.
+        """
+
+        def next_position(page: list[dict], offset: int) -> Optional[tuple[int, Optional[int]]]:
+            if len(page) < page_size:
+                return None
+            if id_key:
+                return 0, page[-1].get(id_key)
+            if offset + page_size > MAX_OFFSET:
+                print(f"[WARN] offset 최대값({MAX_OFFSET}) 도달, 조회 중단")
+                return None
+            return offset + page_size, None
+
+        position = (0, 0 if id_key else None)
+        task: Optional[asyncio.Task] = asyncio.create_task(fetch_page(*position))
+        try:
+            while task is not None:
+                page = await task
+                task = None
+
+                next_pos = next_position(page, position[0])
+                if next_pos is not None and prefetch:
+                    task = asyncio.create_task(fetch_page(*next_pos))
+
+                for item in page:
+                    yield item
+
+                if next_pos is None:
+                    break
+                if task is None:
+                    task = asyncio.create_task(fetch_page(*next_pos))
+                position = next_pos
+        finally:
+            # 중간에 순회를 멈추면 미리 요청한 페이지 취소
+            if task is not None and not task.done():
+                task.cancel()
+
+    async def iter_products(
+        self,
+        category_no: Optional[int] = None,
+        embed: Optional[str] = None,
+        fields: Optional[str] = None,
+        keyset: bool = True,
+        prefetch: bool = True,
+    ) -> AsyncIterator[dict]:
+        """
+        전체 상품 순회
+
+        keyset=True면 상품번호 순으로 since_product_no를 이어 가며 조회합니다.
+        (offset 최대값 제한 없음, 깊은 페이지도 빠름)
+        keyset=False면 카페24 기본 정렬 순서로 offset 조회합니다.
+        """
+
+        async def fetch_page(offset: int, since: Optional[int]) -> list[dict]:
+            response = await self.get_products(
+                limit=PRODUCT_PAGE_SIZE,
+                offset=offset,
+                category_no=category_no,
+                embed=embed,
+                fields=fields,
+                since_product_no=since,
+            )
+            return response.get("products", [])
+
+        async for product in self._paginate(
+            fetch_page,
+            PRODUCT_PAGE_SIZE,
+            id_key="product_no" if keyset else None,
+            prefetch=prefetch,
+        ):
+            yield product
+
+    async def iter_categories(self, prefetch: bool = True) -> AsyncIterator[dict]:
+        """전체 카테고리 순회"""
 
-            return response
+        async def fetch_page(offset: int, since: Optional[int]) -> list[dict]:
+            response = await self.get_categories(limit=CATEGORY_PAGE_SIZE, offset=offset)
+            return response.get("categories", [])
+
+        async for category in self._paginate(fetch_page, CATEGORY_PAGE_SIZE, prefetch=prefetch):
+            yield category
+
+    async def iter_orders(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[dict]:
+        """전체 주문 순회 (날짜 형식: YYYY-MM-DD)"""
+
+        async def fetch_page(offset: int, since: Optional[int]) -> list[dict]:
+            response = await self.get_orders(
+                limit=ORDER_PAGE_SIZE,
+                offset=offset,
+                start_date=start_date,
+                end_date=end_date,
+            )
+            return response.get("orders", [])
+
+        async for order in self._paginate(fetch_page, ORDER_PAGE_SIZE, prefetch=prefetch):
+            yield order
 
     # ========== 상품 관련 ==========
 
@@ -179,10 +497,31 @@ class Cafe24DAO:
         limit: int = 10,
         offset: int = 0,
         category_no: Optional[int] = None,
+        embed: Optional[str] = None,
+        fields: Optional[str] = None,
+        since_product_no: Optional[int] = None,
+        product_name: Optional[str] = None,
     ) -> dict:
         """상품 목록 조회"""
         params = {"limit": limit, "offset": offset}
 
+        # 상품번호 기준 이어서 조회 (offset과 함께 쓸 수 없음)
+        if since_product_no is not None:
+            params.pop("offset")
+            params["since_product_no"] = since_product_no
+
+        # 옵션/이미지 등 하위 리소스 함께 조회 (예: "variants,images")
+        if embed:
+            params["embed"] = embed
+
+        # 필요한 필드만 조회 (예: "product_no,product_name,price")
+        if fields:
+            params["fields"] = fields
+
+        # 상품명 검색
+        if product_name:
+            params["product_name"] = product_name
+
         # 카테고리 필터링은 category 파라미터 사용
         if category_no:
             params["category"] = category_no
@@ -191,6 +530,7 @@ class Cafe24DAO:
         response = await self._request_with_retry(
             "GET",
             f"{self.base_url}/products",
+            priority=PRIORITY_LOW,
             params=params,
         )
 
@@ -199,12 +539,25 @@ class Cafe24DAO:
 
         return response.json()
 
-    async def get_product(self, product_no: int) -> dict:
-        """상품 상세 조회"""
+    async def get_product(
+        self,
+        product_no: int,
+        embed: Optional[str] = "variants,images",
+        fields: Optional[str] = None,
+        priority: int = PRIORITY_NORMAL,
+    ) -> dict:
+        """상품 상세 조회 (미리 불러오기는 LOW 우선순위)"""
+        params = {}
+        if embed:
+            params["embed"] = embed
+        if fields:
+            params["fields"] = fields
+
         response = await self._request_with_retry(
             "GET",
             f"{self.base_url}/products/{product_no}",
-            params={"embed": "variants,images"},
+            priority=priority,
+            params=params,
         )
 
         if response.status_code != 200:
@@ -212,13 +565,63 @@ class Cafe24DAO:
 
         return response.json()
 
+    async def get_products_by_ids(
+        self,
+        product_nos: list[int],
+        embed: Optional[str] = "variants,images",
+    ) -> list[dict]:
+        """
+        여러 상품 한 번에 조회
+
+        product_no 필터(쉼표 구분)로 최대 100개씩 묶어서 조회하고,
+        묶음이 여러 개면 동시에 요청합니다. 없는 상품은 결과에서 빠집니다.
+        """
+        chunks = [
+            product_nos[i:i + PRODUCT_PAGE_SIZE]
+            for i in range(0, len(product_nos), PRODUCT_PAGE_SIZE)
+        ]
+
+        async def fetch_chunk(chunk: list[int]) -> list[dict]:
+            params = {
+                "product_no": ",".join(str(no) for no in chunk),
+                "limit": len(chunk),
+            }
+            if embed:
+                params["embed"] = embed
+
+            response = await self._request_with_retry(
+                "GET",
+                f"{self.base_url}/products",
+                params=params,
+            )
+
+            if response.status_code != 200:
+                raise Cafe24APIException(f"상품 조회 실패: {response.text}")
+
+            return response.json().get("products", [])
+
+        results = await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+        return [product for products in results for product in products]
+
     # ========== 카테고리 관련 ==========
 
-    async def get_categories(self) -> dict:
+    async def get_categories(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> dict:
         """카테고리 목록 조회"""
+        params = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+
         response = await self._request_with_retry(
             "GET",
             f"{self.base_url}/categories",
+            priority=PRIORITY_LOW,
+            params=params,
         )
 
         if response.status_code != 200:
@@ -233,6 +636,7 @@ class Cafe24DAO:
         response = await self._request_with_retry(
             "POST",
             f"{self.base_url}/orders",
+            priority=PRIORITY_HIGH,
             json=order_data,
         )
 
@@ -246,6 +650,7 @@ class Cafe24DAO:
         response = await self._request_with_retry(
             "GET",
             f"{self.base_url}/orders/{order_id}",
+            priority=PRIORITY_HIGH,
         )
 
         if response.status_code != 200:
@@ -253,12 +658,24 @@ class Cafe24DAO:
 
         return response.json()
 
-    async def get_orders(self, limit: int = 10, offset: int = 0) -> dict:
+    async def get_orders(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> dict:
         """주문 목록 조회"""
+        params = {"limit": limit, "offset": offset}
+        if start_date:
+            params["start_date"] = start_date
+        if end_date:
+            params["end_date"] = end_date
+
         response = await self._request_with_retry(
             "GET",
             f"{self.base_url}/orders",
-            params={"limit": limit, "offset": offset},
+            params=params,
         )
 
         if response.status_code != 200:
@@ -0,0 +1,160 @@
+"""
+카페24 API 호출 제한 스케줄러
+
+카페24는 leaky bucket 방식으로 호출 수를 제한합니다.
+(응답 헤더 X-Api-Call-Limit: "사용량/버킷크기", 초당 약 2회씩 비워짐)
+
+버킷이 가득 차면 429 에러가 나므로, 응답 헤더로 남은 여유를 추적하고
+요청을 우선순위 큐에 세워 두었다가 여유가 생기면 순서대로 내보냅니다.
+- 주문 요청(HIGH)이 상품 목록 조회(LOW)보다 먼저 나감
+- 버킷의 마지막 몇 칸(reserve)은 HIGH 요청 전용
+- 요청이 몰리면 에러 대신 대기 (지연 시간이 늘어나는 방식으로 버팀)
+"""
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Mapping, Optional
+
+# 우선순위 (숫자가 작을수록 먼저)
+PRIORITY_HIGH = 0  # 주문 생성/조회
+PRIORITY_NORMAL = 1  # 상품 상세, 주문 목록
+PRIORITY_LOW = 2  # 상품 목록, 카테고리
+
+CALL_LIMIT_HEADER = "X-Api-Call-Limit"
+
+
+class CallLimitScheduler:
+    """카페24 호출 제한을 지키며 요청 순서를 정하는 스케줄러"""
+
+    def __init__(
+        self,
+        bucket_size: int = 40,
+        leak_rate: float = 2.0,
+        reserve: int = 5,
+        max_concurrency: int = 10,
+    ):
+        self._bucket_size = bucket_size
+        self._leak_rate = leak_rate  # 초당 비워지는 호출 수
+        self._reserve = reserve  # HIGH 요청 전용 여유분
+        self._max_concurrency = max_concurrency
+
+        self._level = 0.0  # 추정 버킷 사용량
+        self._updated_at = time.monotonic()
+        self._in_flight = 0
+
+        # (우선순위, 순번, future) 힙
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+
+        self._throttled = 0  # 대기열에 들어간 요청 수
+        self._rate_limited = 0  # 429 응답 수
+
+    def _drain(self):
+        """지난 시간만큼 버킷 비우기"""
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._level = max(0.0, self._level - elapsed * self._leak_rate)
+
+    def _capacity_for(self, priority: int) -> int:
+        """우선순위별 사용 가능한 버킷 크기"""
+        if priority == PRIORITY_HIGH:
+            return self._bucket_size
+        return max(1, self._bucket_size - self._reserve)
+
+    def _can_send(self, priority: int) -> bool:
+        if self._in_flight >= self._max_concurrency:
+            return False
+        return self._level + self._in_flight + 1 <= self._capacity_for(priority)
+
+    def _dispatch(self):
+        """대기 중인 요청을 우선순위 순으로 내보냄"""
+        self._drain()
+        while self._waiters:
+            priority, _, future = self._waiters[0]
+            if future.done():  # 타임아웃/취소된 요청
+                heapq.heappop(self._waiters)
+                continue
+            if not self._can_send(priority):
+                break
+            heapq.heappop(self._waiters)
+            self._in_flight += 1
+            future.set_result(None)
+
+        if self._waiters and self._in_flight < self._max_concurrency:
+            # 버킷이 비워질 때까지 기다렸다가 다시 확인
+            priority = self._waiters[0][0]
+            overflow = self._level + self._in_flight + 1 - self._capacity_for(priority)
+            self._schedule_wakeup(max(overflow, 0.0) / self._leak_rate)
+
+    def _schedule_wakeup(self, delay: float):
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+        loop = asyncio.get_running_loop()
+        self._wakeup = loop.call_later(max(delay, 0.01), self._dispatch)
+
+    async def acquire(self, priority: int = PRIORITY_NORMAL, timeout: Optional[float] = None):
+        """
+        요청 보낼 차례 기다리기
+
+        timeout 안에 차례가 오지 않으면 asyncio.TimeoutError가 발생합니다.
+        """
+        self._drain()
+        if not self._waiters and self._can_send(priority):
+            self._in_flight += 1
+            return
+
+        self._throttled += 1
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        self._dispatch()
+
+        try:
+            await asyncio.wait_for(future, timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            # 차례를 받은 직후 취소됐다면 자리를 돌려줌
+            if future.done() and not future.cancelled():
+                self._in_flight -= 1
+                self._dispatch()
+            raise
+
+    def release(self, headers: Optional[Mapping[str, str]] = None):
+        """요청 완료 후 호출 (응답 헤더로 버킷 상태 갱신)"""
+        self._in_flight -= 1
+        self._drain()
+
+        call_limit = headers.get(CALL_LIMIT_HEADER) if headers else None
+        if call_limit:
+            try:
+                used, size = call_limit.split("/")
+                self._level = float(used)
+                self._bucket_size = int(size)
+            except ValueError:
+                self._level += 1
+        else:
+            self._level += 1
+
+        self._dispatch()
+
+    def penalize(self, retry_after: Optional[float] = None):
+        """429 응답을 받으면 버킷이 가득 찬 것으로 보고 대기"""
+        self._rate_limited += 1
+        self._drain()
+        self._level = float(self._bucket_size)
+        if retry_after:
+            # Retry-After 동안은 아무것도 나가지 않도록 사용량을 늘려 둠
+            self._level += retry_after * self._leak_rate
+
+    def stats(self) -> dict:
+        """현재 상태 (모니터링용)"""
+        self._drain()
+        return {
+            "bucket_size": self._bucket_size,
+            "bucket_level": round(self._level, 2),
+            "in_flight": self._in_flight,
+            "queued": sum(1 for _, _, f in self._waiters if not f.done()),
+            "throttled": self._throttled,
+            "rate_limited": self._rate_limited,
+        }
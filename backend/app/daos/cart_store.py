@@ -0,0 +1,566 @@
+"""
+장바구니 저장소
+
+장바구니는 마지막으로 쓴 뒤 cart_ttl(초)이 지나면 사라집니다. (조회/수정할 때마다 연장)
+- memory: 프로세스 메모리 (TTL + LRU, 개수/크기 상한), 재시작하면 사라짐
+- sqlite: 로컬 파일 (WAL 모드), 재시작해도 유지
+- redis: Redis 프로토콜 서버 (만료는 서버가 처리, 여러 서버 프로세스가 공유)
+
+장바구니는 JSON(변경 횟수 _version 포함)으로 저장하므로 ETag도 재시작/서버 간에 유지됩니다.
+만료된 장바구니는 백그라운드 정리 작업(sweeper)이 주기적으로 지웁니다.
+
+저장은 compare-and-set입니다. 불러올 때의 변경 횟수(expected_version)와 저장된 값이 다르면
+다른 요청이 먼저 저장한 것이므로 CartVersionConflict가 발생하고, 호출하는 쪽에서 다시 불러와 적용합니다.
+"""
+import asyncio
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from urllib.parse import urlparse
+import orjson
+from app.commons.config import Settings, get_settings
+from app.models.cart import Cart
+
+# 메모리 저장소 크기 추정 (JSON 기준 빈 장바구니 약 150바이트, 아이템 하나 약 300바이트)
+CART_BASE_BYTES = 256
+CART_LINE_BYTES = 384
+
+# SQLite는 조회할 때마다 만료 시각을 쓰지 않고 이 시간(초)이 지났을 때만 연장
+SQLITE_TOUCH_INTERVAL = 60.0
+
+
+def dump_cart(cart: Cart) -> bytes:
+    """장바구니 → JSON (변경 횟수를 맨 앞에, Redis 스크립트가 파싱 없이 읽도록)"""
+    return orjson.dumps({"version": cart._version, "cart": cart.model_dump()})
+
+
+def load_cart(data: bytes) -> Cart:
+    """JSON → 장바구니"""
+    payload = orjson.loads(data)
+    cart = Cart.model_validate(payload["cart"])
+    cart._version = payload.get("version", 0)
+    return cart
+
+
+class CartVersionConflict(Exception):
+    """저장된 장바구니가 불러온 뒤 바뀌었음 (다른 요청이 먼저 저장했거나 삭제됨)"""
+
+
+class CartStore(ABC):
+    """장바구니 저장소 인터페이스"""
+
+    name = "base"
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl  # 마지막 사용 후 유지 시간 (초)
+        self._sweeper: Optional[asyncio.Task] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.expired = 0  # TTL이 지나 삭제됨
+        self.evictions = 0  # 용량 상한으로 삭제됨
+        self.conflicts = 0  # 버전이 달라 저장하지 않음
+
+    async def open(self):
+        """연결 열기 (앱 시작 시)"""
+
+    async def close(self):
+        """연결 닫기 (앱 종료 시)"""
+
+    @abstractmethod
+    async def get(self, cart_id: str) -> Optional[Cart]:
+        """장바구니 조회 (있으면 만료 시각 연장)"""
+
+    @abstractmethod
+    async def put(self, cart: Cart, expected_version: Optional[int] = None):
+        """
+        장바구니 저장 (만료 시각 연장)
+
+        expected_version이 있으면 저장된 장바구니의 변경 횟수가 같을 때만 저장하고,
+        다르거나 없어졌으면 CartVersionConflict가 발생합니다. (없으면 그대로 덮어씀)
+        """
+
+    @abstractmethod
+    async def delete(self, cart_id: str):
+        """장바구니 삭제"""
+
+    @abstractmethod
+    async def sweep(self) -> int:
+        """만료된 장바구니 정리 (정리한 수 반환)"""
+
+    @abstractmethod
+    def size(self) -> Optional[int]:
+        """저장된 장바구니 수 (모르면 None)"""
+
+    # ========== 백그라운드 정리 ==========
+
+    async def _sweep_loop(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                removed = await self.sweep()
+                if removed:
+                    print(f"[CART] 만료된 장바구니 {removed}개 정리")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[CART] 장바구니 정리 실패: {e}")
+
+    def start_sweeper(self, interval: float):
+        """백그라운드 정리 시작"""
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep_loop(interval))
+
+    async def stop_sweeper(self):
+        """백그라운드 정리 중지"""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
+
+    def stats(self) -> dict:
+        """저장소 상태 (모니터링용)"""
+        return {
+            "backend": self.name,
+            "carts": self.size(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "conflicts": self.conflicts,
+        }
+
+
+class MemoryCartStore(CartStore):
+    """
+    메모리 저장소 (TTL + LRU)
+
+    장바구니 객체를 그대로 보관하고, 개수/크기 상한을 넘으면 가장 오래 안 쓴 장바구니부터 지웁니다.
+    크기는 아이템 수로 추정합니다. (저장할 때마다 직렬화하지 않도록)
+    """
+
+    name = "memory"
+
+    def __init__(self, ttl: float, max_entries: int = 100_000, max_bytes: int = 64 * 1024 * 1024):
+        super().__init__(ttl)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # 장바구니 ID → (장바구니, 크기, 만료 시각, 저장할 때의 변경 횟수), 오래 안 쓴 순서
+        # (조회하면 같은 객체를 돌려주므로 변경 횟수는 저장할 때 따로 기록)
+        self._entries: "OrderedDict[str, tuple[Cart, int, float, int]]" = OrderedDict()
+        self._bytes = 0
+
+    async def get(self, cart_id: str) -> Optional[Cart]:
+        entry = self._entries.get(cart_id)
+        if entry is None:
+            self.misses += 1
+            return None
+        cart, size, expires_at, version = entry
+        now = time.monotonic()
+        if now >= expires_at:
+            self._remove(cart_id)
+            self.expired += 1
+            self.misses += 1
+            return None
+        self._entries[cart_id] = (cart, size, now + self.ttl, version)
+        self._entries.move_to_end(cart_id)
+        self.hits += 1
+        return cart
+
+    async def put(self, cart: Cart, expected_version: Optional[int] = None):
+        now = time.monotonic()
+        if expected_version is not None:
+            entry = self._entries.get(cart.id)
+            if entry is None or now >= entry[2] or entry[3] != expected_version:
+                self.conflicts += 1
+                raise CartVersionConflict(cart.id)
+        self._remove(cart.id)
+        size = CART_BASE_BYTES + CART_LINE_BYTES * len(cart.items)
+        self._entries[cart.id] = (cart, size, now + self.ttl, cart._version)
+        self._bytes += size
+        self.writes += 1
+        # 방금 저장한 장바구니는 상한을 넘더라도 남김
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    async def delete(self, cart_id: str):
+        self._remove(cart_id)
+
+    def _remove(self, cart_id: str):
+        entry = self._entries.pop(cart_id, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    async def sweep(self) -> int:
+        # 오래 안 쓴 순서 = 만료 시각 순서이므로 앞에서부터 만료된 것만 지움
+        now = time.monotonic()
+        removed = 0
+        while self._entries:
+            cart_id, (_, _, expires_at, _) = next(iter(self._entries.items()))
+            if now < expires_at:
+                break
+            self._remove(cart_id)
+            removed += 1
+        self.expired += removed
+        return removed
+
+    def size(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        stats["bytes"] = self._bytes
+        return stats
+
+
+class SQLiteCartStore(CartStore):
+    """
+    SQLite 저장소 (WAL 모드)
+
+    sqlite3는 동기 API라서 전용 스레드 하나에서 실행합니다. (쓰기/fsync가 이벤트 루프를 막지 않도록)
+    스레드가 하나라 연결도 그 스레드에서만 쓰고, 쿼리는 들어온 순서대로 실행됩니다.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, ttl: float, path: str = "carts.db"):
+        super().__init__(ttl)
+        self.path = path
+        self._db: Optional[sqlite3.Connection] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._size: Optional[int] = None  # 정리할 때마다 다시 셈
+
+    async def _run(self, func, *args):
+        """SQLite 스레드에서 실행"""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def open(self):
+        if self._executor is not None:
+            return
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cart-sqlite")
+        self._size = await self._run(self._open)
+
+    async def close(self):
+        if self._executor is not None:
+            await self._run(self._close)
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def get(self, cart_id: str) -> Optional[Cart]:
+        data = await self._run(self._get, cart_id)
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return load_cart(data)
+
+    async def put(self, cart: Cart, expected_version: Optional[int] = None):
+        if not await self._run(self._put, cart.id, cart._version, dump_cart(cart), expected_version):
+            self.conflicts += 1
+            raise CartVersionConflict(cart.id)
+        self.writes += 1
+
+    async def delete(self, cart_id: str):
+        await self._run(self._delete, cart_id)
+
+    async def sweep(self) -> int:
+        removed, self._size = await self._run(self._sweep)
+        self.expired += removed
+        return removed
+
+    def size(self) -> Optional[int]:
+        return self._size
+
+    # ========== SQLite 스레드에서 실행 ==========
+
+    def _open(self) -> int:
+        self._db = sqlite3.connect(self.path, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS carts ("
+            "id TEXT PRIMARY KEY, data BLOB NOT NULL, expires_at REAL NOT NULL, "
+            "version INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS carts_expires_at ON carts (expires_at)")
+        columns = [row[1] for row in self._db.execute("PRAGMA table_info(carts)")]
+        if "version" not in columns:
+            # version 컬럼이 없던 파일: 저장된 JSON의 변경 횟수로 채움
+            self._db.execute("ALTER TABLE carts ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+            rows = self._db.execute("SELECT id, data FROM carts").fetchall()
+            self._db.executemany(
+                "UPDATE carts SET version = ? WHERE id = ?",
+                [(load_cart(data)._version, cart_id) for cart_id, data in rows],
+            )
+        return self._db.execute("SELECT COUNT(*) FROM carts").fetchone()[0]
+
+    def _close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _get(self, cart_id: str) -> Optional[bytes]:
+        row = self._db.execute(
+            "SELECT data, expires_at FROM carts WHERE id = ?", (cart_id,)
+        ).fetchone()
+        now = time.time()
+        if row is None or now >= row[1]:
+            return None
+        if row[1] - now < self.ttl - SQLITE_TOUCH_INTERVAL:
+            self._db.execute(
+                "UPDATE carts SET expires_at = ? WHERE id = ?", (now + self.ttl, cart_id)
+            )
+        return row[0]
+
+    def _put(self, cart_id: str, version: int, data: bytes, expected_version: Optional[int]) -> bool:
+        now = time.time()
+        if expected_version is None:
+            self._db.execute(
+                "INSERT OR REPLACE INTO carts (id, data, expires_at, version) VALUES (?, ?, ?, ?)",
+                (cart_id, data, now + self.ttl, version),
+            )
+            return True
+        # 한 문장이라 비교와 저장 사이에 다른 쓰기가 끼어들 수 없음
+        return self._db.execute(
+            "UPDATE carts SET data = ?, expires_at = ?, version = ? "
+            "WHERE id = ? AND version = ? AND expires_at > ?",
+            (data, now + self.ttl, version, cart_id, expected_version, now),
+        ).rowcount == 1
+
+    def _delete(self, cart_id: str):
+        self._db.execute("DELETE FROM carts WHERE id = ?", (cart_id,))
+
+    def _sweep(self) -> tuple[int, int]:
+        removed = self._db.execute(
+            "DELETE FROM carts WHERE expires_at <= ?", (time.time(),)
+        ).rowcount
+        return removed, self._db.execute("SELECT COUNT(*) FROM carts").fetchone()[0]
+
+
+# 다시 보내도 결과가 같은 명령 (연결이 끊기면 한 번 재시도)
+# 조건부 저장(EVAL)은 첫 번째가 적용됐는지 알 수 없으므로 재시도하지 않음
+IDEMPOTENT_COMMANDS = {"GETEX", "SET", "DEL", "SCAN"}
+
+# 저장된 변경 횟수가 ARGV[1]과 같을 때만 저장 (1: 저장, 0: 충돌)
+# dump_cart가 변경 횟수를 맨 앞에 쓰므로 보통은 JSON 전체를 파싱하지 않음
+REDIS_CAS_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if not current then return 0 end
+local version = string.match(current, '^{"version":(%d+)')
+if version == nil then version = cjson.decode(current)['version'] or 0 end
+if tonumber(version) ~= tonumber(ARGV[1]) then return 0 end
+redis.call('SET', KEYS[1], ARGV[2], 'PX', ARGV[3])
+return 1
+"""
+
+
+class RedisProtocolError(Exception):
+    """Redis 서버 오류 응답"""
+
+
+class RedisCartStore(CartStore):
+    """
+    Redis 저장소 (RESP 프로토콜 직접 구현, 외부 패키지 없음)
+
+    GETEX / SET PX / EVAL / DEL / SCAN만 사용하므로 (Redis 6.2 이상)
+    Redis 호환 서버(KeyDB, Dragonfly 등)나 테스트용 로컬 서버로도 동작합니다.
+    조회는 GETEX로 읽기와 만료 연장을 한 번에, 조건부 저장은 Lua 스크립트로 서버에서 한 번에 처리합니다.
+    만료는 서버가 처리하고, 정리 작업은 장바구니 수만 다시 셉니다.
+    """
+
+    name = "redis"
+
+    def __init__(self, ttl: float, url: str = "redis://localhost:6379/0", prefix: str = "cart:"):
+        super().__init__(ttl)
+        self.url = url
+        self.prefix = prefix
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        # 커넥션 하나를 공유하므로 요청/응답 순서가 섞이지 않도록
+        self._lock = asyncio.Lock()
+        self._size: Optional[int] = None
+        self.reconnects = 0
+
+    async def open(self):
+        async with self._lock:
+            if self._writer is None:
+                await self._connect()
+
+    async def close(self):
+        async with self._lock:
+            writer = self._writer
+            self._reader = self._writer = None
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+
+    async def _connect(self):
+        """연결 + 인증/DB 선택 (락을 잡은 상태에서 호출)"""
+        parsed = urlparse(self.url)
+        self._reader, self._writer = await asyncio.open_connection(
+            parsed.hostname or "localhost", parsed.port or 6379
+        )
+        if parsed.password:
+            if parsed.username:
+                await self._roundtrip("AUTH", parsed.username, parsed.password)
+            else:
+                await self._roundtrip("AUTH", parsed.password)
+        db = parsed.path.lstrip("/")
+        if db and db != "0":
+            await self._roundtrip("SELECT", db)
+
+    def _reset(self):
+        """
+        연결 버리기 (다음 명령에서 다시 연결)
+
+        응답을 다 읽지 못한 소켓을 계속 쓰면 다음 요청이 이전 요청의 응답을 읽게 되므로
+        연결 오류나 취소가 나면 소켓을 닫고 새로 엽니다.
+        """
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+        self.reconnects += 1
+
+    # ========== RESP ==========
+
+    @staticmethod
+    def _encode(*args) -> bytes:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if not isinstance(arg, bytes):
+                arg = str(arg).encode()
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        return b"".join(parts)
+
+    async def _read_reply(self):
+        line = await self._reader.readline()
+        if not line:
+            raise ConnectionError("Redis 연결이 끊어졌습니다.")
+        kind, rest = line[:1], line[1:-2]
+        if kind == b"+":
+            return rest.decode()
+        if kind == b"-":
+            raise RedisProtocolError(rest.decode())
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            length = int(rest)
+            if length < 0:
+                return None
+            data = await self._reader.readexactly(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            length = int(rest)
+            if length < 0:
+                return None
+            return [await self._read_reply() for _ in range(length)]
+        # 응답 경계를 잃었으므로 연결 오류로 처리 (연결을 다시 엶)
+        raise ConnectionError(f"알 수 없는 Redis 응답: {line!r}")
+
+    async def _roundtrip(self, *args):
+        self._writer.write(self._encode(*args))
+        await self._writer.drain()
+        return await self._read_reply()
+
+    async def _command(self, *args):
+        """명령 실행 (연결이 없거나 끊어졌으면 다시 연결, 멱등 명령은 한 번 재시도)"""
+        retry = args[0] in IDEMPOTENT_COMMANDS
+        async with self._lock:
+            while True:
+                try:
+                    if self._writer is None:
+                        await self._connect()
+                    return await self._roundtrip(*args)
+                except (OSError, asyncio.IncompleteReadError) as e:
+                    self._reset()
+                    if not retry:
+                        raise
+                    retry = False
+                    print(f"[CART] Redis 연결 끊김, 다시 연결: {e!r}")
+                except asyncio.CancelledError:
+                    # 보낸 명령의 응답이 소켓에 남아 있을 수 있음
+                    self._reset()
+                    raise
+
+    # ========== 저장소 ==========
+
+    def _key(self, cart_id: str) -> str:
+        return f"{self.prefix}{cart_id}"
+
+    def _ttl_ms(self) -> int:
+        return int(self.ttl * 1000)
+
+    async def get(self, cart_id: str) -> Optional[Cart]:
+        data = await self._command("GETEX", self._key(cart_id), "PX", self._ttl_ms())
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return load_cart(data)
+
+    async def put(self, cart: Cart, expected_version: Optional[int] = None):
+        if expected_version is None:
+            await self._command("SET", self._key(cart.id), dump_cart(cart), "PX", self._ttl_ms())
+        else:
+            stored = await self._command(
+                "EVAL", REDIS_CAS_SCRIPT, 1, self._key(cart.id),
+                expected_version, dump_cart(cart), self._ttl_ms(),
+            )
+            if not stored:
+                self.conflicts += 1
+                raise CartVersionConflict(cart.id)
+        self.writes += 1
+
+    async def delete(self, cart_id: str):
+        await self._command("DEL", self._key(cart_id))
+
+    async def sweep(self) -> int:
+        # 만료는 서버가 처리하므로 장바구니 수만 다시 셈
+        cursor, count = b"0", 0
+        while True:
+            cursor, keys = await self._command("SCAN", cursor, "MATCH", f"{self.prefix}*", "COUNT", 1000)
+            count += len(keys)
+            if cursor in (b"0", "0"):
+                break
+        self._size = count
+        return 0
+
+    def size(self) -> Optional[int]:
+        return self._size
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        stats["reconnects"] = self.reconnects
+        return stats
+
+
+def create_cart_store(settings: Optional[Settings] = None) -> CartStore:
+    """설정(cart_store)에 맞는 저장소 생성"""
+    settings = settings or get_settings()
+    backend = settings.cart_store.lower()
+    if backend == "memory":
+        return MemoryCartStore(
+            settings.cart_ttl,
+            max_entries=settings.cart_store_max_entries,
+            max_bytes=settings.cart_store_max_bytes,
+        )
+    if backend == "sqlite":
+        return SQLiteCartStore(settings.cart_ttl, path=settings.cart_sqlite_path)
+    if backend == "redis":
+        return RedisCartStore(settings.cart_ttl, url=settings.cart_redis_url)
+    raise ValueError(f"지원하지 않는 장바구니 저장소: {settings.cart_store}")
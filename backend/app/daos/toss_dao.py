@@ -8,7 +8,9 @@
 """
 import httpx
 import base64
+from typing import Optional
 from app.commons.config import get_settings
+from app.commons.http_client import create_async_client
 from app.commons.exceptions import TossPaymentException
 
 
@@ -19,8 +21,18 @@ class TossDAO:
 
     def __init__(self):
         self.settings = get_settings()
-
-    def _get_headers(self) -> dict:
+        # 인증 헤더는 시크릿 키가 바뀌지 않으므로 한 번만 계산
+        self._headers = self._build_headers()
+        # 토스 전용 HTTP 클라이언트 (앱 lifespan에서 열고 닫음)
+        self._client: Optional[httpx.AsyncClient] = None
+
+        # 작업별 타임아웃 (결제 승인은 조회보다 오래 기다림)
+        connect = self.settings.toss_connect_timeout
+        self._confirm_timeout = httpx.Timeout(self.settings.toss_confirm_timeout, connect=connect)
+        self._lookup_timeout = httpx.Timeout(self.settings.toss_lookup_timeout, connect=connect)
+        self._cancel_timeout = httpx.Timeout(self.settings.toss_cancel_timeout, connect=connect)
+
+    def _build_headers(self) -> dict:
         """API 요청 헤더 (Basic Auth)"""
         # 토스는 Secret Key를 Base64로 인코딩해서 사용
         secret_key = self.settings.toss_secret_key
@@ -31,6 +43,40 @@ class TossDAO:
             "Content-Type": "application/json",
         }
 
+    # ========== HTTP 클라이언트 ==========
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """토스용 커넥션 풀 클라이언트 생성"""
+        return create_async_client(
+            timeout=self._lookup_timeout,
+            base_url=self.BASE_URL,
+            headers=self._headers,
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        공유 HTTP 클라이언트
+
+        lifespan 밖(스크립트 등)에서 호출되면 처음 사용할 때 생성합니다.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+        return self._client
+
+    async def open(self):
+        """클라이언트 열기 (앱 시작 시)"""
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+
+    async def close(self):
+        """클라이언트 닫기 (앱 종료 시)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    # ========== 결제 관련 ==========
+
     async def confirm_payment(
         self,
         payment_key: str,
@@ -42,37 +88,35 @@ class TossDAO:
 
         프론트엔드에서 결제가 완료되면 이 API를 호출해서 최종 승인합니다.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.BASE_URL}/payments/confirm",
-                headers=self._get_headers(),
-                json={
-                    "paymentKey": payment_key,
-                    "orderId": order_id,
-                    "amount": amount,
-                },
+        response = await self.client.post(
+            "/payments/confirm",
+            json={
+                "paymentKey": payment_key,
+                "orderId": order_id,
+                "amount": amount,
+            },
+            timeout=self._confirm_timeout,
+        )
+
+        if response.status_code != 200:
+            error_data = response.json()
+            raise TossPaymentException(
+                f"결제 승인 실패: {error_data.get('message', '알 수 없는 오류')}"
             )
 
-            if response.status_code != 200:
-                error_data = response.json()
-                raise TossPaymentException(
-                    f"결제 승인 실패: {error_data.get('message', '알 수 없는 오류')}"
-                )
-
-            return response.json()
+        return response.json()
 
     async def get_payment(self, payment_key: str) -> dict:
         """결제 정보 조회"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.BASE_URL}/payments/{payment_key}",
-                headers=self._get_headers(),
-            )
+        response = await self.client.get(
+            f"/payments/{payment_key}",
+            timeout=self._lookup_timeout,
+        )
 
-            if response.status_code != 200:
-                raise TossPaymentException("결제 정보 조회 실패")
+        if response.status_code != 200:
+            raise TossPaymentException("결제 정보 조회 실패")
 
-            return response.json()
+        return response.json()
 
     async def cancel_payment(
         self,
@@ -89,20 +133,19 @@ class TossDAO:
         if cancel_amount:
             data["cancelAmount"] = cancel_amount
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.BASE_URL}/payments/{payment_key}/cancel",
-                headers=self._get_headers(),
-                json=data,
-            )
+        response = await self.client.post(
+            f"/payments/{payment_key}/cancel",
+            json=data,
+            timeout=self._cancel_timeout,
+        )
 
-            if response.status_code != 200:
-                error_data = response.json()
-                raise TossPaymentException(
-                    f"결제 취소 실패: {error_data.get('message', '알 수 없는 오류')}"
-                )
+        if response.status_code != 200:
+            error_data = response.json()
+            raise TossPaymentException(
+                f"결제 취소 실패: {error_data.get('message', '알 수 없는 오류')}"
+            )
 
-            return response.json()
+        return response.json()
 
 
 # 싱글톤 인스턴스
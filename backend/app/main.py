@@ -4,9 +4,15 @@ FastAPI 앱 시작점
 이 파일이 서버의 진입점입니다.
 uvicorn app.main:app --reload 로 실행합니다.
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from app.commons.compression import CompressionMiddleware
 from app.commons.config import get_settings
+from app.daos.cafe24_dao import cafe24_dao
+from app.daos.toss_dao import toss_dao
+from app.services.product_service import product_service
+from app.services.cart_service import cart_service
 from app.controllers import (
     auth_router,
     product_router,
@@ -18,6 +24,21 @@ from app.controllers import (
 # 설정 로드
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작/종료 시 외부 API 커넥션 풀 열고 닫기"""
+    await cafe24_dao.open()
+    await toss_dao.open()
+    await cart_service.start()
+    await product_service.mirror.start()
+    yield
+    await product_service.mirror.stop()
+    await cart_service.stop()
+    await toss_dao.close()
+    await cafe24_dao.close()
+
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="카페24 쇼핑몰 API",
@@ -50,6 +71,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",  # Swagger UI
     redoc_url="/redoc",  # ReDoc
+    lifespan=lifespan,
 )
 
 # CORS 설정 (프론트엔드 연동용)
@@ -65,6 +87,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 (gzip / brotli, 미리 압축된 캐시 본문은 그대로 통과)
+app.add_middleware(CompressionMiddleware)
+
 # 라우터 등록
 app.include_router(auth_router, prefix="/api")
 app.include_router(product_router, prefix="/api")
@@ -90,6 +115,14 @@ async def health_check():
         "status": "healthy",
         "version": "1.0.0",
         "debug": settings.debug,
+        "cafe24_call_limit": cafe24_dao.limiter.stats(),
+        "product_cache": product_service.cache.stats(),
+        "product_body_cache": product_service.bodies.stats(),
+        "catalog_mirror": product_service.mirror.stats(),
+        "product_prefetch": product_service.prefetcher.stats(),
+        "search_index": product_service.search_index.stats(),
+        "cart": cart_service.stats(),
+        "cart_store": cart_service.store.stats(),
     }
 
 
@@ -1,8 +1,9 @@
 """
 장바구니 관련 모델 정의
 """
-from typing import Optional
-from pydantic import BaseModel
+from typing import Any, Literal, Optional, ValuesView
+from pydantic import BaseModel, Field, PrivateAttr, computed_field, field_serializer, model_validator
+from app.commons.utils import price_to_int
 from .product import ProductImage, ProductPrice
 
 
@@ -22,10 +23,154 @@ class Cart(BaseModel):
     """장바구니"""
 
     id: str  # 장바구니 ID (세션 기반)
-    items: list[CartItem] = []
+    # 생성/저장소에서 불러올 때 받는 아이템 (이후에는 색인이 기준이고 응답의 items는 색인에서 만듦)
+    initial_items: list[CartItem] = Field(default=[], validation_alias="items", exclude=True, repr=False)
     total_quantity: int = 0
     total_price: ProductPrice = ProductPrice(amount="0", currency_code="KRW")
 
+    # 변경될 때마다 증가 (ETag용, 응답에는 포함 안 됨)
+    _version: int = PrivateAttr(default=0)
+
+    # 아이템 색인 + 총 금액 (응답에는 포함 안 됨)
+    _index: "CartIndex" = PrivateAttr(default_factory=lambda: CartIndex())
+
+    def model_post_init(self, __context: Any):
+        """items로 색인과 총계 만들기 (생성/저장소에서 불러올 때 한 번)"""
+        index = CartIndex()
+        quantity = 0
+        for item in self.initial_items:
+            index.add(item)
+            quantity += item.quantity
+        # 색인과 따로 바뀌지 않도록 입력 목록은 비움
+        self.initial_items = []
+        self._index = index
+        self.total_quantity = quantity
+        self._update_total_price(index)
+
+    @computed_field(return_type=list[CartItem])
+    @property
+    def items(self) -> ValuesView[CartItem]:
+        """담긴 아이템 (색인을 그대로 보여주는 읽기 전용 뷰, 변경은 add_line/remove_line 등으로)"""
+        return self._index.lines.values()
+
+    @field_serializer("items", mode="wrap")
+    def _serialize_items(self, items: ValuesView[CartItem], handler):
+        return handler(list(items))
+
+    # ========== 아이템 조회 ==========
+
+    def get_line(self, item_id: str) -> Optional[CartItem]:
+        """아이템 ID로 조회"""
+        return self._index.lines.get(item_id)
+
+    def find_line(self, product_id: str, variant_id: Optional[str]) -> Optional[CartItem]:
+        """같은 상품/옵션으로 이미 담긴 아이템"""
+        index = self._index
+        item_id = index.by_product.get((product_id, variant_id))
+        return index.lines.get(item_id) if item_id is not None else None
+
+    # ========== 아이템 변경 (총계는 바뀐 만큼만 반영) ==========
+
+    def add_line(self, item: CartItem):
+        """새 아이템 추가"""
+        index = self._index
+        index.add(item)
+        self.total_quantity += item.quantity
+        self._update_total_price(index)
+
+    def set_quantity(self, item_id: str, quantity: int) -> bool:
+        """아이템 수량 변경 (없는 아이템이면 False)"""
+        index = self._index
+        item = index.lines.get(item_id)
+        if item is None:
+            return False
+        delta = quantity - item.quantity
+        item.quantity = quantity
+        index.amount += index.unit_prices[item_id] * delta
+        self.total_quantity += delta
+        self._update_total_price(index)
+        return True
+
+    def set_price(self, item_id: str, price: ProductPrice) -> bool:
+        """아이템 단가 변경 (없는 아이템이면 False)"""
+        index = self._index
+        item = index.lines.get(item_id)
+        if item is None:
+            return False
+        unit_price = price_to_int(price.amount)
+        index.amount += (unit_price - index.unit_prices[item_id]) * item.quantity
+        index.unit_prices[item_id] = unit_price
+        item.price = price
+        self._update_total_price(index)
+        return True
+
+    def remove_line(self, item_id: str) -> bool:
+        """아이템 삭제 (없는 아이템이면 False)"""
+        index = self._index
+        item = index.remove(item_id)
+        if item is None:
+            return False
+        self.total_quantity -= item.quantity
+        self._update_total_price(index)
+        return True
+
+    def clear_lines(self):
+        """모든 아이템 삭제"""
+        self._index = CartIndex()
+        self.total_quantity = 0
+        self._update_total_price(self._index)
+
+    def _update_total_price(self, index: "CartIndex"):
+        self.total_price = ProductPrice(amount=str(index.amount), currency_code="KRW")
+
+
+class CartIndex:
+    """
+    장바구니 아이템 색인 (아이템 변경마다 O(1))
+
+    pydantic private 속성은 접근할 때마다 비용이 있어서 색인을 일반 객체 하나에 모아 둡니다.
+    """
+
+    __slots__ = ("lines", "by_product", "unit_prices", "amount")
+
+    def __init__(self):
+        self.lines: dict[str, CartItem] = {}  # 아이템 ID → 아이템 (담은 순서, Cart.items가 이 값을 보여줌)
+        self.by_product: dict[tuple, str] = {}  # (상품 ID, 옵션 ID) → 아이템 ID
+        self.unit_prices: dict[str, int] = {}  # 아이템 ID → 단가 (원 단위 정수, 담을 때 한 번만 변환)
+        self.amount = 0  # 총 금액 (원 단위 정수)
+
+    def add(self, item: CartItem):
+        unit_price = price_to_int(item.price.amount)
+        self.lines[item.id] = item
+        self.by_product[(item.product_id, item.variant_id)] = item.id
+        self.unit_prices[item.id] = unit_price
+        self.amount += unit_price * item.quantity
+
+    def remove(self, item_id: str) -> Optional[CartItem]:
+        item = self.lines.pop(item_id, None)
+        if item is not None:
+            del self.by_product[(item.product_id, item.variant_id)]
+            self.amount -= self.unit_prices.pop(item_id) * item.quantity
+        return item
+
+
+class CartChange(BaseModel):
+    """결제 전 확인에서 바뀐 장바구니 아이템"""
+
+    item_id: str
+    product_id: str
+    title: str
+    reason: str  # price_changed(가격 변경) / sold_out(품절, 삭제됨) / not_found(판매 종료, 삭제됨)
+    old_price: Optional[ProductPrice] = None
+    new_price: Optional[ProductPrice] = None
+
+
+class CartValidation(BaseModel):
+    """결제 전 확인 결과"""
+
+    cart: Cart
+    changes: list[CartChange] = []
+
 
 class AddToCartRequest(BaseModel):
     """장바구니 추가 요청"""
@@ -39,3 +184,39 @@ class UpdateCartItemRequest(BaseModel):
     """장바구니 아이템 수정 요청"""
 
     quantity: int
+
+
+# 일괄 변경 한 번에 받을 최대 작업 수 (카페24 상품 일괄 조회 단위와 같음)
+MAX_CART_OPERATIONS = 100
+
+
+class CartOperation(BaseModel):
+    """장바구니 일괄 변경 작업"""
+
+    op: Literal["add", "update", "remove"]
+    product_id: Optional[str] = None  # add
+    variant_id: Optional[str] = None  # add
+    item_id: Optional[str] = None  # update / remove
+    quantity: Optional[int] = None  # add: 추가할 수량 (기본 1), update: 새 수량 (필수, 0이면 삭제)
+
+    @model_validator(mode="after")
+    def _check_target(self) -> "CartOperation":
+        if self.op == "add":
+            if not self.product_id:
+                raise ValueError("add 작업에는 product_id가 필요합니다.")
+            if self.quantity is None:
+                self.quantity = 1
+            if self.quantity < 1:
+                raise ValueError("add 작업의 quantity는 1 이상이어야 합니다.")
+            return self
+        if not self.item_id:
+            raise ValueError(f"{self.op} 작업에는 item_id가 필요합니다.")
+        if self.op == "update" and self.quantity is None:
+            raise ValueError("update 작업에는 quantity가 필요합니다.")
+        return self
+
+
+class BatchCartRequest(BaseModel):
+    """장바구니 일괄 변경 요청 (전부 적용되거나 하나도 적용되지 않음)"""
+
+    operations: list[CartOperation] = Field(..., min_length=1, max_length=MAX_CART_OPERATIONS)
@@ -41,6 +41,17 @@ class Order(BaseModel):
     updated_at: str
 
 
+class OrderListResponse(BaseModel):
+    """주문 목록 응답"""
+
+    orders: list[Order]
+    total: int
+    page: int
+    limit: int
+    has_next: bool
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
+
+
 class CreateOrderRequest(BaseModel):
     """주문 생성 요청"""
 
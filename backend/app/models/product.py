@@ -2,7 +2,7 @@
 상품 관련 모델 정의
 """
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ProductImage(BaseModel):
@@ -45,6 +45,36 @@ class Product(BaseModel):
     category_no: Optional[int] = None
 
 
+class ProductFilter(BaseModel):
+    """상품 목록 필터 (캐시 키로 쓰기 위해 변경 불가)"""
+
+    model_config = ConfigDict(frozen=True)
+
+    min_price: Optional[int] = None
+    max_price: Optional[int] = None
+    tags: tuple[str, ...] = ()  # 하나라도 있으면 포함
+    available: Optional[bool] = None
+
+    @property
+    def is_empty(self) -> bool:
+        return (
+            self.min_price is None
+            and self.max_price is None
+            and not self.tags
+            and self.available is None
+        )
+
+
+class ProductFacets(BaseModel):
+    """필터별 상품 개수 (각 항목은 자기 조건만 빼고 셈)"""
+
+    tags: dict[str, int] = {}
+    categories: dict[str, int] = {}  # 카테고리 번호 → 개수
+    available: dict[str, int] = {}  # "true" / "false" → 개수
+    min_price: Optional[int] = None
+    max_price: Optional[int] = None
+
+
 class ProductListResponse(BaseModel):
     """상품 목록 응답"""
 
@@ -53,6 +83,8 @@ class ProductListResponse(BaseModel):
     page: int
     limit: int
     has_next: bool
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
+    facets: Optional[ProductFacets] = None  # 필터 조회 시에만
 
 
 class Category(BaseModel):
@@ -62,3 +94,4 @@ class Category(BaseModel):
     name: str
     parent_id: Optional[str] = None
     path: str = ""  # 전체 경로 (예: "의류/상의/티셔츠")
+    depth: int = 1  # 최상위 = 1
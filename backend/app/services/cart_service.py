@@ -2,129 +2,312 @@
 장바구니 서비스
 
 세션 기반 장바구니를 관리합니다.
-(카페24에 장바구니가 없으므로 자체 관리)
+(카페24에 장바구니가 없으므로 자체 관리, 저장소는 cart_store 설정으로 선택)
 """
-from typing import Optional
-from app.models.cart import Cart, CartItem, AddToCartRequest
-from app.models.product import ProductPrice, ProductImage
+from typing import Callable, Optional
+from app.daos.cart_store import CartStore, CartVersionConflict, create_cart_store
+from app.commons.config import get_settings
+from app.commons.response import SerializedBody, serialize_body, success_response
+from fastapi import HTTPException
+from app.models.cart import (
+    Cart,
+    CartChange,
+    CartItem,
+    CartOperation,
+    CartValidation,
+    AddToCartRequest,
+)
+from app.models.product import Product, ProductPrice, ProductImage
 from app.services.product_service import product_service
-from app.commons.utils import generate_uuid
-from app.commons.exceptions import CartNotFoundException, ProductNotFoundException
+from app.commons.utils import generate_uuid, price_to_int
+from app.commons.exceptions import (
+    CartConflictException,
+    CartItemNotFoundException,
+    CartNotFoundException,
+    OutOfStockException,
+    ProductNotFoundException,
+)
+
+# 저장 충돌(다른 요청이 먼저 저장) 시 다시 불러와 적용하는 최대 횟수
+CART_WRITE_RETRIES = 3
 
 
 class CartService:
     """장바구니 관련 비즈니스 로직"""
 
-    def __init__(self):
-        # 메모리 기반 장바구니 저장소 (실제로는 Redis 등 사용 권장)
-        self._carts: dict[str, Cart] = {}
-
-    def _calculate_totals(self, cart: Cart) -> Cart:
-        """장바구니 총계 계산"""
-        total_quantity = sum(item.quantity for item in cart.items)
-        total_amount = sum(
-            int(item.price.amount) * item.quantity for item in cart.items
-        )
-
-        cart.total_quantity = total_quantity
-        cart.total_price = ProductPrice(
-            amount=str(total_amount),
-            currency_code="KRW",
-        )
-        return cart
+    def __init__(self, store: Optional[CartStore] = None):
+        self.settings = get_settings()
+        # 장바구니 저장소 (memory / sqlite / redis, 마지막 사용 후 cart_ttl이 지나면 만료)
+        self.store = store or create_cart_store(self.settings)
+        # 장바구니가 없는 방문자용 응답 (모든 요청이 같은 본문을 공유, 변경하지 않음)
+        self.empty_body: SerializedBody = serialize_body(success_response(data=Cart(id="").model_dump()))
+
+        self.created = 0  # 실제로 만든 장바구니 수 (첫 변경 시)
+        self.avoided = 0  # 장바구니 없이 빈 응답으로 처리한 조회 수 (만들지 않은 장바구니)
+
+    async def start(self):
+        """저장소 연결 + 만료 장바구니 정리 시작 (앱 시작 시)"""
+        await self.store.open()
+        self.store.start_sweeper(self.settings.cart_sweep_interval)
+
+    async def stop(self):
+        """정리 중지 + 저장소 연결 닫기 (앱 종료 시)"""
+        await self.store.stop_sweeper()
+        await self.store.close()
 
-    def create_cart(self) -> Cart:
-        """새 장바구니 생성"""
-        cart_id = generate_uuid()
-        cart = Cart(id=cart_id)
-        self._carts[cart_id] = cart
+    @staticmethod
+    def _touch(cart: Cart) -> Cart:
+        """장바구니 변경 표시 (총계는 Cart가 아이템 변경마다 바뀐 만큼만 반영)"""
+        cart._version += 1
         return cart
 
-    def get_cart(self, cart_id: str) -> Optional[Cart]:
-        """장바구니 조회"""
-        return self._carts.get(cart_id)
+    def get_etag(self, cart: Cart) -> str:
+        """장바구니 ETag (장바구니 ID + 변경 횟수)"""
+        return f'"{cart.id}-{cart._version}"'
 
-    def get_or_create_cart(self, cart_id: Optional[str] = None) -> Cart:
-        """장바구니 조회 또는 생성"""
-        if cart_id and cart_id in self._carts:
-            return self._carts[cart_id]
-        return self.create_cart()
+    def empty_cart_body(self) -> SerializedBody:
+        """장바구니가 없을 때 응답 본문 (장바구니/쿠키를 만들지 않음)"""
+        self.avoided += 1
+        return self.empty_body
 
-    async def add_item(self, cart_id: str, request: AddToCartRequest) -> Cart:
-        """장바구니에 상품 추가"""
-        cart = self.get_cart(cart_id)
-        if not cart:
-            raise CartNotFoundException()
+    def _new_cart(self) -> Cart:
+        """새 장바구니 (변경이 성공해서 저장된 뒤에 생성 수에 반영)"""
+        return Cart(id=generate_uuid())
+
+    async def get_cart(self, cart_id: Optional[str]) -> Optional[Cart]:
+        """장바구니 조회 (없거나 만료되면 None)"""
+        if not cart_id:
+            return None
+        return await self.store.get(cart_id)
+
+    async def _mutate(
+        self,
+        cart_id: Optional[str],
+        apply: Callable[[Cart], Optional[Cart]],
+        create: bool = False,
+    ) -> Cart:
+        """
+        장바구니 불러오기 → 변경 → 저장 (compare-and-set)
+
+        apply는 불러온 장바구니를 바꿔서 저장할 장바구니를 돌려줍니다. (None이면 저장하지 않음)
+        불러온 뒤 다른 요청이 먼저 저장했으면 다시 불러와서 apply를 다시 실행하므로
+        apply는 await 없이 장바구니만 바꿔야 합니다.
+        create가 True면 장바구니가 없을 때 새로 만들고, 저장에 성공해야 생성 수에 반영됩니다.
+        """
+        for _ in range(CART_WRITE_RETRIES):
+            stored = await self.get_cart(cart_id)
+            if stored is None and not create:
+                raise CartNotFoundException()
+            cart = stored or self._new_cart()
+            # apply가 불러온 장바구니를 직접 바꾸므로 변경 전에 기록
+            expected_version = stored._version if stored else None
 
-        # 상품 정보 조회
+            updated = apply(cart)
+            if updated is None:
+                return cart
+            self._touch(updated)
+            try:
+                # 새 장바구니는 ID가 새로 만든 것이라 충돌할 일이 없음
+                await self.store.put(updated, expected_version)
+            except CartVersionConflict:
+                print(f"[CART] 동시 변경으로 다시 적용: {cart.id}")
+                continue
+            if stored is None:
+                self.created += 1
+            return updated
+
+        print(f"[CART] 동시 변경이 계속되어 저장 실패: {cart_id}")
+        raise CartConflictException()
+
+    @staticmethod
+    def _line_price(product: Product, variant_id: Optional[str]) -> tuple[Optional[ProductPrice], bool]:
+        """상품/옵션의 (가격, 구매 가능 여부), 옵션이 없으면 가격 None"""
+        if variant_id is None:
+            return product.price, product.available
+        for variant in product.variants:
+            if variant.id == variant_id:
+                return variant.price, product.available and variant.available
+        return None, False
+
+    async def add_item(self, cart_id: Optional[str], request: AddToCartRequest) -> Cart:
+        """
+        장바구니에 상품 추가 (장바구니가 없으면 이때 생성)
+
+        상품 정보는 미러/캐시의 스냅샷을 사용합니다. (cart_snapshot_max_age 이내)
+        가격/재고는 결제 전 확인(revalidate)에서 카페24 기준으로 다시 맞춥니다.
+        """
+        # 상품 정보 조회 (스냅샷)
         try:
-            product = await product_service.get_product(request.product_id)
+            product = await product_service.get_product_snapshot(request.product_id)
         except Exception:
             raise ProductNotFoundException()
 
-        # 이미 담긴 상품인지 확인
-        existing_item = None
-        for item in cart.items:
-            if item.product_id == request.product_id and item.variant_id == request.variant_id:
-                existing_item = item
-                break
+        def apply(cart: Cart) -> Cart:
+            # 담기에 실패하면 새 장바구니는 저장되지 않음
+            self._add_line(cart, product, request.variant_id, request.quantity)
+            return cart
+
+        return await self._mutate(cart_id, apply, create=True)
+
+    def _add_line(self, cart: Cart, product: Product, variant_id: Optional[str], quantity: int):
+        """상품 담기 (이미 담긴 상품/옵션이면 수량 증가)"""
+        price, available = self._line_price(product, variant_id)
+        if price is None:
+            raise ProductNotFoundException("상품 옵션을 찾을 수 없습니다.")
+        if not available:
+            raise OutOfStockException()
+
+        # 이미 담긴 상품인지 확인 (상품/옵션 색인)
+        existing_item = cart.find_line(product.id, variant_id)
 
         if existing_item:
             # 수량 증가
-            existing_item.quantity += request.quantity
+            cart.set_quantity(existing_item.id, existing_item.quantity + quantity)
         else:
             # 새 아이템 추가
             new_item = CartItem(
                 id=generate_uuid(),
-                product_id=request.product_id,
-                variant_id=request.variant_id,
+                product_id=product.id,
+                variant_id=variant_id,
                 title=product.title,
-                quantity=request.quantity,
-                price=product.price,
+                quantity=quantity,
+                price=price,
                 image=product.featured_image,
             )
-            cart.items.append(new_item)
+            cart.add_line(new_item)
 
-        # 총계 재계산
-        self._calculate_totals(cart)
-        return cart
+    async def apply_operations(self, cart_id: Optional[str], operations: list[CartOperation]) -> Cart:
+        """
+        장바구니 일괄 변경 (재주문, 코디 한 번에 담기, 로그인 후 장바구니 합치기)
 
-    def update_item(self, cart_id: str, item_id: str, quantity: int) -> Cart:
-        """장바구니 아이템 수량 변경"""
-        cart = self.get_cart(cart_id)
+        장바구니가 없으면 새로 만들고, 전부 적용된 경우에만 저장합니다.
+
+        - 담을 상품 정보는 한 번에 조회 (미러/캐시에 없는 것만 카페24에 묶어서 요청)
+        - 복사본에 순서대로 적용하고, 하나라도 실패하면 아무것도 저장하지 않음
+        - 저장은 마지막에 한 번 (변경 횟수도 한 번만 증가)
+        """
+        product_ids = [operation.product_id for operation in operations if operation.op == "add"]
+        products = await product_service.get_product_snapshots(product_ids) if product_ids else {}
+
+        def apply(cart: Cart) -> Cart:
+            working = Cart.model_validate(cart.model_dump())
+            working._version = cart._version
+            for position, operation in enumerate(operations, start=1):
+                try:
+                    self._apply_operation(working, operation, products)
+                except HTTPException as e:
+                    e.detail = f"{position}번째 작업: {e.detail}"
+                    raise
+            return working
+
+        # 상품 조회 후에 장바구니를 불러오고, 그 사이 다른 변경이 저장되면 다시 적용
+        return await self._mutate(cart_id, apply, create=True)
+
+    def _apply_operation(self, cart: Cart, operation: CartOperation, products: dict[str, Product]):
+        if operation.op == "add":
+            product = products.get(operation.product_id)
+            if product is None:
+                raise ProductNotFoundException(f"상품 ID {operation.product_id}를 찾을 수 없습니다.")
+            self._add_line(cart, product, operation.variant_id, operation.quantity)
+        elif operation.op == "update" and operation.quantity > 0:
+            if not cart.set_quantity(operation.item_id, operation.quantity):
+                raise CartItemNotFoundException()
+        elif not cart.remove_line(operation.item_id):
+            raise CartItemNotFoundException()
+
+    async def revalidate(self, cart_id: str) -> CartValidation:
+        """
+        결제 전 장바구니 확인
+
+        담긴 상품을 카페24에서 한 번에 다시 조회해서
+        - 가격이 바뀐 아이템은 새 가격으로 바꾸고
+        - 품절/판매 종료된 아이템은 삭제합니다.
+        바뀐 내용이 있으면 결제 금액이 달라지므로 사용자에게 다시 확인받아야 합니다.
+        """
+        cart = await self.get_cart(cart_id)
         if not cart:
             raise CartNotFoundException()
+        if not cart.items:
+            return CartValidation(cart=cart)
 
-        for item in cart.items:
-            if item.id == item_id:
-                if quantity <= 0:
-                    cart.items.remove(item)
-                else:
-                    item.quantity = quantity
-                break
+        product_ids = {item.product_id for item in cart.items}
+        products = await product_service.get_products_fresh(list(product_ids))
 
-        self._calculate_totals(cart)
-        return cart
+        changes: list[CartChange] = []
+
+        def apply(cart: Cart) -> Optional[Cart]:
+            changes.clear()
+            updated = False
+            for item in list(cart.items):
+                # 조회하는 사이 새로 담긴 상품은 다음 확인 때 맞춤
+                if item.product_id not in product_ids:
+                    continue
+                product = products.get(item.product_id)
+                price, available = self._line_price(product, item.variant_id) if product else (None, False)
+                if price is None or not available:
+                    cart.remove_line(item.id)
+                    changes.append(CartChange(
+                        item_id=item.id,
+                        product_id=item.product_id,
+                        title=item.title,
+                        reason="sold_out" if product else "not_found",
+                        old_price=item.price,
+                    ))
+                    continue
+
+                if price_to_int(price.amount) != price_to_int(item.price.amount):
+                    changes.append(CartChange(
+                        item_id=item.id,
+                        product_id=item.product_id,
+                        title=product.title,
+                        reason="price_changed",
+                        old_price=item.price,
+                        new_price=price,
+                    ))
+                    cart.set_price(item.id, price)
+                # 상품명/이미지는 알리지 않고 최신으로 맞춤
+                if item.title != product.title or item.image != product.featured_image:
+                    item.title = product.title
+                    item.image = product.featured_image
+                    updated = True
+            return cart if changes or updated else None
 
-    def remove_item(self, cart_id: str, item_id: str) -> Cart:
+        cart = await self._mutate(cart_id, apply)
+        return CartValidation(cart=cart, changes=changes)
+
+    async def update_item(self, cart_id: str, item_id: str, quantity: int) -> Cart:
+        """장바구니 아이템 수량 변경"""
+        def apply(cart: Cart) -> Cart:
+            if quantity <= 0:
+                cart.remove_line(item_id)
+            else:
+                cart.set_quantity(item_id, quantity)
+            return cart
+
+        return await self._mutate(cart_id, apply)
+
+    async def remove_item(self, cart_id: str, item_id: str) -> Cart:
         """장바구니에서 상품 삭제"""
-        cart = self.get_cart(cart_id)
-        if not cart:
-            raise CartNotFoundException()
+        def apply(cart: Cart) -> Cart:
+            cart.remove_line(item_id)
+            return cart
 
-        cart.items = [item for item in cart.items if item.id != item_id]
-        self._calculate_totals(cart)
-        return cart
+        return await self._mutate(cart_id, apply)
 
-    def clear_cart(self, cart_id: str) -> Cart:
+    async def clear_cart(self, cart_id: str) -> Cart:
         """장바구니 비우기"""
-        cart = self.get_cart(cart_id)
-        if not cart:
-            raise CartNotFoundException()
+        def apply(cart: Cart) -> Cart:
+            cart.clear_lines()
+            return cart
 
-        cart.items = []
-        self._calculate_totals(cart)
-        return cart
+        return await self._mutate(cart_id, apply)
+
+    def stats(self) -> dict:
+        """장바구니 생성 통계 (모니터링용)"""
+        return {
+            "created": self.created,
+            "avoided_allocations": self.avoided,
+        }
 
 
 # 싱글톤 인스턴스
@@ -0,0 +1,253 @@
+"""
+상품 카탈로그 미러
+
+카페24의 전체 상품을 주기적으로 받아와서 변환된 상태로 메모리에 보관합니다.
+상품이 수천 개 수준이면 페이지마다 카페24를 호출하는 것보다 훨씬 빠릅니다.
+- 상품 ID → 상품 (응답용 dict + 필터/검색/장바구니용 Product 모델)
+- 카테고리 번호 → 상품 ID 목록 (최근 등록순)
+- 가격/판매 여부/태그/카테고리 필터용 컬럼 인덱스 (FacetIndex)
+- 정렬 순서별(최신순/가격순/이름순) 인덱스 (갱신할 때 미리 정렬해 둠)
+
+미러가 아직 준비되지 않았거나(cold) 없는 상품 ID면 호출하는 쪽에서 카페24를 직접 조회합니다.
+"""
+import asyncio
+import time
+from datetime import datetime
+from contextlib import aclosing
+from typing import Callable, Optional
+from app.commons.config import get_settings
+from app.commons.utils import price_to_int
+from app.models.product import Product
+from app.services.facet_index import FacetIndex
+
+# 정렬 순서 (기본 순서는 상품번호 내림차순, 값이 같으면 상품번호 내림차순)
+SORT_ORDERS = ("newest", "price_asc", "price_desc", "name")
+
+
+def product_no(product: Product) -> int:
+    """상품 번호 (숫자가 아니면 0)"""
+    return int(product.id) if product.id.isdigit() else 0
+
+
+def to_timestamp(value: str) -> float:
+    """카페24 날짜 문자열 → timestamp (없거나 형식이 다르면 0)"""
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return 0.0
+
+
+class CatalogMirror:
+    """메모리에 보관하는 전체 상품 목록"""
+
+    def __init__(self, cafe24, transform: Callable[[dict], dict]):
+        self.cafe24 = cafe24
+        self.settings = get_settings()
+        self._transform = transform  # 카페24 상품 → Product 형태의 dict
+
+        self._by_id: dict[str, Product] = {}
+        self._data: dict[str, dict] = {}  # 상품 ID → 응답 본문에 그대로 쓰는 dict (수정하지 말 것)
+        self._order: list[str] = []  # 상품번호 내림차순 (최근 등록순)
+        self._by_category: dict[int, list[str]] = {}
+        self._categories_of: dict[str, tuple[int, ...]] = {}
+        self.facets: Optional[FacetIndex] = None  # 필터/패싯 인덱스 (갱신 때마다 새로 만듦)
+        self._sorted: dict[str, FacetIndex] = {}  # 정렬 순서 → 그 순서로 만든 인덱스
+
+        self._ready = False
+        self.version = 0  # 전체 갱신할 때마다 증가 (응답 캐시 무효화용)
+        self._refreshed_at: Optional[float] = None
+        self._refresh_duration: Optional[float] = None
+        self._refresh_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_ready(self) -> bool:
+        """한 번이라도 전체 로드가 끝났는지"""
+        return self._ready
+
+    @property
+    def age(self) -> float:
+        """마지막 전체 갱신 후 지난 시간 (초, 로드 전이면 무한대)"""
+        if self._refreshed_at is None:
+            return float("inf")
+        return time.time() - self._refreshed_at
+
+    # ========== 조회 ==========
+
+    def get(self, product_id: str) -> Optional[Product]:
+        """상품 ID로 조회 (없으면 None)"""
+        return self._by_id.get(product_id)
+
+    def get_data(self, product_id: str) -> Optional[dict]:
+        """상품 ID로 응답용 dict 조회 (없으면 None, 수정하지 말 것)"""
+        return self._data.get(product_id)
+
+    def products(self) -> dict[str, Product]:
+        """전체 상품 (상품 ID → 상품, 수정하지 말 것)"""
+        return self._by_id
+
+    def categories_of(self, product_id: str) -> tuple[int, ...]:
+        """상품이 속한 카테고리 번호"""
+        return self._categories_of.get(product_id, ())
+
+    def list_products(
+        self,
+        offset: int,
+        limit: int,
+        category_ids: Optional[list[int]] = None,
+    ) -> tuple[list[str], int]:
+        """
+        상품 목록 조회
+
+        category_ids가 여러 개면 중복 없이 합치고 최근 등록순을 따릅니다.
+        반환값: (해당 페이지 상품 ID, 전체 개수)
+        """
+        if not category_ids:
+            ids = self._order
+        elif len(category_ids) == 1:
+            ids = self._by_category.get(category_ids[0], [])
+        else:
+            wanted = set()
+            for category_no in category_ids:
+                wanted.update(self._by_category.get(category_no, []))
+            ids = [product_id for product_id in self._order if product_id in wanted]
+
+        return ids[offset:offset + limit], len(ids)
+
+    def index(self, sort: Optional[str] = None) -> FacetIndex:
+        """정렬 순서별 필터 인덱스 (sort가 없으면 기본 순서)"""
+        if sort is None:
+            return self.facets
+        return self._sorted[sort]
+
+    # ========== 갱신 ==========
+
+    async def refresh(self):
+        """카페24에서 전체 상품을 다시 받아와서 인덱스 교체"""
+        async with self._refresh_lock:
+            started = time.monotonic()
+
+            by_id: dict[str, Product] = {}
+            data_by_id: dict[str, dict] = {}
+            order: list[str] = []
+            by_category: dict[int, list[str]] = {}
+            categories_of: dict[str, tuple[int, ...]] = {}
+            created_at: dict[str, str] = {}
+
+            # 상품번호 순으로 이어서 조회 (다음 페이지는 미리 요청)
+            async with aclosing(self.cafe24.iter_products(embed="variants,images")) as products:
+                async for raw in products:
+                    data = self._transform(raw)
+                    if data["id"] in by_id:
+                        continue
+                    # 모델은 필터/정렬/검색/장바구니용, 응답 본문은 dict를 그대로 씀
+                    product = Product.model_validate(data)
+                    by_id[product.id] = product
+                    data_by_id[product.id] = data
+                    order.append(product.id)
+                    category_nos = []
+                    for category in raw.get("category") or []:
+                        category_no = category.get("category_no")
+                        if category_no is not None:
+                            by_category.setdefault(category_no, []).append(product.id)
+                            category_nos.append(category_no)
+                    categories_of[product.id] = tuple(category_nos)
+                    created_at[product.id] = raw.get("created_date") or ""
+                    if len(order) >= self.settings.catalog_mirror_max_products:
+                        print(f"[MIRROR] 최대 상품 수({len(order)}) 도달, 나머지는 카페24에서 조회")
+                        break
+
+            # 최근 등록순으로 보관
+            order.reverse()
+            for product_ids in by_category.values():
+                product_ids.reverse()
+
+            # 필터/패싯 인덱스 + 정렬 순서별 인덱스 (상품 수만큼 걸리므로 별도 스레드에서)
+            facets, sorted_indexes = await asyncio.to_thread(
+                self._build_indexes, by_id, order, categories_of, created_at,
+            )
+
+            # 다 만든 뒤 한 번에 교체 (조회 중에 절반만 바뀐 상태가 보이지 않도록)
+            self._by_id = by_id
+            self._data = data_by_id
+            self._order = order
+            self._by_category = by_category
+            self._categories_of = categories_of
+            self.facets = facets
+            self._sorted = sorted_indexes
+            self._ready = True
+            self.version += 1
+            self._refreshed_at = time.time()
+            self._refresh_duration = time.monotonic() - started
+            print(f"[MIRROR] 상품 {len(order)}개 로드 ({self._refresh_duration:.2f}초)")
+
+    @staticmethod
+    def _build_indexes(
+        by_id: dict[str, Product],
+        order: list[str],
+        categories_of: dict[str, tuple[int, ...]],
+        created_at: dict[str, str],
+    ) -> tuple[FacetIndex, dict[str, FacetIndex]]:
+        """
+        기본 순서 인덱스 + 정렬 순서별 인덱스 생성
+
+        정렬 순서마다 그 순서대로 비트를 매긴 인덱스를 따로 만들어 두면
+        정렬된 페이지도 카테고리/필터 비트맵에서 바로 꺼낼 수 있습니다. (요청마다 정렬하지 않음)
+        정렬 키는 오름차순 tuple이고 마지막은 항상 -상품번호입니다. (커서 페이지네이션에 사용)
+        """
+        products = [by_id[product_id] for product_id in order]
+        prices = {p.id: price_to_int(p.price.amount) for p in products}
+        sort_keys = {
+            None: lambda p: (-product_no(p),),
+            "newest": lambda p: (-to_timestamp(created_at.get(p.id, "")), -product_no(p)),
+            "price_asc": lambda p: (prices[p.id], -product_no(p)),
+            "price_desc": lambda p: (-prices[p.id], -product_no(p)),
+            "name": lambda p: (p.title.casefold(), -product_no(p)),
+        }
+
+        indexes = {}
+        for sort, sort_key in sort_keys.items():
+            keyed = sorted(((sort_key(p), p) for p in products), key=lambda item: item[0])
+            indexes[sort] = FacetIndex(
+                [p for _, p in keyed],
+                categories_of,
+                keys=[key for key, _ in keyed],
+            )
+        default = indexes.pop(None)
+        return default, indexes
+
+    async def _refresh_loop(self):
+        """주기적으로 전체 갱신 (백그라운드)"""
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[MIRROR] 상품 미러 갱신 실패: {e}")
+            await asyncio.sleep(self.settings.catalog_mirror_refresh_interval)
+
+    async def start(self):
+        """백그라운드 갱신 시작 (앱 시작 시, 첫 로드는 기다리지 않음)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        """백그라운드 갱신 중지 (앱 종료 시)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> dict:
+        """미러 상태 (모니터링용)"""
+        return {
+            "ready": self._ready,
+            "products": len(self._order),
+            "categories": len(self._by_category),
+            "refreshed_at": self._refreshed_at,
+            "refresh_duration": self._refresh_duration,
+        }
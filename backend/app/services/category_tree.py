@@ -0,0 +1,91 @@
+"""
+카테고리 트리 인덱스
+
+카테고리 목록으로 트리를 한 번 만들어 두고 아래 정보를 바로 조회합니다.
+- 모든 하위 카테고리 (손자 이하 포함)
+- 상위 경로 (breadcrumb)
+- 깊이 (최상위 = 1)
+"""
+from typing import Optional
+from app.models.product import Category
+
+
+class CategoryTree:
+    """카테고리 트리 (생성 후 변경하지 않음)"""
+
+    def __init__(self, categories: list[Category]):
+        # 어떤 목록으로 만든 트리인지 (목록이 바뀌면 다시 만듦)
+        self.source = categories
+
+        nodes = {c.id: c for c in categories}
+        children: dict[str, list[str]] = {}
+        roots: list[str] = []
+        for c in categories:
+            # 부모가 목록에 없으면 최상위로 취급 (카페24 최상위의 부모는 "1")
+            if c.parent_id and c.parent_id in nodes and c.parent_id != c.id:
+                children.setdefault(c.parent_id, []).append(c.id)
+            else:
+                roots.append(c.id)
+
+        self._children = children
+        self._ancestors: dict[str, tuple[str, ...]] = {}
+        self._descendants: dict[str, tuple[int, ...]] = {}
+        self._nodes: dict[str, Category] = {}
+
+        # 최상위부터 내려가며 깊이/경로 계산
+        stack = [(root, ()) for root in reversed(roots)]
+        while stack:
+            category_id, ancestors = stack.pop()
+            if category_id in self._nodes:  # 순환 방지
+                continue
+            node = nodes[category_id]
+            path_names = [nodes[a].name for a in ancestors] + [node.name]
+            self._nodes[category_id] = node.model_copy(update={
+                "depth": len(ancestors) + 1,
+                "path": "/".join(path_names),
+            })
+            self._ancestors[category_id] = ancestors
+            for child in reversed(children.get(category_id, [])):
+                stack.append((child, ancestors + (category_id,)))
+
+        # 하위 카테고리 목록 (자기 자신 제외, 트리 순서)
+        for category_id in self._nodes:
+            self._descendants[category_id] = tuple(
+                int(d) for d in self._walk(category_id) if d != category_id
+            )
+
+        # 원래 목록 순서 유지
+        self.categories = [self._nodes[c.id] for c in categories if c.id in self._nodes]
+
+    def _walk(self, category_id: str) -> list[str]:
+        """자신 + 모든 하위 카테고리 (깊이 우선)"""
+        result = []
+        stack = [category_id]
+        seen = set()
+        while stack:
+            current = stack.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            result.append(current)
+            stack.extend(reversed(self._children.get(current, [])))
+        return result
+
+    def get(self, category_id: str) -> Optional[Category]:
+        """카테고리 조회"""
+        return self._nodes.get(category_id)
+
+    def descendant_ids(self, category_no: int) -> tuple[int, ...]:
+        """모든 하위 카테고리 번호 (자기 자신 제외)"""
+        return self._descendants.get(str(category_no), ())
+
+    def breadcrumb(self, category_id: str) -> list[Category]:
+        """최상위부터 해당 카테고리까지의 경로"""
+        if category_id not in self._nodes:
+            return []
+        return [self._nodes[a] for a in self._ancestors[category_id]] + [self._nodes[category_id]]
+
+    def depth(self, category_id: str) -> int:
+        """깊이 (최상위 = 1, 없으면 0)"""
+        node = self._nodes.get(category_id)
+        return node.depth if node else 0
@@ -0,0 +1,123 @@
+"""
+상품 상세 미리 불러오기 (prefetch)
+
+사용자는 대부분 목록 맨 앞 몇 개 상품 중 하나를 눌러 상세로 들어갑니다.
+목록 응답 후 앞쪽 N개 상품의 상세를 백그라운드에서 미리 불러와 캐시에 넣어 두면
+상세 화면에서 카페24 호출(embed=variants,images)을 기다리지 않아도 됩니다.
+- 동시에 불러오는 수(concurrency)와 대기 중인 수(max_pending)를 제한하고,
+  카페24 호출은 LOW 우선순위로 보내서 실제 사용자 요청을 방해하지 않음
+- 미리 불러온 상품이 캐시에 있는 동안 조회되면 warmed, 조회되지 않고 만료되면 wasted
+"""
+import asyncio
+import time
+from typing import Awaitable, Callable
+from app.commons.cache import TTLCache
+
+
+class DetailPrefetcher:
+    """목록 응답 후 상품 상세를 미리 캐시에 넣는 백그라운드 작업"""
+
+    def __init__(
+        self,
+        cache: TTLCache,
+        loader: Callable[[str], Awaitable],
+        ttl: float,
+        top_n: int = 4,
+        concurrency: int = 2,
+        max_pending: int = 20,
+    ):
+        self.cache = cache
+        self._loader = loader  # 상품 ID → 상품 (카페24 LOW 우선순위 조회)
+        self.ttl = ttl
+        self.top_n = top_n
+        self.max_pending = max_pending
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+        self._pending: set[str] = set()  # 불러오는 중 (대기 포함)
+        self._tasks: set[asyncio.Task] = set()  # GC 방지용 참조
+        # 미리 불러온 뒤 아직 조회되지 않은 상품: 상품 ID → 캐시 만료 시각
+        self._unused: dict[str, float] = {}
+
+        self.scheduled = 0
+        self.skipped = 0  # 이미 캐시에 있음
+        self.dropped = 0  # 대기열이 가득 참
+        self.failed = 0
+        self.warmed = 0  # 미리 불러온 상품이 실제로 조회됨
+        self.wasted = 0  # 조회되지 않고 만료됨
+
+    @staticmethod
+    def _key(product_id: str) -> tuple:
+        return ("product", product_id)
+
+    def schedule(self, product_ids: list[str]):
+        """목록 앞쪽 상품 상세를 백그라운드에서 불러오기 시작"""
+        self._expire_unused()
+        for product_id in product_ids[:self.top_n]:
+            if product_id in self._pending or product_id in self._unused:
+                continue
+            if self._key(product_id) in self.cache:
+                self.skipped += 1
+                continue
+            if len(self._pending) >= self.max_pending:
+                self.dropped += 1
+                continue
+
+            self._pending.add(product_id)
+            self.scheduled += 1
+            task = asyncio.create_task(self._prefetch(product_id))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _prefetch(self, product_id: str):
+        try:
+            async with self._semaphore:
+                # 기다리는 동안 사용자가 먼저 조회했으면 건너뜀
+                if self._key(product_id) in self.cache:
+                    self.skipped += 1
+                    return
+                await self.cache.load(self._key(product_id), lambda: self._loader(product_id), self.ttl)
+                self._unused[product_id] = time.monotonic() + self.ttl
+        except Exception as e:
+            self.failed += 1
+            print(f"[PREFETCH] 상품 {product_id} 미리 불러오기 실패: {e}")
+        finally:
+            self._pending.discard(product_id)
+
+    def record_access(self, product_id: str):
+        """상품 상세 조회 시 호출 (미리 불러온 상품이면 warmed)"""
+        expires_at = self._unused.pop(product_id, None)
+        if expires_at is None:
+            return
+        if time.monotonic() < expires_at and self._key(product_id) in self.cache:
+            self.warmed += 1
+        else:
+            self.wasted += 1
+
+    def _expire_unused(self):
+        """조회되지 않고 캐시에서 만료/제거된 상품은 wasted로 집계"""
+        if not self._unused:
+            return
+        now = time.monotonic()
+        expired = [
+            product_id for product_id, expires_at in self._unused.items()
+            if now >= expires_at or self._key(product_id) not in self.cache
+        ]
+        for product_id in expired:
+            del self._unused[product_id]
+        self.wasted += len(expired)
+
+    def stats(self) -> dict:
+        """미리 불러오기 통계 (정책 조정용)"""
+        self._expire_unused()
+        used = self.warmed + self.wasted
+        return {
+            "scheduled": self.scheduled,
+            "skipped": self.skipped,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "pending": len(self._pending),
+            "unused": len(self._unused),
+            "warmed": self.warmed,
+            "wasted": self.wasted,
+            "hit_rate": round(self.warmed / used, 3) if used else None,
+        }
@@ -0,0 +1,235 @@
+"""
+상품 필터/패싯 인덱스 (컬럼 방식)
+
+미러의 전체 상품을 상품별 객체 대신 속성별 배열로 보관합니다.
+상품 위치(비트 번호)는 미러 순서(최근 등록순)와 같습니다.
+- 가격: array('q') (원 단위 정수) + 가격순 위치 목록
+- 판매 여부 / 태그별 / 카테고리별: 파이썬 int 비트맵 (비트 i = i번째 상품)
+
+필터 조합은 비트맵 AND/OR, 개수는 int.bit_count()로 계산하므로
+상품마다 파이썬 코드를 돌지 않습니다. (C 수준에서 64비트씩 처리)
+가격 범위는 가격순 누적 비트맵(PRICE_BLOCK개 단위)으로 만들어 블록 경계만 따로 처리합니다.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Optional
+from app.commons.utils import price_to_int
+from app.models.product import Product, ProductFacets, ProductFilter
+
+# 가격 누적 비트맵 간격 (작을수록 범위 계산이 빠르고 메모리를 더 씀)
+PRICE_BLOCK = 256
+
+
+def bitmap(positions: Iterable[int], size: int) -> int:
+    """위치 목록 → 비트맵 (bytearray에 비트를 세우고 한 번에 int로 변환)"""
+    data = bytearray((size + 7) // 8)
+    for position in positions:
+        data[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(data, "little")
+
+
+class FacetIndex:
+    """상품 속성 컬럼 + 비트맵 (생성 후 변경하지 않음, 미러가 갱신되면 새로 만듦)"""
+
+    def __init__(
+        self,
+        products: list[Product],
+        categories_of: dict[str, Iterable[int]],
+        keys: Optional[list[tuple]] = None,
+    ):
+        self.size = len(products)
+        self.ids = [p.id for p in products]
+        # 상품 위치별 정렬 키 (오름차순, 커서 다음 위치 찾기용)
+        self.keys = keys if keys is not None else [(position,) for position in range(self.size)]
+        self.all = (1 << self.size) - 1
+
+        self.prices = array("q", (price_to_int(p.price.amount) for p in products))
+        available: list[int] = []
+        tags: dict[str, list[int]] = {}
+        categories: dict[int, list[int]] = {}
+        for position, product in enumerate(products):
+            if product.available:
+                available.append(position)
+            for tag in product.tags:
+                tags.setdefault(tag, []).append(position)
+            for category_no in categories_of.get(product.id, ()):
+                categories.setdefault(category_no, []).append(position)
+        self.available = bitmap(available, self.size)
+        self.tags = {tag: bitmap(positions, self.size) for tag, positions in tags.items()}
+        self.categories = {c: bitmap(positions, self.size) for c, positions in categories.items()}
+
+        # 가격순 위치 + 누적 비트맵 (price_prefix[k] = 가장 싼 k * PRICE_BLOCK개)
+        self.price_order = sorted(range(self.size), key=self.prices.__getitem__)
+        self.sorted_prices = array("q", (self.prices[i] for i in self.price_order))
+        prefix = [0]
+        data = bytearray((self.size + 7) // 8)
+        for start in range(0, self.size, PRICE_BLOCK):
+            for position in self.price_order[start:start + PRICE_BLOCK]:
+                data[position >> 3] |= 1 << (position & 7)
+            prefix.append(int.from_bytes(data, "little"))
+        self.price_prefix = prefix
+
+    # ========== 비트맵 ==========
+
+    def _cheapest(self, count: int) -> int:
+        """가장 싼 count개 상품 비트맵"""
+        block, rest = divmod(count, PRICE_BLOCK)
+        mask = self.price_prefix[block]
+        start = block * PRICE_BLOCK
+        for position in self.price_order[start:start + rest]:
+            mask |= 1 << position
+        return mask
+
+    def price_mask(self, min_price: Optional[int], max_price: Optional[int]) -> int:
+        """가격 범위에 드는 상품 비트맵 (양 끝 포함)"""
+        low = bisect_left(self.sorted_prices, min_price) if min_price is not None else 0
+        high = bisect_right(self.sorted_prices, max_price) if max_price is not None else self.size
+        if low >= high:
+            return 0
+        return self._cheapest(high) ^ self._cheapest(low)
+
+    def category_mask(self, category_ids: Optional[Iterable[int]]) -> int:
+        """카테고리(여러 개면 합집합) 비트맵, None이면 전체"""
+        if category_ids is None:
+            return self.all
+        mask = 0
+        for category_no in category_ids:
+            mask |= self.categories.get(category_no, 0)
+        return mask
+
+    def tag_mask(self, tags: Iterable[str]) -> int:
+        """태그 중 하나라도 있는 상품 비트맵"""
+        mask = 0
+        for tag in tags:
+            mask |= self.tags.get(tag, 0)
+        return mask
+
+    def filter_masks(
+        self,
+        product_filter: ProductFilter,
+        category_ids: Optional[Iterable[int]] = None,
+    ) -> dict[str, int]:
+        """조건별 비트맵 (조건이 없으면 전체)"""
+        masks = {"category": self.category_mask(category_ids)}
+        masks["price"] = (
+            self.price_mask(product_filter.min_price, product_filter.max_price)
+            if product_filter.min_price is not None or product_filter.max_price is not None
+            else self.all
+        )
+        masks["tag"] = self.tag_mask(product_filter.tags) if product_filter.tags else self.all
+        if product_filter.available is None:
+            masks["available"] = self.all
+        elif product_filter.available:
+            masks["available"] = self.available
+        else:
+            masks["available"] = self.all & ~self.available
+        return masks
+
+    @staticmethod
+    def combine(masks: dict[str, int], exclude: Optional[str] = None) -> int:
+        """조건 비트맵 AND (exclude 조건은 빼고)"""
+        result = -1
+        for name, mask in masks.items():
+            if name != exclude:
+                result &= mask
+        return result
+
+    # ========== 조회 ==========
+
+    def position_after(self, key: tuple) -> int:
+        """정렬 키가 key보다 큰 첫 위치 (커서 다음 페이지 시작)"""
+        return bisect_right(self.keys, key)
+
+    def select(self, mask: int, offset: int, limit: int, start: int = 0) -> list[int]:
+        """비트맵에서 start 위치 이후 offset번째부터 limit개 상품 위치"""
+        if limit <= 0:
+            return []
+        mask >>= start
+        if mask <= 0:
+            return []
+
+        # 64비트씩 끊어서 개수로 건너뛰고, 필요한 구간만 비트를 확인
+        data = mask.to_bytes((self.size - start + 7) // 8 or 1, "little")
+        result = []
+        skip = offset
+        for chunk in range(0, len(data), 8):
+            word = int.from_bytes(data[chunk:chunk + 8], "little")
+            if not word:
+                continue
+            count = word.bit_count()
+            if skip >= count:
+                skip -= count
+                continue
+            base = start + chunk * 8
+            while word:
+                low = word & -word
+                if skip:
+                    skip -= 1
+                else:
+                    result.append(base + low.bit_length() - 1)
+                    if len(result) >= limit:
+                        return result
+                word ^= low
+        return result
+
+    def facets(self, masks: dict[str, int]) -> ProductFacets:
+        """
+        패싯 개수
+
+        각 항목의 개수는 그 항목의 조건만 뺀 나머지 조건으로 셉니다.
+        (태그를 하나 골라도 다른 태그 개수가 0이 되지 않도록)
+        """
+        without_tag = self.combine(masks, exclude="tag")
+        without_available = self.combine(masks, exclude="available")
+        without_price = self.combine(masks, exclude="price")
+
+        tags = {}
+        for tag, mask in self.tags.items():
+            count = (without_tag & mask).bit_count()
+            if count:
+                tags[tag] = count
+
+        categories = {}
+        without_category = self.combine(masks, exclude="category")
+        for category_no, mask in self.categories.items():
+            count = (without_category & mask).bit_count()
+            if count:
+                categories[str(category_no)] = count
+
+        available = (without_available & self.available).bit_count()
+        return ProductFacets(
+            tags=dict(sorted(tags.items(), key=lambda item: -item[1])),
+            categories=categories,
+            available={
+                "true": available,
+                "false": (without_available & self.all).bit_count() - available,
+            },
+            min_price=self._extreme_price(without_price, lowest=True),
+            max_price=self._extreme_price(without_price, lowest=False),
+        )
+
+    def _extreme_price(self, mask: int, lowest: bool) -> Optional[int]:
+        """비트맵에 있는 상품 중 최저/최고 가격"""
+        if mask <= 0:
+            return None
+
+        # 누적 비트맵으로 처음(마지막) 겹치는 블록을 이분 탐색한 뒤 블록 안에서만 확인
+        blocks = len(self.price_prefix) - 1
+        low, high = 1, blocks
+        while low < high:
+            middle = (low + high) // 2
+            overlaps = self.price_prefix[middle] & mask
+            if not lowest:
+                overlaps = (self.all ^ self.price_prefix[blocks - middle]) & mask
+            if overlaps:
+                high = middle
+            else:
+                low = middle + 1
+        block = low - 1 if lowest else blocks - low
+
+        data = mask.to_bytes((self.size + 7) // 8, "little")
+        positions = self.price_order[block * PRICE_BLOCK:(block + 1) * PRICE_BLOCK]
+        for position in positions if lowest else reversed(positions):
+            if data[position >> 3] >> (position & 7) & 1:
+                return self.prices[position]
+        return None
@@ -3,14 +3,21 @@
 
 결제 완료 후 카페24에 주문을 생성합니다.
 """
+from bisect import bisect_left, insort
 from typing import Optional
 from app.daos.cafe24_dao import cafe24_dao
 from app.services.cart_service import cart_service
 from app.services.payment_service import payment_service
-from app.models.order import Order, OrderItem, CreateOrderRequest, ShippingAddress
+from app.models.order import Order, OrderItem, OrderListResponse, CreateOrderRequest, ShippingAddress
 from app.models.product import ProductPrice
-from app.commons.utils import generate_uuid, get_timestamp
-from app.commons.exceptions import CartNotFoundException, OrderNotFoundException
+from app.commons.utils import generate_uuid, get_timestamp, price_to_int
+from app.commons.cursor import decode_cursor, encode_cursor
+from app.commons.exceptions import (
+    CartChangedException,
+    CartNotFoundException,
+    InvalidCursorException,
+    OrderNotFoundException,
+)
 
 
 class OrderService:
@@ -20,6 +27,8 @@ class OrderService:
         self.cafe24 = cafe24_dao
         # 메모리 기반 주문 저장소 (실제로는 DB 사용 권장)
         self._orders: dict[str, Order] = {}
+        # (생성 시각, 주문 ID) 오름차순 (목록 조회 시 매번 정렬하지 않도록)
+        self._timeline: list[tuple[str, str]] = []
 
     def _transform_to_cafe24_order(self, order: Order) -> dict:
         """
@@ -53,14 +62,35 @@ class OrderService:
         """
         주문 생성
 
-        1. 장바구니 정보로 주문 생성
-        2. 카페24에 주문 등록
+        1. 장바구니를 카페24 기준으로 다시 확인 (담을 때의 가격은 스냅샷이므로)
+        2. 장바구니 정보로 주문 생성
+        3. 카페24에 주문 등록
+
+        확인 결과 바뀐 내용이 있거나 장바구니 금액이 결제 금액과 다르면
+        결제를 취소하고 409로 거절합니다. (프론트의 결제 전 확인은 건너뛸 수 있으므로)
         """
         # 장바구니 조회
-        cart = cart_service.get_cart(request.cart_id)
+        cart = await cart_service.get_cart(request.cart_id)
         if not cart or not cart.items:
             raise CartNotFoundException("장바구니가 비어있습니다.")
 
+        # 가격/재고 확인 (상품 정보는 카페24에 묶어서 한 번에 조회)
+        validation = await cart_service.revalidate(request.cart_id)
+        cart = validation.cart
+        payment = await payment_service.get_payment_info(payment_key)
+        paid_amount = payment.get("totalAmount")
+        cart_amount = price_to_int(cart.total_price.amount)
+        if validation.changes or paid_amount != cart_amount:
+            print(
+                f"[ORDER] 결제 금액 불일치로 주문 거절: 결제 {paid_amount}, "
+                f"장바구니 {cart_amount}, 변경 {len(validation.changes)}건"
+            )
+            try:
+                await payment_service.cancel_payment(payment_key, "장바구니 가격/재고 변경")
+            except Exception as e:
+                print(f"[ORDER] 결제 취소 실패 ({payment_key}): {e}")
+            raise CartChangedException()
+
         # 주문 아이템 생성
         order_items = []
         for cart_item in cart.items:
@@ -97,11 +127,12 @@ class OrderService:
             # 카페24 주문 생성 실패해도 내부 주문은 저장
             print(f"카페24 주문 생성 실패: {e}")
 
-        # 내부 저장
+        # 내부 저장 (생성 시각 순서 유지, 보통 맨 뒤에 추가됨)
         self._orders[order.id] = order
+        insort(self._timeline, (order.created_at, order.id))
 
         # 장바구니 비우기
-        cart_service.clear_cart(request.cart_id)
+        await cart_service.clear_cart(request.cart_id)
 
         return order
 
@@ -112,15 +143,37 @@ class OrderService:
             raise OrderNotFoundException()
         return order
 
-    def get_orders(self, page: int = 1, limit: int = 10) -> list[Order]:
-        """주문 목록 조회"""
-        orders = list(self._orders.values())
-        # 최신순 정렬
-        orders.sort(key=lambda x: x.created_at, reverse=True)
+    def get_orders(
+        self,
+        page: int = 1,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+    ) -> OrderListResponse:
+        """
+        주문 목록 조회 (최신순)
 
-        start = (page - 1) * limit
-        end = start + limit
-        return orders[start:end]
+        cursor가 있으면 page 대신 이전 응답의 next_cursor 다음부터 조회합니다.
+        """
+        if cursor:
+            key = decode_cursor(cursor).get("k")
+            if not isinstance(key, list) or len(key) != 2 or not all(isinstance(k, str) for k in key):
+                raise InvalidCursorException()
+            end = bisect_left(self._timeline, tuple(key))
+        else:
+            end = len(self._timeline) - (page - 1) * limit
+
+        end = max(0, end)
+        start = max(0, end - limit)
+        orders = [self._orders[order_id] for _, order_id in reversed(self._timeline[start:end])]
+        has_next = start > 0
+        return OrderListResponse(
+            orders=orders,
+            total=len(self._timeline),
+            page=page,
+            limit=limit,
+            has_next=has_next,
+            next_cursor=encode_cursor({"k": list(self._timeline[start])}) if has_next else None,
+        )
 
     async def sync_order_status(self, order_id: str) -> Order:
         """카페24 주문 상태 동기화"""
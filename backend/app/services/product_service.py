@@ -3,27 +3,150 @@
 
 카페24 상품 데이터를 프론트엔드 형식으로 변환합니다.
 """
-from typing import Optional
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+from pydantic_core import to_json
 from app.daos.cafe24_dao import cafe24_dao
+from app.daos.call_limiter import PRIORITY_LOW, PRIORITY_NORMAL
+from app.commons.cache import TTLCache
+from app.commons.compression import SUPPORTED_ENCODINGS
+from app.commons.config import get_settings
+from app.commons.cursor import decode_cursor, encode_cursor
+from app.commons.exceptions import (
+    CatalogNotReadyException,
+    CategoryNotFoundException,
+    InvalidCursorException,
+    ProductNotFoundException,
+)
+from app.commons.response import SerializedBody, serialize_body, success_response
+from app.services.catalog_mirror import CatalogMirror
+from app.services.category_tree import CategoryTree
+from app.services.detail_prefetcher import DetailPrefetcher
+from app.services.search_index import SearchIndex
 from app.models.product import (
     Product,
-    ProductImage,
-    ProductPrice,
-    ProductVariant,
     ProductListResponse,
+    ProductFilter,
     Category,
 )
 
 
+# 응답 필드 → 만들 때 필요한 카페24 필드 (fields= 부분 조회용)
+FIELD_SOURCES = {
+    "id": ("product_no",),
+    "handle": ("product_no",),
+    "title": ("product_name",),
+    "description": ("description",),
+    "price": ("price",),
+    "compare_at_price": ("retail_price",),
+    "featured_image": ("detail_image", "product_name"),
+    "images": ("detail_image", "additional_images", "product_name"),
+    "variants": ("price", "variants"),
+    "available": ("display",),
+    "tags": ("product_tag",),
+    "category_no": ("category",),
+}
+
+
 class ProductService:
     """상품 관련 비즈니스 로직"""
 
     def __init__(self):
         self.cafe24 = cafe24_dao
+        self.settings = get_settings()
+        # 상품 목록/상세/카테고리 캐시
+        self.cache = TTLCache(
+            max_entries=self.settings.product_cache_max_entries,
+            max_bytes=self.settings.product_cache_max_bytes,
+            stale_ttl=self.settings.product_cache_stale_ttl,
+            sizeof=self._sizeof,
+        )
+        # 전체 상품 메모리 미러 (준비되면 목록/상세를 여기서 응답)
+        self.mirror = CatalogMirror(self.cafe24, self._product_dict)
+        # 목록 응답 후 앞쪽 상품 상세 미리 불러오기 (미러가 없을 때만)
+        self.prefetcher = DetailPrefetcher(
+            self.cache,
+            lambda product_id: self._fetch_product(product_id, priority=PRIORITY_LOW),
+            ttl=self.settings.product_cache_detail_ttl,
+            top_n=self.settings.product_prefetch_top_n,
+            concurrency=self.settings.product_prefetch_concurrency,
+            max_pending=self.settings.product_prefetch_max_pending,
+        )
+        # 상품 검색 색인 (미러/카테고리 트리가 바뀌면 바뀐 상품만 다시 색인)
+        self.search_index = SearchIndex()
+        self._search_synced: Optional[tuple] = None  # (미러 버전, 카테고리 트리)
+        self._search_lock = asyncio.Lock()
+        # 카테고리 트리 (카테고리 목록이 갱신될 때만 다시 만듦)
+        self._category_tree: Optional[CategoryTree] = None
+        # 직렬화된 응답 본문 캐시: key → (데이터 버전, 본문+ETag, 원본 참조)
+        self.bodies = TTLCache(
+            max_entries=self.settings.product_cache_max_entries,
+            max_bytes=self.settings.product_body_cache_max_bytes,
+            sizeof=lambda entry: entry[1].size,
+        )
+
+    @property
+    def _mirror_ready(self) -> bool:
+        return self.settings.catalog_mirror_enabled and self.mirror.is_ready
+
+    @staticmethod
+    def parse_fields(fields: Optional[str]) -> Optional[tuple[str, ...]]:
+        """
+        fields 파라미터 파싱 ("id,title,price" → 응답 필드 순서대로 정렬된 tuple)
+
+        id는 항상 포함합니다. 모르는 필드가 있으면 ValueError가 발생합니다.
+        """
+        if not fields:
+            return None
+        requested = {f.strip() for f in fields.split(",") if f.strip()}
+        unknown = requested - FIELD_SOURCES.keys()
+        if unknown:
+            raise ValueError(f"알 수 없는 필드: {', '.join(sorted(unknown))}")
+        requested.add("id")
+        return tuple(f for f in FIELD_SOURCES if f in requested)
+
+    @staticmethod
+    def _cafe24_fields(fields: tuple[str, ...]) -> str:
+        """응답 필드를 만들 때 필요한 카페24 필드 목록"""
+        sources = {"product_no"}
+        for f in fields:
+            sources.update(FIELD_SOURCES[f])
+        return ",".join(sorted(sources))
+
+    @staticmethod
+    def _embed_for(fields: Optional[tuple[str, ...]], default: Optional[str]) -> Optional[str]:
+        """옵션(variants)이 필요한 경우에만 embed"""
+        if fields is None:
+            return default
+        return "variants" if "variants" in fields else None
+
+    @staticmethod
+    def _project(product: dict, fields: Optional[tuple[str, ...]]) -> dict:
+        """상품 dict에서 요청한 필드만 남김"""
+        if fields is None:
+            return product
+        return {f: product[f] for f in fields}
+
+    @staticmethod
+    def _sizeof(value: Any) -> int:
+        """캐시 항목 크기 (JSON 직렬화 기준)"""
+        return len(to_json(value))
+
+    async def _cached(self, key: tuple, loader, ttl: float):
+        """캐시를 거쳐 조회 (캐시 꺼져 있으면 바로 호출)"""
+        if not self.settings.product_cache_enabled:
+            return await loader()
+        return await self.cache.get_or_load(key, loader, ttl)
 
     def _transform_product(self, cafe24_product: dict) -> Product:
+        """카페24 상품 데이터를 Product 모델로 변환 (모델이 필요한 곳에서만, 응답 본문은 dict를 그대로 씀)"""
+        return Product.model_validate(self._product_dict(cafe24_product))
+
+    def _product_dict(self, cafe24_product: dict) -> dict:
         """
-        카페24 상품 데이터를 프론트엔드 형식으로 변환
+        카페24 상품 데이터를 Product 응답 형태의 dict로 변환 (모델 생성 없음)
+
+        결과는 Product.model_dump()와 같아서 목록/상세 응답 본문과 캐시에 그대로 씁니다.
 
         카페24 API 응답:
         {
@@ -42,92 +165,65 @@ class ProductService:
             ...
         }
         """
-        # 기본 이미지 처리
-        featured_image = None
-        if cafe24_product.get("detail_image"):
-            featured_image = ProductImage(
-                url=cafe24_product["detail_image"],
-                alt=cafe24_product.get("product_name", ""),
-            )
+        get = cafe24_product.get
+        name = get("product_name", "")
+        base_price = get("price")
 
-        # 추가 이미지 처리
+        featured_image = None
         images = []
-        if featured_image:
+        if get("detail_image"):
+            featured_image = {"url": cafe24_product["detail_image"], "alt": name}
             images.append(featured_image)
-        for img in cafe24_product.get("additional_images", []):
+        for img in get("additional_images", []):
             if img:
-                images.append(ProductImage(url=img, alt=""))
+                images.append({"url": img, "alt": ""})
 
-        # 가격 처리
-        price = ProductPrice(
-            amount=str(cafe24_product.get("price", 0)),
-            currency_code="KRW",
-        )
+        price = {"amount": str(get("price", 0)), "currency_code": "KRW"}
 
-        # 할인 전 가격
         compare_at_price = None
-        if cafe24_product.get("retail_price"):
-            compare_at_price = ProductPrice(
-                amount=str(cafe24_product["retail_price"]),
-                currency_code="KRW",
-            )
+        if get("retail_price"):
+            compare_at_price = {"amount": str(cafe24_product["retail_price"]), "currency_code": "KRW"}
 
-        # 옵션(variants) 처리
         variants = []
-        for variant in cafe24_product.get("variants", []) or []:
+        for variant in get("variants", []) or []:
             if not variant:
                 continue
             options = variant.get("options") or []
-            option_value = options[0].get("value", "기본") if options else "기본"
-            variants.append(
-                ProductVariant(
-                    id=str(variant.get("variant_code", "")),
-                    title=option_value,
-                    price=ProductPrice(
-                        amount=str((variant.get("additional_amount") or 0) + (cafe24_product.get("price") or 0)),
-                        currency_code="KRW",
-                    ),
-                    available=(variant.get("quantity") or 0) > 0,
-                )
-            )
+            variants.append({
+                "id": str(variant.get("variant_code", "")),
+                "title": options[0].get("value", "기본") if options else "기본",
+                "price": {
+                    "amount": str((variant.get("additional_amount") or 0) + (base_price or 0)),
+                    "currency_code": "KRW",
+                },
+                "available": (variant.get("quantity") or 0) > 0,
+            })
 
-        # 기본 옵션이 없으면 하나 추가
         if not variants:
-            variants.append(
-                ProductVariant(
-                    id="default",
-                    title="기본",
-                    price=price,
-                    available=True,
-                )
-            )
-
-        return Product(
-            id=str(cafe24_product.get("product_no", "")),
-            handle=str(cafe24_product.get("product_no", "")),
-            title=cafe24_product.get("product_name", ""),
-            description=cafe24_product.get("description", ""),
-            price=price,
-            compare_at_price=compare_at_price,
-            featured_image=featured_image,
-            images=images,
-            variants=variants,
-            available=cafe24_product.get("display", "T") == "T",
-            tags=cafe24_product.get("product_tag", "").split(",") if cafe24_product.get("product_tag") else [],
-            category_no=cafe24_product.get("category", [{}])[0].get("category_no") if cafe24_product.get("category") and len(cafe24_product.get("category", [])) > 0 else None,
-        )
+            variants.append({"id": "default", "title": "기본", "price": price, "available": True})
+
+        product_no = str(get("product_no", ""))
+        product_tag = get("product_tag", "")
+        categories = get("category")
+        return {
+            "id": product_no,
+            "handle": product_no,
+            "title": name,
+            "description": get("description", ""),
+            "price": price,
+            "compare_at_price": compare_at_price,
+            "featured_image": featured_image,
+            "images": images,
+            "variants": variants,
+            "available": get("display", "T") == "T",
+            "tags": product_tag.split(",") if product_tag else [],
+            "category_no": categories[0].get("category_no") if categories else None,
+        }
 
     async def _get_child_category_ids(self, parent_category_no: int) -> list[int]:
-        """부모 카테고리의 모든 하위 카테고리 ID 조회"""
-        response = await self.cafe24.get_categories()
-        categories = response.get("categories", [])
-
-        child_ids = []
-        for cat in categories:
-            if cat.get("parent_category_no") == parent_category_no:
-                child_ids.append(cat.get("category_no"))
-
-        return child_ids
+        """부모 카테고리의 모든 하위 카테고리 ID 조회 (손자 이하 포함)"""
+        tree = await self.get_category_tree()
+        return list(tree.descendant_ids(parent_category_no))
 
     async def get_products(
         self,
@@ -135,9 +231,141 @@ class ProductService:
         limit: int = 10,
         category_no: Optional[int] = None,
         include_children: bool = True,
-    ) -> ProductListResponse:
-        """상품 목록 조회"""
+        fields: Optional[tuple[str, ...]] = None,
+        product_filter: Optional[ProductFilter] = None,
+        sort: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> dict:
+        """
+        상품 목록 조회 (미러 → 캐시 → 카페24)
+
+        ProductListResponse 형태의 dict를 반환합니다. (상품도 dict, 모델을 만들지 않음)
+        미러/캐시가 가진 dict를 그대로 돌려주므로 수정하지 말 것.
+        fields가 있으면 카페24에서 해당 필드만 받아옵니다. (없는 필드는 기본값)
+        미러는 이미 전체 데이터를 갖고 있으므로 fields와 관계없이 그대로 사용합니다.
+        가격/태그/판매 여부 필터(product_filter)와 정렬(sort)은 미러의 인덱스로만 처리합니다.
+        cursor가 있으면 page 대신 이전 응답의 next_cursor 다음부터 조회합니다.
+        """
+        cursor_data = decode_cursor(cursor) if cursor else None
+
+        if self._mirror_ready:
+            return await self._products_from_mirror(
+                page, limit, category_no, include_children, product_filter, sort, cursor_data,
+            )
+        if product_filter is not None or sort is not None or (cursor_data and "k" in cursor_data):
+            raise CatalogNotReadyException()
+
+        # 미러 준비 전에는 offset 커서 (카페24 offset 조회)
+        offset = self._cursor_offset(cursor_data) if cursor_data else (page - 1) * limit
+        return await self._cached(
+            ("products", page, offset, limit, category_no, include_children, fields),
+            lambda: self._fetch_products(page, limit, category_no, include_children, fields, offset),
+            self.settings.product_cache_list_ttl,
+        )
+
+    @staticmethod
+    def _cursor_offset(cursor_data: dict) -> int:
+        """offset 커서에서 offset 꺼내기"""
+        offset = cursor_data.get("o")
+        if not isinstance(offset, int) or isinstance(offset, bool) or offset < 0:
+            raise InvalidCursorException()
+        return offset
+
+    @staticmethod
+    def _cursor_key(cursor_data: dict, sort: Optional[str]) -> tuple:
+        """keyset 커서에서 정렬 키 꺼내기 (다른 정렬의 커서면 400)"""
+        key = cursor_data.get("k")
+        if cursor_data.get("s") != (sort or "") or not isinstance(key, list) or not key:
+            raise InvalidCursorException()
+        return tuple(key)
+
+    async def _products_from_mirror(
+        self,
+        page: int,
+        limit: int,
+        category_no: Optional[int],
+        include_children: bool,
+        product_filter: Optional[ProductFilter] = None,
+        sort: Optional[str] = None,
+        cursor_data: Optional[dict] = None,
+    ) -> dict:
+        """상품 목록 조회 (메모리 미러, 상품은 미러의 응답용 dict)"""
         offset = (page - 1) * limit
+        after = None
+        if cursor_data is not None:
+            if "o" in cursor_data:
+                offset = self._cursor_offset(cursor_data)
+            else:
+                after = self._cursor_key(cursor_data, sort)
+
+        category_ids = None
+        if category_no:
+            category_ids = [category_no]
+            if include_children:
+                category_ids.extend(await self._get_child_category_ids(category_no))
+
+        if product_filter is not None or sort is not None or after is not None:
+            # 정렬 순서대로 만들어 둔 인덱스에서 조건별 비트맵을 AND 해서 페이지만 꺼냄
+            # (패싯 개수도 같은 비트맵으로, 커서면 정렬 키 다음 위치부터)
+            index = self.mirror.index(sort)
+            masks = index.filter_masks(product_filter or ProductFilter(), category_ids)
+            matched = index.combine(masks)
+
+            start = 0
+            if after is not None:
+                try:
+                    start = index.position_after(after)
+                except TypeError:
+                    raise InvalidCursorException()
+                offset = 0
+
+            positions = index.select(matched, offset, limit + 1, start)
+            has_next = len(positions) > limit
+            positions = positions[:limit]
+            next_cursor = None
+            if has_next:
+                next_cursor = encode_cursor({"s": sort or "", "k": list(index.keys[positions[-1]])})
+
+            return {
+                "products": [self.mirror.get_data(index.ids[p]) for p in positions],
+                "total": matched.bit_count(),
+                "page": page,
+                "limit": limit,
+                "has_next": has_next,
+                "next_cursor": next_cursor,
+                "facets": index.facets(masks).model_dump() if product_filter is not None else None,
+            }
+
+        product_ids, total = self.mirror.list_products(offset, limit, category_ids)
+        has_next = offset + limit < total
+        next_cursor = None
+        if has_next and product_ids:
+            last = product_ids[-1]
+            next_cursor = encode_cursor({"s": "", "k": [-int(last) if last.isdigit() else 0]})
+        return {
+            "products": [self.mirror.get_data(product_id) for product_id in product_ids],
+            "total": total,
+            "page": page,
+            "limit": limit,
+            "has_next": has_next,
+            "next_cursor": next_cursor,
+            "facets": None,
+        }
+
+    async def _fetch_products(
+        self,
+        page: int,
+        limit: int,
+        category_no: Optional[int],
+        include_children: bool,
+        fields: Optional[tuple[str, ...]] = None,
+        offset: Optional[int] = None,
+    ) -> dict:
+        """상품 목록 조회 (카페24, 상품은 응답 형태의 dict)"""
+        if offset is None:
+            offset = (page - 1) * limit
+        cafe24_fields = self._cafe24_fields(fields) if fields else None
+        embed = self._embed_for(fields, None)
 
         all_products = []
         seen_product_ids = set()
@@ -150,17 +378,37 @@ class ProductService:
 
             print(f"[DEBUG] 카테고리 {category_no} + 하위 카테고리 {child_ids} 조회")
 
-            for cat_id in category_ids:
-                response = await self.cafe24.get_products(
-                    limit=100,  # 각 카테고리에서 충분히 가져오기
-                    offset=0,
-                    category_no=cat_id,
-                )
-                for p in response.get("products", []):
-                    product_no = p.get("product_no")
+            # 카테고리별로 동시에 조회 (동시 요청 수 제한)
+            semaphore = asyncio.Semaphore(self.settings.product_fanout_concurrency)
+            # product_no → 변환된 상품 (여러 카테고리에 속한 상품은 한 번만 변환)
+            transformed: dict[Any, dict] = {}
+
+            async def fetch_category(cat_id: int) -> list:
+                """카테고리 하나의 상품을 끝까지 페이지 조회 (카페24 기본 순서)"""
+                product_nos = []
+                async with semaphore:
+                    async for p in self.cafe24.iter_products(
+                        category_no=cat_id,
+                        embed=embed,
+                        fields=cafe24_fields,
+                        keyset=False,
+                        prefetch=False,
+                    ):
+                        product_no = p.get("product_no")
+                        product_nos.append(product_no)
+                        # 도착하는 대로 변환
+                        if product_no not in transformed:
+                            transformed[product_no] = self._product_dict(p)
+                return product_nos
+
+            results = await asyncio.gather(*(fetch_category(c) for c in category_ids))
+
+            # 카테고리 순서대로 합치면서 중복 제거
+            for product_nos in results:
+                for product_no in product_nos:
                     if product_no not in seen_product_ids:
                         seen_product_ids.add(product_no)
-                        all_products.append(self._transform_product(p))
+                        all_products.append(transformed[product_no])
 
             # 페이지네이션 적용
             total = len(all_products)
@@ -172,34 +420,87 @@ class ProductService:
                 limit=limit,
                 offset=offset,
                 category_no=category_no,
+                embed=embed,
+                fields=cafe24_fields,
             )
             products = [
-                self._transform_product(p) for p in response.get("products", [])
+                self._product_dict(p) for p in response.get("products", [])
             ]
-            total = response.get("count", len(products))
-            has_next = offset + limit < total
+            if "count" in response:
+                total = response["count"]
+                has_next = offset + limit < total
+            else:
+                # 목록 API는 전체 개수를 주지 않으므로 꽉 찬 페이지면 다음 페이지가 있다고 봄
+                total = offset + len(products)
+                has_next = len(products) == limit
+
+        return {
+            "products": products,
+            "total": total,
+            "page": page,
+            "limit": limit,
+            "has_next": has_next,
+            "next_cursor": encode_cursor({"o": offset + limit}) if has_next else None,
+            "facets": None,
+        }
 
-        return ProductListResponse(
-            products=products,
-            total=total,
-            page=page,
-            limit=limit,
-            has_next=has_next,
-        )
+    async def get_product(
+        self,
+        product_id: str,
+        fields: Optional[tuple[str, ...]] = None,
+    ) -> Product:
+        """상품 상세 조회 (미러 → 캐시 → 카페24)"""
+        if self._mirror_ready:
+            product = self.mirror.get(product_id)
+            if product is not None:
+                return product
+        return Product.model_validate(await self.get_product_data(product_id, fields))
+
+    async def get_product_data(
+        self,
+        product_id: str,
+        fields: Optional[tuple[str, ...]] = None,
+    ) -> dict:
+        """
+        상품 상세 조회 (미러 → 캐시 → 카페24, Product 형태의 dict)
 
-    async def get_product(self, product_id: str) -> Product:
-        """상품 상세 조회"""
-        from app.commons.exceptions import ProductNotFoundException
+        미러/캐시가 가진 dict를 그대로 돌려주므로 수정하지 말 것.
+        """
+        if self._mirror_ready:
+            data = self.mirror.get_data(product_id)
+            if data is not None:
+                return data
+
+        if fields is None:
+            self.prefetcher.record_access(product_id)
+        key = ("product", product_id) if fields is None else ("product", product_id, fields)
+        return await self._cached(
+            key,
+            lambda: self._fetch_product(product_id, fields),
+            self.settings.product_cache_detail_ttl,
+        )
 
+    async def _fetch_product(
+        self,
+        product_id: str,
+        fields: Optional[tuple[str, ...]] = None,
+        priority: int = PRIORITY_NORMAL,
+    ) -> dict:
+        """상품 상세 조회 (카페24, Product 형태의 dict)"""
         try:
-            response = await self.cafe24.get_product(int(product_id))
+            response = await self.cafe24.get_product(
+                int(product_id),
+                embed=self._embed_for(fields, "variants,images"),
+                fields=self._cafe24_fields(fields) if fields else None,
+                priority=priority,
+            )
             print(f"[DEBUG] 카페24 응답: {response}")  # 디버깅용
             product_data = response.get("product", {})
 
             if not product_data:
                 raise ProductNotFoundException(f"상품 ID {product_id}를 찾을 수 없습니다.")
 
-            return self._transform_product(product_data)
+            return self._product_dict(product_data)
         except ValueError:
             raise ProductNotFoundException(f"잘못된 상품 ID: {product_id}")
         except Exception as e:
@@ -209,23 +510,331 @@ class ProductService:
                 raise
             raise ProductNotFoundException(f"상품 조회 실패: {str(e)}")
 
-    async def get_categories(self) -> list[Category]:
-        """카테고리 목록 조회"""
-        response = await self.cafe24.get_categories()
+    async def search_products(self, query: str, page: int = 1, limit: int = 20) -> ProductListResponse:
+        """
+        상품 검색 (상품명/태그/카테고리명)
+
+        미러가 준비되면 메모리 색인에서 찾고,
+        아직 준비 전이면 카페24 상품명 검색으로 대신합니다.
+        """
+        offset = (page - 1) * limit
 
+        if not self._mirror_ready:
+            return await self._cached(
+                ("search", query, page, limit),
+                lambda: self._fetch_search(query, page, limit),
+                self.settings.product_cache_list_ttl,
+            )
+
+        await self._sync_search_index()
+        product_ids, total = self.search_index.search(query, offset, limit)
+        products = [p for p in (self.mirror.get(i) for i in product_ids) if p is not None]
+        return ProductListResponse(
+            products=products,
+            total=total,
+            page=page,
+            limit=limit,
+            has_next=offset + limit < total,
+        )
+
+    async def _sync_search_index(self):
+        """
+        미러나 카테고리 트리가 바뀌었으면 검색 색인 갱신 (바뀐 상품만)
+
+        처음 색인은 상품 수만큼 오래 걸리므로 별도 스레드에서 새 색인을 만들어 교체합니다.
+        """
+        tree = await self.get_category_tree()
+        async with self._search_lock:
+            synced = self._search_synced
+            if synced is not None and synced[0] == self.mirror.version and synced[1] is tree:
+                return
+            await self._rebuild_search_index(tree)
+
+    async def _rebuild_search_index(self, tree: CategoryTree):
+        """미러 상품으로 검색 색인 갱신"""
+        version = self.mirror.version
+
+        documents = {}
+        for product_id, product in self.mirror.products().items():
+            names = []
+            for category_no in self.mirror.categories_of(product_id):
+                category = tree.get(str(category_no))
+                if category is not None:
+                    names.append(category.name)
+            documents[product_id] = (product.title, product.tags, names)
+
+        if len(self.search_index):
+            updated, removed = self.search_index.sync(documents)
+        else:
+            index = SearchIndex()
+            updated, removed = await asyncio.to_thread(index.sync, documents)
+            self.search_index = index
+        self._search_synced = (version, tree)
+        if updated or removed:
+            print(f"[SEARCH] 검색 색인 갱신: {updated}개 색인, {removed}개 삭제")
+
+    async def _fetch_search(self, query: str, page: int, limit: int) -> ProductListResponse:
+        """상품 검색 (카페24 상품명 검색, 전체 개수는 알 수 없어 다음 페이지 여부만 확인)"""
+        offset = (page - 1) * limit
+        response = await self.cafe24.get_products(
+            limit=limit + 1,
+            offset=offset,
+            product_name=query,
+        )
+        products = [
+            self._transform_product(p)
+            for p in response.get("products", [])
+        ]
+        has_next = len(products) > limit
+        products = products[:limit]
+        return ProductListResponse(
+            products=products,
+            total=offset + len(products) + (1 if has_next else 0),
+            page=page,
+            limit=limit,
+            has_next=has_next,
+        )
+
+    async def get_category_tree(self) -> CategoryTree:
+        """
+        카테고리 트리 조회
+
+        카테고리 목록은 캐시(TTL + 백그라운드 갱신)를 거치고,
+        목록이 새로 바뀐 경우에만 트리를 다시 만듭니다.
+        """
+        categories = await self._cached(
+            ("categories",),
+            self._fetch_categories,
+            self.settings.product_cache_category_ttl,
+        )
+        if self._category_tree is None or self._category_tree.source is not categories:
+            self._category_tree = CategoryTree(categories)
+        return self._category_tree
+
+    async def get_product_snapshot(self, product_id: str) -> Product:
+        """
+        장바구니 담기용 상품 정보 (미러 → 캐시 → 카페24)
+
+        미러/캐시에 cart_snapshot_max_age(초)보다 새로운 정보가 있으면 카페24를 기다리지 않습니다.
+        가격/재고는 결제 전 확인(get_products_fresh)에서 다시 확인합니다.
+        """
+        product = self._local_snapshot(product_id)
+        if product is not None:
+            return product
+        return await self.get_product(product_id)
+
+    async def get_product_snapshots(self, product_ids: list[str]) -> dict[str, Product]:
+        """
+        여러 상품의 장바구니 담기용 정보
+
+        미러/캐시에 없는 상품만 카페24에 한 번에 묶어서 요청합니다. 없는 상품은 결과에서 빠집니다.
+        """
+        found: dict[str, Product] = {}
+        missing: list[int] = []
+        for product_id in dict.fromkeys(product_ids):
+            product = self._local_snapshot(product_id)
+            if product is not None:
+                found[product_id] = product
+            elif product_id.isdigit():
+                missing.append(int(product_id))
+
+        if missing:
+            for product_id, data in (await self._fetch_products_by_ids(missing)).items():
+                found[product_id] = Product.model_validate(data)
+        return found
+
+    def _local_snapshot(self, product_id: str) -> Optional[Product]:
+        """미러/캐시에서 cart_snapshot_max_age 이내의 상품 정보 (없으면 None)"""
+        max_age = self.settings.cart_snapshot_max_age
+        if self._mirror_ready and self.mirror.age <= max_age:
+            product = self.mirror.get(product_id)
+            if product is not None:
+                return product
+
+        if self.settings.product_cache_enabled:
+            cached = self.cache.peek(("product", product_id))
+            if cached is not None and cached[1] <= max_age:
+                return Product.model_validate(cached[0])
+        return None
+
+    async def get_products_fresh(self, product_ids: list[str]) -> dict[str, Product]:
+        """
+        여러 상품을 카페24에서 바로 조회 (미러/캐시 무시, 결제 전 확인용)
+
+        한 번에 묶어서 요청하고 결과로 캐시도 갱신합니다. 없는 상품은 결과에서 빠집니다.
+        """
+        product_nos = [int(product_id) for product_id in dict.fromkeys(product_ids) if product_id.isdigit()]
+        if not product_nos:
+            return {}
+        found = await self._fetch_products_by_ids(product_nos)
+        return {product_id: Product.model_validate(data) for product_id, data in found.items()}
+
+    async def _fetch_products_by_ids(self, product_nos: list[int]) -> dict[str, dict]:
+        """상품 번호 목록을 카페24에 묶어서 조회하고 상세 캐시에 저장 (Product 형태의 dict)"""
+        found: dict[str, dict] = {}
+        for raw in await self.cafe24.get_products_by_ids(product_nos):
+            data = self._product_dict(raw)
+            found[data["id"]] = data
+            if self.settings.product_cache_enabled:
+                self.cache.set(
+                    ("product", data["id"]),
+                    data,
+                    self.settings.product_cache_detail_ttl,
+                )
+        return found
+
+    async def get_products_batch(self, product_ids: list[str]) -> list[Optional[dict]]:
+        """
+        여러 상품 한 번에 조회 (Product 형태의 dict)
+
+        미러/캐시에 있는 상품은 바로 쓰고, 나머지만 카페24에 묶어서 요청합니다.
+        요청 순서대로 반환하며 없는 상품은 None입니다.
+        """
+        found: dict[str, dict] = {}
+        missing: list[int] = []
+
+        for product_id in dict.fromkeys(product_ids):  # 순서 유지 중복 제거
+            data = self.mirror.get_data(product_id) if self._mirror_ready else None
+            if data is None and self.settings.product_cache_enabled:
+                data = self.cache.get(("product", product_id))
+            if data is not None:
+                found[product_id] = data
+            elif product_id.isdigit():
+                missing.append(int(product_id))
+
+        if missing:
+            found.update(await self._fetch_products_by_ids(missing))
+
+        return [found.get(product_id) for product_id in product_ids]
+
+    async def get_categories(self) -> list[Category]:
+        """카테고리 목록 조회 (깊이/전체 경로 포함)"""
+        tree = await self.get_category_tree()
+        return tree.categories
+
+    async def get_category(self, category_id: str) -> tuple[Category, list[Category]]:
+        """카테고리 조회 (카테고리, 최상위부터의 경로)"""
+        tree = await self.get_category_tree()
+        category = tree.get(category_id)
+        if category is None:
+            raise CategoryNotFoundException(f"카테고리 ID {category_id}를 찾을 수 없습니다.")
+        return category, tree.breadcrumb(category_id)
+
+    async def _fetch_categories(self) -> list[Category]:
+        """카테고리 목록 조회 (카페24, 전체 페이지)"""
         categories = []
-        for cat in response.get("categories", []):
+        async for cat in self.cafe24.iter_categories():
             categories.append(
                 Category(
                     id=str(cat.get("category_no", "")),
                     name=cat.get("category_name", ""),
                     parent_id=str(cat.get("parent_category_no", "")) if cat.get("parent_category_no") else None,
-                    path=cat.get("full_category_name", {}).get("1", ""),
                 )
             )
 
         return categories
 
+    # ========== 직렬화된 응답 본문 ==========
+    # 같은 데이터면 JSON 바이트와 ETag를 한 번만 만들고 재사용합니다.
+    # 데이터 버전은 원본 객체의 id (캐시/미러가 새 객체로 바꾸면 달라짐)나
+    # 미러 갱신 횟수로 판단합니다.
+
+    async def _serialize(
+        self,
+        key: tuple,
+        version: tuple,
+        build: Callable[[], Awaitable[Any]],
+        keep: Any = None,
+    ) -> SerializedBody:
+        """
+        응답 본문(JSON 바이트 + ETag) 조회, 버전이 바뀌었으면 다시 직렬화
+
+        keep은 버전에 id()를 쓴 원본 객체로, 캐시에 있는 동안 id가 재사용되지 않도록 참조를 보관합니다.
+        """
+        entry = self.bodies.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        body = serialize_body(success_response(data=await build()))
+        # 자주 조회되는 본문이므로 압축본도 미리 만들어 같이 보관
+        if len(body.body) >= self.settings.compression_min_size:
+            for encoding in SUPPORTED_ENCODINGS:
+                body.encode(encoding)
+        self.bodies.set(key, (version, body, keep), self.settings.product_cache_detail_ttl)
+        return body
+
+    async def get_products_body(
+        self,
+        page: int = 1,
+        limit: int = 10,
+        category_no: Optional[int] = None,
+        include_children: bool = True,
+        fields: Optional[tuple[str, ...]] = None,
+        product_filter: Optional[ProductFilter] = None,
+        sort: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> SerializedBody:
+        """상품 목록 응답 본문 (fields가 있으면 해당 필드만, 필터 조회면 facets 포함)"""
+        key = ("products", page, limit, category_no, include_children, fields, product_filter, sort, cursor)
+
+        def dump(result: dict) -> dict:
+            # 미러/캐시의 dict는 수정하지 않고 새 dict로
+            data = {**result, "products": [self._project(p, fields) for p in result["products"]]}
+            if data["facets"] is None:
+                del data["facets"]
+            return data
+
+        if self._mirror_ready:
+            tree = await self.get_category_tree() if category_no else None
+            version = ("mirror", self.mirror.version, id(tree))
+
+            async def build():
+                return dump(await self._products_from_mirror(
+                    page, limit, category_no, include_children, product_filter, sort,
+                    decode_cursor(cursor) if cursor else None,
+                ))
+
+            return await self._serialize(key, version, build, keep=tree)
+
+        result = await self.get_products(
+            page, limit, category_no, include_children, fields, product_filter, sort, cursor,
+        )
+        if self.settings.product_prefetch_enabled:
+            # 응답을 보낸 뒤 백그라운드에서 앞쪽 상품 상세를 캐시에 넣어 둠
+            self.prefetcher.schedule([p["id"] for p in result["products"]])
+
+        async def build():
+            return dump(result)
+
+        return await self._serialize(key, ("data", id(result)), build, keep=result)
+
+    async def get_product_body(
+        self,
+        product_id: str,
+        fields: Optional[tuple[str, ...]] = None,
+    ) -> SerializedBody:
+        """상품 상세 응답 본문 (fields가 있으면 해당 필드만)"""
+        data = await self.get_product_data(product_id, fields)
+
+        async def build():
+            return self._project(data, fields)
+
+        return await self._serialize(
+            ("product", product_id, fields),
+            ("data", id(data)),
+            build,
+            keep=data,
+        )
+
+    async def get_categories_body(self) -> SerializedBody:
+        """카테고리 목록 응답 본문"""
+        tree = await self.get_category_tree()
+
+        async def build():
+            return [c.model_dump() for c in tree.categories]
+
+        return await self._serialize(("categories",), ("data", id(tree)), build, keep=tree)
+
 
 # 싱글톤 인스턴스
 product_service = ProductService()
@@ -0,0 +1,223 @@
+"""
+상품 검색 인덱스 (메모리, 역색인)
+
+한국어는 띄어쓰기가 일정하지 않고 조사가 붙기 때문에 단어 단위 대신
+글자 2개씩 묶은 bigram으로 색인합니다. ("반팔티셔츠" → 반팔, 팔티, 티셔, 셔츠)
+- 공백/기호는 빼고 이어 붙여서 색인 (띄어쓰기가 달라도 찾음)
+- 검색어의 bigram이 모두 들어 있는 상품만 결과에 포함 (부분 문자열 검색과 비슷)
+- 한 글자 검색어는 한 글자(unigram) 색인으로 찾음
+- 점수: 필드 가중치(상품명 > 태그 > 카테고리명) × 희귀도(idf), 상품명에 검색어가 그대로 있으면 가산점
+- 상품이 바뀌면 바뀐 상품만 다시 색인 (sync)
+- 검색어별 정렬 결과를 보관해서 같은 검색어는 페이지만 잘라서 응답
+"""
+import math
+import re
+import unicodedata
+from collections import OrderedDict
+from typing import Iterable
+
+# 필드별 가중치
+FIELD_WEIGHTS = {"title": 3.0, "tags": 2.0, "category": 1.0}
+
+# 상품명에 검색어가 그대로 들어 있을 때 가산점
+EXACT_MATCH_BONUS = 10.0
+
+# 검색 결과 캐시 크기 (검색어 수, 색인이 바뀌면 비움)
+RESULT_CACHE_SIZE = 1024
+
+# 색인이 바뀐 뒤 결과를 미리 다시 만들어 둘 최근 검색어 수
+REWARM_QUERIES = 32
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def normalize(text: str) -> str:
+    """검색용 정규화 (전각/반각 통일, 소문자)"""
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def _compact(text: str) -> str:
+    """정규화 후 공백/기호 제거 ("반팔 티셔츠" → "반팔티셔츠", 띄어쓰기와 관계없이 찾도록)"""
+    return "".join(WORD_PATTERN.findall(normalize(text)))
+
+
+def tokenize(text: str) -> list[str]:
+    """문서 색인용 토큰 (bigram + 한 글자)"""
+    text = _compact(text)
+    return list(text) + [text[i:i + 2] for i in range(len(text) - 1)]
+
+
+def query_terms(query: str) -> tuple[str, ...]:
+    """
+    검색어 토큰 (단어마다 두 글자 이상이면 bigram, 한 글자면 그대로)
+
+    문서는 단어를 이어 붙여 색인하므로 "반팔티"로 "반팔 티셔츠"를 찾을 수 있고,
+    검색어는 단어별로 나누므로 "오버핏 후드티"로 "오버핏 린넨 후드티"도 찾을 수 있습니다.
+    """
+    terms = []
+    for word in WORD_PATTERN.findall(normalize(query)):
+        if len(word) == 1:
+            terms.append(word)
+        else:
+            terms.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tuple(sorted(set(terms)))
+
+
+class SearchIndex:
+    """상품 ID → (상품명, 태그, 카테고리명) 역색인"""
+
+    def __init__(self):
+        # 토큰 → {상품 ID: 가중치}
+        self._postings: dict[str, dict[str, float]] = {}
+        # 상품 ID → 색인한 토큰/가중치 (삭제/갱신용)
+        self._terms: dict[str, dict[str, float]] = {}
+        # 상품 ID → 색인한 원본 (바뀌었는지 비교용)
+        self._documents: dict[str, tuple] = {}
+        # 상품 ID → 공백 제거한 상품명 (완전 일치 가산점용)
+        self._titles: dict[str, str] = {}
+        # 상품 ID → 상품 번호 (점수가 같으면 최근 등록순)
+        self._ranks: dict[str, int] = {}
+        # 검색어 토큰 → 점수순 전체 결과 (인기 검색어는 페이지만 잘라서 응답)
+        self._results: "OrderedDict[tuple, list[str]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def upsert(
+        self,
+        product_id: str,
+        title: str,
+        tags: Iterable[str] = (),
+        categories: Iterable[str] = (),
+    ) -> bool:
+        """상품 색인 추가/갱신 (내용이 같으면 건너뜀, 변경 여부 반환)"""
+        document = (title, tuple(tags), tuple(categories))
+        if self._documents.get(product_id) == document:
+            return False
+        self.remove(product_id)
+
+        weights: dict[str, float] = {}
+        fields = (
+            ("title", [title]),
+            ("tags", document[1]),
+            ("category", document[2]),
+        )
+        for field, texts in fields:
+            weight = FIELD_WEIGHTS[field]
+            for text in texts:
+                for token in tokenize(text):
+                    weights[token] = weights.get(token, 0.0) + weight
+
+        for token, weight in weights.items():
+            self._postings.setdefault(token, {})[product_id] = weight
+        self._terms[product_id] = weights
+        self._documents[product_id] = document
+        self._titles[product_id] = _compact(title)
+        self._ranks[product_id] = int(product_id) if product_id.isdigit() else 0
+        self._results.clear()
+        return True
+
+    def remove(self, product_id: str):
+        """상품 색인 삭제"""
+        weights = self._terms.pop(product_id, None)
+        if weights is None:
+            return
+        for token in weights:
+            posting = self._postings.get(token)
+            if posting is not None:
+                posting.pop(product_id, None)
+                if not posting:
+                    del self._postings[token]
+        del self._documents[product_id]
+        del self._titles[product_id]
+        del self._ranks[product_id]
+        self._results.clear()
+
+    def sync(self, documents: dict[str, tuple[str, Iterable[str], Iterable[str]]]) -> tuple[int, int]:
+        """
+        전체 상품 목록에 맞춰 색인 갱신
+
+        documents: 상품 ID → (상품명, 태그, 카테고리명)
+        바뀐 상품만 다시 색인하고 없어진 상품은 삭제합니다.
+        바뀐 게 있으면 최근 검색어 결과를 미리 다시 만들어 둡니다.
+        반환값: (갱신한 상품 수, 삭제한 상품 수)
+        """
+        recent = list(self._results)[-REWARM_QUERIES:]
+
+        removed = [product_id for product_id in self._documents if product_id not in documents]
+        for product_id in removed:
+            self.remove(product_id)
+
+        updated = 0
+        for product_id, (title, tags, categories) in documents.items():
+            if self.upsert(product_id, title, tags, categories):
+                updated += 1
+
+        if updated or removed:
+            for key in recent:
+                self._results[key] = self._rank(*key)
+        return updated, len(removed)
+
+    def search(self, query: str, offset: int = 0, limit: int = 20) -> tuple[list[str], int]:
+        """
+        검색 (점수 높은 순, 같으면 최근 등록순)
+
+        반환값: (해당 페이지 상품 ID, 전체 결과 수)
+        """
+        terms = query_terms(query)
+        if not terms:
+            return [], 0
+
+        phrase = _compact(query)
+        key = (terms, phrase)
+        ranked = self._results.get(key)
+        if ranked is None:
+            ranked = self._rank(terms, phrase)
+            self._results[key] = ranked
+            if len(self._results) > RESULT_CACHE_SIZE:
+                self._results.popitem(last=False)
+        else:
+            self._results.move_to_end(key)
+        return ranked[offset:offset + limit], len(ranked)
+
+    def _rank(self, terms: tuple[str, ...], phrase: str) -> list[str]:
+        """검색어 토큰이 모두 있는 상품을 점수순으로 정렬"""
+        postings = []
+        for term in terms:
+            posting = self._postings.get(term)
+            if not posting:
+                return []
+            postings.append((term, posting))
+
+        # 가장 짧은 목록부터 교집합
+        postings.sort(key=lambda item: len(item[1]))
+        candidates = set(postings[0][1])
+        for _, posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+
+        # 점수 계산 (한 번의 루프, 정렬 키를 tuple로 만들어 key 함수 호출 없이 정렬)
+        total_docs = len(self._documents)
+        weighted = [(posting, math.log(1 + total_docs / len(posting))) for _, posting in postings]
+        titles = self._titles
+        ranks = self._ranks
+        keyed = []
+        for product_id in candidates:
+            score = 0.0
+            for posting, idf in weighted:
+                score += posting[product_id] * idf
+            if phrase in titles[product_id]:
+                score += EXACT_MATCH_BONUS
+            keyed.append((-score, -ranks[product_id], product_id))
+        keyed.sort()
+        return [product_id for _, _, product_id in keyed]
+
+    def stats(self) -> dict:
+        """색인 상태 (모니터링용)"""
+        return {
+            "products": len(self._documents),
+            "terms": len(self._postings),
+            "cached_queries": len(self._results),
+        }
+
@@ -0,0 +1,100 @@
+"""
+카페24 HTTP 클라이언트 벤치마크 (요청마다 새 클라이언트 vs 공유 커넥션 풀)
+
+로컬 mock 업스트림을 띄우고 같은 상품 목록 요청을 두 방식으로 보내서
+지연 시간(p50/p99)을 비교합니다. 새 커넥션마다 --handshake-ms 만큼 지연을 넣어
+실제 카페24 TLS 핸드셰이크 비용을 흉내 냅니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_cafe24_client --requests 300 --handshake-ms 30
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import httpx
+from app.daos.cafe24_dao import Cafe24DAO
+
+BODY = json.dumps({"products": [{"product_no": i, "product_name": f"상품 {i}"} for i in range(10)]}).encode()
+
+
+async def start_mock_upstream(handshake_ms: float) -> asyncio.AbstractServer:
+    """keep-alive를 지원하는 최소 HTTP/1.1 mock 서버"""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        # 새 커넥션 = 핸드셰이크 비용
+        await asyncio.sleep(handshake_ms / 1000)
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                if length:
+                    await reader.readexactly(length)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: " + str(len(BODY)).encode() + b"\r\n\r\n" + BODY
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+def summarize(name: str, samples: list[float]):
+    samples = sorted(samples)
+    p50 = statistics.median(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(f"{name:<28} p50={p50 * 1000:7.2f}ms  p99={p99 * 1000:7.2f}ms")
+
+
+async def main(total: int, concurrency: int, handshake_ms: float):
+    server = await start_mock_upstream(handshake_ms)
+    port = server.sockets[0].getsockname()[1]
+    base_url = f"http://127.0.0.1:{port}/api/v2/admin"
+
+    class MockCafe24DAO(Cafe24DAO):
+        @property
+        def base_url(self) -> str:
+            return base_url
+
+    dao = MockCafe24DAO()
+    dao._access_token = "bench"
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def before() -> float:
+        # 기존 방식: 요청마다 새 AsyncClient
+        async with semaphore:
+            start = time.perf_counter()
+            async with httpx.AsyncClient() as client:
+                await client.get(f"{base_url}/products", headers=dao._get_headers())
+            return time.perf_counter() - start
+
+    async def after() -> float:
+        async with semaphore:
+            start = time.perf_counter()
+            await dao.get_products(limit=10)
+            return time.perf_counter() - start
+
+    await dao.open()
+    summarize("before (client per request)", await asyncio.gather(*(before() for _ in range(total))))
+    summarize("after (shared pool)", await asyncio.gather(*(after() for _ in range(total))))
+    await dao.close()
+
+    server.close()
+    await server.wait_closed()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--handshake-ms", type=float, default=30.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.handshake_ms))
@@ -0,0 +1,145 @@
+"""
+장바구니 아이템 변경 벤치마크 (목록 순회 + 총계 재계산 vs 색인 + 증분 총계)
+
+아이템 1~1000개 장바구니에서 변경 한 번에 걸리는 시간을 비교합니다.
+(증분 총계가 다시 계산한 값과 같은지는 tests/test_cart_index.py에서 확인)
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_cart --rounds 2000
+"""
+import argparse
+import asyncio
+import random
+import time
+from pydantic import BaseModel
+from app.daos.cart_store import MemoryCartStore
+from app.models.cart import Cart, CartItem
+from app.models.product import ProductPrice
+from app.services.cart_service import CartService
+from tests.samples import make_cart_item
+
+SIZES = [1, 10, 100, 1000]
+
+
+# ========== 기존 방식 (비교용) ==========
+
+class LegacyCart(BaseModel):
+    """기존 장바구니 (아이템 목록을 직접 보관)"""
+
+    id: str
+    items: list[CartItem] = []
+    total_quantity: int = 0
+    total_price: ProductPrice = ProductPrice(amount="0", currency_code="KRW")
+
+
+def legacy_totals(cart: LegacyCart):
+    """아이템 전체를 돌며 총계 재계산"""
+    total_quantity = sum(item.quantity for item in cart.items)
+    total_amount = sum(int(item.price.amount) * item.quantity for item in cart.items)
+    cart.total_quantity = total_quantity
+    cart.total_price = ProductPrice(amount=str(total_amount), currency_code="KRW")
+
+
+def legacy_add(cart: LegacyCart, item: CartItem):
+    for existing in cart.items:
+        if existing.product_id == item.product_id and existing.variant_id == item.variant_id:
+            existing.quantity += item.quantity
+            break
+    else:
+        cart.items.append(item)
+    legacy_totals(cart)
+
+
+def legacy_update(cart: LegacyCart, item_id: str, quantity: int):
+    for item in cart.items:
+        if item.id == item_id:
+            if quantity <= 0:
+                cart.items.remove(item)
+            else:
+                item.quantity = quantity
+            break
+    legacy_totals(cart)
+
+
+# ========== 색인 방식 ==========
+
+def indexed_add(cart: Cart, item: CartItem):
+    existing = cart.find_line(item.product_id, item.variant_id)
+    if existing:
+        cart.set_quantity(existing.id, existing.quantity + item.quantity)
+    else:
+        cart.add_line(item)
+
+
+def indexed_update(cart: Cart, item_id: str, quantity: int):
+    if quantity <= 0:
+        cart.remove_line(item_id)
+    else:
+        cart.set_quantity(item_id, quantity)
+
+
+def build_cart(size: int, seed: int, cart_class=Cart):
+    rng = random.Random(seed)
+    return cart_class(id="bench", items=[make_cart_item(i, rng) for i in range(size)])
+
+
+def timed(operation, rounds: int) -> float:
+    start = time.perf_counter()
+    for i in range(rounds):
+        operation(i)
+    return (time.perf_counter() - start) / rounds * 1_000_000
+
+
+def bench(rounds: int, seed: int):
+    print(f"{'아이템':>6} | {'담기(기존 상품)':>22} | {'수량 변경':>22} | {'삭제 후 다시 담기':>22}")
+    print(f"{'':>6} | {'기존':>10} {'색인':>10} | {'기존':>10} {'색인':>10} | {'기존':>10} {'색인':>10}")
+    for size in SIZES:
+        rng = random.Random(seed)
+        row = []
+        for cart_class, add, update in [(LegacyCart, legacy_add, legacy_update), (Cart, indexed_add, indexed_update)]:
+            cart = build_cart(size, seed, cart_class)
+            last = cart.get_line(f"item-{size - 1}") if cart_class is Cart else cart.items[-1]
+            same_line = last.model_copy(update={"id": "new", "quantity": 1})
+            quantities = [rng.randint(1, 9) for _ in range(rounds)]
+
+            add_us = timed(lambda i: add(cart, same_line), rounds)
+            update_us = timed(lambda i: update(cart, last.id, quantities[i]), rounds)
+
+            def remove_and_add(i: int):
+                update(cart, last.id, 0)
+                add(cart, last)
+
+            cycle_us = timed(remove_and_add, rounds)
+            row.append((add_us, update_us, cycle_us))
+
+        (legacy_add_us, legacy_update_us, legacy_cycle_us), (add_us, update_us, cycle_us) = row
+        print(
+            f"{size:>6} | {legacy_add_us:8.1f}µs {add_us:8.1f}µs | "
+            f"{legacy_update_us:8.1f}µs {update_us:8.1f}µs | "
+            f"{legacy_cycle_us:8.1f}µs {cycle_us:8.1f}µs"
+        )
+
+
+async def bench_service(rounds: int, seed: int):
+    """CartService.update_item (메모리 저장소, 조회 + 변경 + 저장)"""
+    print("CartService.update_item (memory 저장소)")
+    for size in SIZES:
+        service = CartService(store=MemoryCartStore(ttl=3600))
+        cart = build_cart(size, seed)
+        await service.store.put(cart)
+        item_id = f"item-{size - 1}"
+        start = time.perf_counter()
+        for i in range(rounds):
+            await service.update_item(cart.id, item_id, i % 9 + 1)
+        elapsed = (time.perf_counter() - start) / rounds * 1_000_000
+        print(f"{size:>6}개 {elapsed:8.1f}µs")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=22)
+    args = parser.parse_args()
+
+    bench(args.rounds, args.seed)
+    asyncio.run(bench_service(args.rounds, args.seed))
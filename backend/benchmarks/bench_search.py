@@ -0,0 +1,64 @@
+"""
+상품 검색 색인 벤치마크
+
+무작위 한국어 상품명/태그/카테고리로 상품 N개를 색인하고
+자주 쓰는 검색어의 응답 시간(p50/p99, 처음 검색/반복 검색)과 상품 일부만 바뀌었을 때 재색인 시간을 측정합니다.
+검색 결과가 맞는지는 tests/test_search_index.py에서 확인합니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_search --products 30000 --queries 5000
+"""
+import argparse
+import random
+import time
+from app.services.search_index import SearchIndex
+from tests.samples import QUERIES, random_document
+
+
+def percentile(values: list[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def bench(products: int, queries: int, seed: int):
+    rng = random.Random(seed)
+    documents = {str(i): random_document(rng) for i in range(1, products + 1)}
+
+    index = SearchIndex()
+    start = time.perf_counter()
+    index.sync(documents)
+    print(f"색인: 상품 {products}개 {time.perf_counter() - start:.2f}초, {index.stats()}")
+
+    # cold: 처음 들어온 검색어 (결과 캐시 없음), warm: 같은 검색어 반복 (페이지만 자름)
+    for query in QUERIES:
+        cold, warm = [], []
+        for _ in range(max(1, queries // len(QUERIES))):
+            index._results.clear()
+            start = time.perf_counter()
+            _, total = index.search(query, 0, 20)
+            cold.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            index.search(query, 20, 20)
+            warm.append(time.perf_counter() - start)
+        print(
+            f"{query:<12} 결과 {total:>6}개  "
+            f"cold p50 {percentile(cold, 0.5) * 1000:6.3f}ms p99 {percentile(cold, 0.99) * 1000:6.3f}ms  "
+            f"warm p50 {percentile(warm, 0.5) * 1000:6.3f}ms p99 {percentile(warm, 0.99) * 1000:6.3f}ms"
+        )
+
+    # 1%만 바뀐 경우 재색인 (바뀐 상품만 다시 색인)
+    for product_id in rng.sample(sorted(documents), products // 100):
+        documents[product_id] = random_document(rng)
+    start = time.perf_counter()
+    updated, removed = index.sync(documents)
+    print(f"재색인: {updated}개 갱신, {removed}개 삭제 {(time.perf_counter() - start) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--products", type=int, default=30000)
+    parser.add_argument("--queries", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=16)
+    args = parser.parse_args()
+
+    bench(args.products, args.queries, args.seed)
@@ -0,0 +1,50 @@
+"""
+상품 변환 벤치마크 (필드별 Pydantic 모델 생성 vs 응답 형태 dict)
+
+큰 상품 데이터(옵션/이미지 많음) 100개 페이지를 반복 변환해서 시간을 비교합니다.
+응답 본문까지 만드는 시간(model_dump 포함)도 같이 잽니다.
+기존 변환과 결과가 같은지는 tests/test_product_transform.py에서 확인합니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_transform --rounds 200
+"""
+import argparse
+import random
+import time
+from app.services.product_service import ProductService
+from tests.samples import legacy_transform, random_product
+
+
+def bench(service: ProductService, rounds: int, seed: int):
+    rng = random.Random(seed)
+    page = []
+    while len(page) < 100:
+        raw = random_product(rng, max_variants=30, max_images=10)
+        try:
+            legacy_transform(raw)
+        except Exception:
+            continue
+        page.append(raw)
+
+    for name, transform in [
+        ("기존 (모델 하나씩)", legacy_transform),
+        ("dict + 모델 검증", service._transform_product),
+        ("dict (응답 본문 경로)", service._product_dict),
+        ("기존 + model_dump", lambda raw: legacy_transform(raw).model_dump()),
+    ]:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for raw in page:
+                transform(raw)
+        elapsed = (time.perf_counter() - start) / rounds
+        print(f"{name:<24} {elapsed * 1000:7.2f}ms / 100개 페이지")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=24)
+    args = parser.parse_args()
+
+    service = ProductService()
+    bench(service, args.rounds, args.seed)
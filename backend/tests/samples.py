@@ -0,0 +1,163 @@
+"""
+테스트/벤치마크 공용 샘플 데이터
+
+같은 seed면 같은 데이터가 나오도록 모두 random.Random을 받습니다.
+"""
+import random
+import string
+from app.models.cart import CartItem
+from app.models.product import Product, ProductImage, ProductPrice, ProductVariant
+
+# ========== 카페24 상품 ==========
+
+def random_text(rng: random.Random, size: int) -> str:
+    return "".join(rng.choice(string.ascii_letters + "가나다라마바사 ") for _ in range(size))
+
+
+def random_product(rng: random.Random, max_variants: int = 20, max_images: int = 10) -> dict:
+    """카페24 상품 응답 형태의 무작위 데이터 (선택 필드는 있거나 없거나 비어 있음)"""
+    product = {"product_no": rng.randint(1, 10**6)}
+    optional = {
+        "product_name": lambda: random_text(rng, rng.randint(0, 40)),
+        "price": lambda: rng.choice([rng.randint(0, 10**6), f"{rng.randint(0, 10**6)}.00"]),
+        "retail_price": lambda: rng.choice([0, None, rng.randint(1, 10**6), "0.00", "39000.00"]),
+        "detail_image": lambda: rng.choice(["", f"https://img.example.com/{rng.randint(1, 999)}.jpg"]),
+        "additional_images": lambda: [
+            rng.choice(["", f"https://img.example.com/a{i}.jpg"]) for i in range(rng.randint(0, max_images))
+        ],
+        "description": lambda: "<p>" + random_text(rng, rng.randint(0, 500)) + "</p>",
+        "display": lambda: rng.choice(["T", "F"]),
+        "product_tag": lambda: rng.choice(["", "신상", "신상,세일,BEST"]),
+        "category": lambda: rng.choice([[], [{"category_no": rng.randint(1, 100)}, {"category_no": 7}]]),
+        "variants": lambda: rng.choice([None, [
+            rng.choice([None, {
+                "variant_code": f"P000{rng.randint(0, 9999)}",
+                "options": rng.choice([None, [], [{"value": random_text(rng, 5)}], [{}]]),
+                "additional_amount": rng.choice([None, 0, rng.randint(0, 5000)]),
+                "quantity": rng.choice([None, 0, rng.randint(1, 100)]),
+            }])
+            for _ in range(rng.randint(0, max_variants))
+        ]]),
+    }
+    for key, make in optional.items():
+        if rng.random() < 0.8:
+            product[key] = make()
+    return product
+
+
+def legacy_transform(cafe24_product: dict) -> Product:
+    """기존 변환 (비교 기준): 이미지/가격/옵션 모델을 하나씩 만든 뒤 Product 생성"""
+    # 기본 이미지 처리
+    featured_image = None
+    if cafe24_product.get("detail_image"):
+        featured_image = ProductImage(
+            url=cafe24_product["detail_image"],
+            alt=cafe24_product.get("product_name", ""),
+        )
+
+    # 추가 이미지 처리
+    images = []
+    if featured_image:
+        images.append(featured_image)
+    for img in cafe24_product.get("additional_images", []):
+        if img:
+            images.append(ProductImage(url=img, alt=""))
+
+    # 가격 처리
+    price = ProductPrice(
+        amount=str(cafe24_product.get("price", 0)),
+        currency_code="KRW",
+    )
+
+    # 할인 전 가격
+    compare_at_price = None
+    if cafe24_product.get("retail_price"):
+        compare_at_price = ProductPrice(
+            amount=str(cafe24_product["retail_price"]),
+            currency_code="KRW",
+        )
+
+    # 옵션(variants) 처리
+    variants = []
+    for variant in cafe24_product.get("variants", []) or []:
+        if not variant:
+            continue
+        options = variant.get("options") or []
+        option_value = options[0].get("value", "기본") if options else "기본"
+        variants.append(
+            ProductVariant(
+                id=str(variant.get("variant_code", "")),
+                title=option_value,
+                price=ProductPrice(
+                    amount=str((variant.get("additional_amount") or 0) + (cafe24_product.get("price") or 0)),
+                    currency_code="KRW",
+                ),
+                available=(variant.get("quantity") or 0) > 0,
+            )
+        )
+
+    # 기본 옵션이 없으면 하나 추가
+    if not variants:
+        variants.append(
+            ProductVariant(
+                id="default",
+                title="기본",
+                price=price,
+                available=True,
+            )
+        )
+
+    return Product(
+        id=str(cafe24_product.get("product_no", "")),
+        handle=str(cafe24_product.get("product_no", "")),
+        title=cafe24_product.get("product_name", ""),
+        description=cafe24_product.get("description", ""),
+        price=price,
+        compare_at_price=compare_at_price,
+        featured_image=featured_image,
+        images=images,
+        variants=variants,
+        available=cafe24_product.get("display", "T") == "T",
+        tags=cafe24_product.get("product_tag", "").split(",") if cafe24_product.get("product_tag") else [],
+        category_no=cafe24_product.get("category", [{}])[0].get("category_no") if cafe24_product.get("category") and len(cafe24_product.get("category", [])) > 0 else None,
+    )
+
+
+# ========== 검색 ==========
+
+ADJECTIVES = ["오버핏", "슬림핏", "루즈핏", "크롭", "빈티지", "베이직", "프리미엄", "데일리", "와이드", "스트레치"]
+MATERIALS = ["린넨", "코튼", "울", "데님", "니트", "레더", "쉬폰", "기모", "폴리", "캐시미어"]
+ITEMS = ["반팔 티셔츠", "긴팔 티셔츠", "셔츠", "블라우스", "청바지", "슬랙스", "원피스", "가디건", "자켓", "코트", "후드티", "맨투맨"]
+COLORS = ["블랙", "화이트", "네이비", "베이지", "그레이", "카키", "아이보리", "차콜"]
+TAGS = ["신상", "세일", "BEST", "여름", "겨울", "간절기", "커플룩", "오피스룩"]
+CATEGORIES = ["상의", "하의", "아우터", "원피스", "니트", "셔츠/블라우스", "팬츠", "데님"]
+
+# 자주 쓰는 검색어
+QUERIES = ["반팔", "반팔티", "티셔츠", "린넨 셔츠", "오버핏 후드티", "데님", "블랙", "아우터", "캐시미어 코트", "세일", "원피스", "와이드 슬랙스"]
+
+
+def random_document(rng: random.Random) -> tuple[str, list[str], list[str]]:
+    """검색 색인 문서 (상품명, 태그, 카테고리명)"""
+    title = " ".join([
+        rng.choice(ADJECTIVES),
+        rng.choice(MATERIALS),
+        rng.choice(ITEMS),
+        rng.choice(COLORS),
+    ])
+    tags = rng.sample(TAGS, rng.randint(0, 3))
+    categories = rng.sample(CATEGORIES, rng.randint(1, 2))
+    return title, tags, categories
+
+
+# ========== 장바구니 ==========
+
+def make_cart_item(i: int, rng: random.Random, item_id: str = "") -> CartItem:
+    """장바구니 아이템 (같은 i면 같은 상품)"""
+    return CartItem(
+        id=item_id or f"item-{i}",
+        product_id=str(1000 + i),
+        variant_id=rng.choice([None, f"P000{i:04d}"]),
+        title=f"상품 {i}",
+        quantity=rng.randint(1, 5),
+        price=ProductPrice(amount=str(rng.randint(1, 200) * 500), currency_code="KRW"),
+    )
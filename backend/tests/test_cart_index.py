@@ -0,0 +1,81 @@
+"""
+장바구니 색인/증분 총계 테스트
+
+무작위로 담기/수량 변경/삭제를 반복하면서
+- 증분 총계가 아이템 전체로 다시 계산한 값과 같은지
+- 색인이 아이템 목록과 같은 순서인지
+- 저장소에서 다시 불러온 장바구니도 같은 색인/총계를 갖는지 확인합니다.
+"""
+import random
+import pytest
+from app.commons.utils import price_to_int
+from app.daos.cart_store import dump_cart, load_cart
+from app.models.cart import Cart, CartItem
+from tests.samples import make_cart_item
+
+
+def add(cart: Cart, item: CartItem):
+    existing = cart.find_line(item.product_id, item.variant_id)
+    if existing:
+        cart.set_quantity(existing.id, existing.quantity + item.quantity)
+    else:
+        cart.add_line(item)
+
+
+def update(cart: Cart, item_id: str, quantity: int):
+    if quantity <= 0:
+        cart.remove_line(item_id)
+    else:
+        cart.set_quantity(item_id, quantity)
+
+
+def assert_consistent(cart: Cart):
+    items = list(cart.items)
+    assert cart.total_quantity == sum(item.quantity for item in items)
+    assert cart.total_price.amount == str(sum(price_to_int(item.price.amount) * item.quantity for item in items))
+    assert list(cart._index.lines.values()) == items
+    assert cart._index.by_product == {(item.product_id, item.variant_id): item.id for item in items}
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_totals_match_recomputed(seed):
+    rng = random.Random(seed)
+    cart = Cart(id="test")
+    for step in range(1000):
+        roll = rng.random()
+        if roll < 0.5 or not cart.items:
+            add(cart, make_cart_item(rng.randint(0, 200), rng, item_id=f"step-{step}"))
+        elif roll < 0.7:
+            update(cart, rng.choice(list(cart.items)).id, rng.randint(1, 9))
+        elif roll < 0.8:
+            item = rng.choice(list(cart.items))
+            cart.set_price(item.id, make_cart_item(0, rng).price)
+        else:
+            update(cart, rng.choice(list(cart.items)).id, 0)
+        assert_consistent(cart)
+
+    restored = load_cart(dump_cart(cart))
+    assert restored.model_dump() == cart.model_dump()
+    assert restored._index.by_product == cart._index.by_product
+    assert restored._index.amount == cart._index.amount
+    assert_consistent(restored)
+
+
+def test_remove_keeps_order():
+    rng = random.Random(0)
+    cart = Cart(id="test", items=[make_cart_item(i, rng) for i in range(5)])
+    assert cart.remove_line("item-2")
+    assert not cart.remove_line("item-2")
+    assert [item.id for item in cart.items] == ["item-0", "item-1", "item-3", "item-4"]
+    assert cart.find_line("1002", None) is None
+    assert_consistent(cart)
+
+
+def test_clear_lines():
+    rng = random.Random(0)
+    cart = Cart(id="test", items=[make_cart_item(i, rng) for i in range(5)])
+    cart.clear_lines()
+    assert not cart.items
+    assert (cart.total_quantity, cart.total_price.amount) == (0, "0")
+    cart.add_line(make_cart_item(1, rng))
+    assert_consistent(cart)
@@ -0,0 +1,305 @@
+"""
+장바구니 저장소 테스트
+
+memory / sqlite / redis 저장소가 같은 약속을 지키는지 확인합니다.
+- 조회/저장/삭제, 조회할 때마다 만료 시각 연장, 만료, 통계
+- 불러온 뒤 다른 요청이 먼저 저장했으면 저장하지 않음 (compare-and-set)
+
+시간은 가짜 시계로 움직이고, redis는 테스트 안에서 띄운 RESP 서버(RespStub)를 사용합니다.
+"""
+import asyncio
+import random
+import re
+from types import SimpleNamespace
+import orjson
+import pytest
+from app.daos import cart_store
+from app.daos.cart_store import (
+    CartVersionConflict,
+    MemoryCartStore,
+    RedisCartStore,
+    SQLiteCartStore,
+)
+from app.models.cart import Cart
+from app.services.cart_service import CartService
+from tests.samples import make_cart_item
+
+# SQLite는 SQLITE_TOUCH_INTERVAL마다만 연장하므로 그보다 충분히 길게
+TTL = 600.0
+
+
+class Clock:
+    """가짜 시계 (time.time / time.monotonic 대신)"""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+class RespStub:
+    """
+    테스트용 Redis 서버 (RedisCartStore가 쓰는 명령만)
+
+    GETEX / SET PX / EVAL(장바구니 compare-and-set 스크립트) / DEL / SCAN을 흉내 내고,
+    만료는 가짜 시계 기준입니다.
+    """
+
+    def __init__(self, clock: Clock):
+        self.clock = clock
+        self.data: dict[bytes, tuple[bytes, float]] = {}  # 키 → (값, 만료 시각)
+        self.commands: list[str] = []
+        self._server = None
+        self._writers: list[asyncio.StreamWriter] = []
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"redis://127.0.0.1:{port}/0"
+
+    async def stop(self):
+        self.drop_connections()
+        self._server.close()
+        await self._server.wait_closed()
+
+    def drop_connections(self):
+        """연결된 클라이언트 소켓 모두 끊기 (재연결 확인용)"""
+        for writer in self._writers:
+            writer.close()
+        self._writers.clear()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._writers.append(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                args = []
+                for _ in range(int(line[1:-2])):
+                    length = int((await reader.readline())[1:-2])
+                    args.append((await reader.readexactly(length + 2))[:-2])
+                writer.write(self._reply(args))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def _live(self, key: bytes):
+        entry = self.data.get(key)
+        if entry is not None and self.clock() >= entry[1]:
+            del self.data[key]
+            entry = None
+        return entry
+
+    def _reply(self, args: list[bytes]) -> bytes:
+        command = args[0].decode().upper()
+        self.commands.append(command)
+        if command == "GETEX":
+            entry = self._live(args[1])
+            if entry is None:
+                return b"$-1\r\n"
+            self.data[args[1]] = (entry[0], self.clock() + int(args[3]) / 1000)
+            return b"$%d\r\n%s\r\n" % (len(entry[0]), entry[0])
+        if command == "SET":
+            self.data[args[1]] = (args[2], self.clock() + int(args[4]) / 1000)
+            return b"+OK\r\n"
+        if command == "EVAL":
+            key, expected, value, ttl_ms = args[3:7]
+            entry = self._live(key)
+            if entry is None:
+                return b":0\r\n"
+            match = re.match(rb'^{"version":(\d+)', entry[0])
+            version = int(match.group(1)) if match else orjson.loads(entry[0]).get("version", 0)
+            if version != int(expected):
+                return b":0\r\n"
+            self.data[key] = (value, self.clock() + int(ttl_ms) / 1000)
+            return b":1\r\n"
+        if command == "DEL":
+            return b":%d\r\n" % int(self.data.pop(args[1], None) is not None)
+        if command == "SCAN":
+            prefix = args[3].rstrip(b"*")
+            keys = [key for key in list(self.data) if key.startswith(prefix) and self._live(key)]
+            parts = [b"*2\r\n$1\r\n0\r\n*%d\r\n" % len(keys)]
+            parts += [b"$%d\r\n%s\r\n" % (len(key), key) for key in keys]
+            return b"".join(parts)
+        return b"-ERR unknown command '%s'\r\n" % args[0]
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(cart_store, "time", SimpleNamespace(time=clock, monotonic=clock))
+    return clock
+
+
+@pytest.fixture
+async def redis_stub(clock):
+    stub = RespStub(clock)
+    stub.url = await stub.start()
+    yield stub
+    await stub.stop()
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+async def store(request, redis_stub, tmp_path):
+    if request.param == "memory":
+        store = MemoryCartStore(TTL)
+    elif request.param == "sqlite":
+        store = SQLiteCartStore(TTL, str(tmp_path / "carts.db"))
+    else:
+        store = RedisCartStore(TTL, redis_stub.url)
+    await store.open()
+    yield store
+    await store.close()
+
+
+def make_cart(cart_id: str, size: int = 3, version: int = 1) -> Cart:
+    rng = random.Random(cart_id)
+    cart = Cart(id=cart_id, items=[make_cart_item(i, rng) for i in range(size)])
+    cart._version = version
+    return cart
+
+
+async def test_get_put_delete(store):
+    assert await store.get("a") is None
+
+    cart = make_cart("a")
+    await store.put(cart)
+    loaded = await store.get("a")
+    assert loaded.model_dump() == cart.model_dump()
+    assert loaded._version == 1
+    assert loaded.find_line("1000", cart.get_line("item-0").variant_id) is not None
+
+    await store.delete("a")
+    assert await store.get("a") is None
+    await store.delete("a")  # 없는 장바구니 삭제는 오류 아님
+
+
+async def test_get_extends_ttl(store, clock):
+    await store.put(make_cart("a"))
+    clock.advance(TTL * 0.6)
+    assert await store.get("a") is not None
+    # 마지막 조회 기준으로 연장되어 저장 시각 + TTL이 지나도 남아 있음
+    clock.advance(TTL * 0.6)
+    assert await store.get("a") is not None
+    clock.advance(TTL + 1)
+    assert await store.get("a") is None
+
+
+async def test_sweep_removes_expired(store, clock):
+    await store.put(make_cart("old"))
+    clock.advance(TTL * 0.6)
+    await store.put(make_cart("new"))
+    clock.advance(TTL * 0.6)
+
+    removed = await store.sweep()
+    assert store.size() == 1
+    if store.name == "redis":
+        assert removed == 0  # 만료는 서버가 처리
+    else:
+        assert removed == 1
+        assert store.stats()["expired"] == 1
+    assert await store.get("old") is None
+    assert await store.get("new") is not None
+
+
+async def test_put_with_expected_version(store):
+    await store.put(make_cart("a", version=1))
+    await store.put(make_cart("a", size=4, version=2), expected_version=1)
+    assert len((await store.get("a")).items) == 4
+
+    # 불러온 뒤 다른 요청이 먼저 저장함
+    with pytest.raises(CartVersionConflict):
+        await store.put(make_cart("a", size=1, version=2), expected_version=1)
+    loaded = await store.get("a")
+    assert (len(loaded.items), loaded._version) == (4, 2)
+
+    # 불러온 뒤 삭제됨
+    with pytest.raises(CartVersionConflict):
+        await store.put(make_cart("gone", version=2), expected_version=1)
+    assert await store.get("gone") is None
+
+
+async def test_put_with_expected_version_after_expiry(store, clock):
+    await store.put(make_cart("a", version=1))
+    clock.advance(TTL + 1)
+    with pytest.raises(CartVersionConflict):
+        await store.put(make_cart("a", version=2), expected_version=1)
+
+
+async def test_stats(store):
+    await store.put(make_cart("a"))
+    await store.get("a")
+    await store.get("a")
+    await store.get("missing")
+    with pytest.raises(CartVersionConflict):
+        await store.put(make_cart("a", version=5), expected_version=4)
+    await store.sweep()
+
+    stats = store.stats()
+    assert stats["backend"] == store.name
+    assert (stats["hits"], stats["misses"], stats["writes"], stats["conflicts"]) == (2, 1, 1, 1)
+    assert stats["carts"] == 1
+
+
+async def test_sqlite_reopen_keeps_carts(clock, tmp_path):
+    path = str(tmp_path / "carts.db")
+    store = SQLiteCartStore(TTL, path)
+    await store.open()
+    await store.put(make_cart("a", version=3))
+    await store.close()
+
+    store = SQLiteCartStore(TTL, path)
+    await store.open()
+    assert store.size() == 1
+    await store.put(make_cart("a", version=4), expected_version=3)
+    assert (await store.get("a"))._version == 4
+    await store.close()
+
+
+async def test_redis_single_roundtrip_and_reconnect(redis_stub):
+    store = RedisCartStore(TTL, redis_stub.url)
+    await store.open()
+    await store.put(make_cart("a"))
+    redis_stub.commands.clear()
+    assert await store.get("a") is not None
+    assert redis_stub.commands == ["GETEX"]
+
+    # 연결이 끊겨도 조회는 다시 연결해서 한 번 재시도
+    redis_stub.drop_connections()
+    await asyncio.sleep(0)
+    assert await store.get("a") is not None
+    assert store.stats()["reconnects"] == 1
+    await store.close()
+
+
+async def test_service_reapplies_after_conflict(store):
+    """불러온 뒤 다른 요청이 먼저 저장하면 다시 불러와서 적용 (두 변경 모두 남음)"""
+    service = CartService(store=store)
+    await store.put(make_cart("a", size=3))
+    get = store.get
+    raced = False
+
+    async def racing_get(cart_id):
+        nonlocal raced
+        cart = await get(cart_id)
+        if not raced:
+            raced = True
+            await service.update_item(cart_id, "item-0", 9)
+        return cart
+
+    store.get = racing_get
+    cart = await service.remove_item("a", "item-1")
+
+    assert [item.id for item in cart.items] == ["item-0", "item-2"]
+    assert cart.get_line("item-0").quantity == 9
+    assert store.stats()["conflicts"] == (0 if store.name == "memory" else 1)
+    loaded = await get("a")
+    assert loaded.model_dump() == cart.model_dump()
+    assert loaded._version == 3
@@ -0,0 +1,60 @@
+"""
+상품 변환 테스트
+
+응답 본문에 그대로 쓰는 dict(_product_dict)와 모델 변환(_transform_product)이
+기존 변환(모델을 하나씩 만드는 방식)과 같은 결과를 내는지 무작위 카페24 데이터로 확인합니다.
+"""
+import random
+import pytest
+from app.models.product import Product
+from app.services.product_service import ProductService
+from tests.samples import legacy_transform, random_product
+
+CASES_PER_SEED = 300
+
+
+@pytest.fixture(scope="module")
+def service() -> ProductService:
+    return ProductService()
+
+
+def transform_or_error(transform, raw: dict):
+    try:
+        return transform(raw).model_dump()
+    except Exception as e:
+        return type(e)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_legacy_transform(service: ProductService, seed: int):
+    rng = random.Random(seed)
+    for case in range(CASES_PER_SEED):
+        raw = random_product(rng)
+        expected = transform_or_error(legacy_transform, raw)
+
+        # 기존 변환이 실패하면 모델 변환도 같은 예외로 실패해야 함
+        assert transform_or_error(service._transform_product, raw) == expected, (case, raw)
+        if isinstance(expected, dict):
+            # 응답 본문/캐시에 쓰는 dict는 모델의 model_dump()와 그대로 같아야 함
+            assert service._product_dict(raw) == expected, (case, raw)
+
+
+def test_product_dict_round_trips(service: ProductService):
+    rng = random.Random(100)
+    for _ in range(CASES_PER_SEED):
+        raw = random_product(rng)
+        raw["price"] = rng.randint(0, 10**6)  # 문자열 가격 + 옵션 추가금은 기존 변환도 실패
+        data = service._product_dict(raw)
+        assert Product.model_validate(data).model_dump() == data
+
+
+def test_missing_fields_use_defaults(service: ProductService):
+    data = service._product_dict({"product_no": 7})
+    assert data["id"] == data["handle"] == "7"
+    assert data["price"] == {"amount": "0", "currency_code": "KRW"}
+    assert data["variants"] == [
+        {"id": "default", "title": "기본", "price": data["price"], "available": True},
+    ]
+    assert data["images"] == [] and data["featured_image"] is None
+    assert data["tags"] == [] and data["category_no"] is None
+    assert data["available"] is True
@@ -0,0 +1,94 @@
+"""
+상품 검색 색인 테스트
+
+무작위 상품으로 색인해서
+- 결과가 전체 상품을 하나씩 확인한 결과와 같은지
+- 바뀐 상품만 다시 색인해도 처음부터 만든 색인과 결과가 같은지 확인합니다.
+"""
+import random
+import pytest
+from app.services.search_index import SearchIndex, query_terms, tokenize
+from tests.samples import QUERIES, random_document
+
+
+def build(documents: dict) -> SearchIndex:
+    index = SearchIndex()
+    index.sync(documents)
+    return index
+
+
+def brute_force(documents: dict, query: str) -> set[str]:
+    """검색어 토큰이 모두 들어 있는 상품 (색인 없이 하나씩 확인)"""
+    terms = set(query_terms(query))
+    found = set()
+    for product_id, (title, tags, categories) in documents.items():
+        tokens = set()
+        for text in [title, *tags, *categories]:
+            tokens.update(tokenize(text))
+        if terms <= tokens:
+            found.add(product_id)
+    return found
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_matches_brute_force(seed: int):
+    rng = random.Random(seed)
+    documents = {str(i): random_document(rng) for i in range(1, 501)}
+    index = build(documents)
+
+    for query in QUERIES:
+        ranked, total = index.search(query, 0, len(documents))
+        assert total == len(ranked)
+        assert set(ranked) == brute_force(documents, query), query
+
+        # 페이지를 이어 붙이면 전체 결과와 같아야 함
+        pages = []
+        for offset in range(0, total, 7):
+            page, page_total = index.search(query, offset, 7)
+            assert page_total == total
+            pages.extend(page)
+        assert pages == ranked
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_incremental_sync_matches_rebuild(seed: int):
+    rng = random.Random(seed)
+    documents = {str(i): random_document(rng) for i in range(1, 501)}
+    index = build(documents)
+    for query in QUERIES:
+        index.search(query)  # 결과 캐시를 채워 둔 상태에서 갱신
+
+    for product_id in rng.sample(sorted(documents), 50):
+        documents[product_id] = random_document(rng)
+    for product_id in rng.sample(sorted(documents), 20):
+        del documents[product_id]
+    documents.update({str(i): random_document(rng) for i in range(1000, 1020)})
+
+    updated, removed = index.sync(documents)
+    assert removed == 20
+    assert 20 <= updated <= 70  # 같은 내용으로 바뀐 상품은 건너뜀
+
+    fresh = build(documents)
+    for query in QUERIES:
+        assert index.search(query, 0, 1000) == fresh.search(query, 0, 1000), query
+
+
+def test_spacing_and_case_insensitive():
+    index = build({
+        "1": ("오버핏 반팔 티셔츠", ["BEST"], ["상의"]),
+        "2": ("린넨 셔츠", [], ["셔츠/블라우스"]),
+    })
+    assert index.search("반팔티")[0] == ["1"]
+    assert index.search("반 팔")[0] == ["1"]
+    assert index.search("best")[0] == ["1"]
+    assert index.search("셔츠")[1] == 2
+    assert index.search("없는상품") == ([], 0)
+    assert index.search("   ") == ([], 0)
+
+
+def test_title_ranks_above_category():
+    index = build({
+        "1": ("데님 자켓", [], ["아우터"]),
+        "2": ("린넨 셔츠", [], ["데님"]),
+    })
+    assert index.search("데님")[0] == ["1", "2"]
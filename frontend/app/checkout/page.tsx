@@ -4,6 +4,7 @@ import { useEffect, useState } from 'react';
 import { useRouter } from 'next/navigation';
 import {
   getCart,
+  validateCart,
   getPaymentClientKey,
   confirmPayment,
   createOrder,
@@ -63,6 +64,22 @@ export default function CheckoutPage() {
     setProcessing(true);
 
     try {
+      // 0. 가격/재고 확인 (바뀌었으면 다시 보여주고 중단)
+      const validation = await validateCart();
+      if (validation.changes.length > 0) {
+        setCart(validation.cart);
+        const lines = validation.changes.map((change) =>
+          change.reason === 'price_changed'
+            ? `${change.title}: 가격이 ${formatPrice(change.old_price?.amount ?? '0')} → ${formatPrice(change.new_price?.amount ?? '0')}(으)로 변경되었습니다.`
+            : `${change.title}: 품절되어 장바구니에서 삭제되었습니다.`
+        );
+        alert(`장바구니 상품 정보가 바뀌었습니다.\n\n${lines.join('\n')}\n\n확인 후 다시 결제해주세요.`);
+        if (validation.cart.items.length === 0) {
+          router.push('/cart');
+        }
+        return;
+      }
+
       // 1. 토스 Client Key 조회
       const clientKey = await getPaymentClientKey();
 
@@ -72,7 +89,7 @@ export default function CheckoutPage() {
 
       // 주문 ID 생성 (임시)
       const orderId = `ORDER_${Date.now()}`;
-      const amount = Number(cart.total_price.amount);
+      const amount = Number(validation.cart.total_price.amount);
 
       // 3. 결제 요청
       const paymentResult = await paymentWidget.requestPayment({
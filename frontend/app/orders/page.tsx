@@ -15,7 +15,7 @@ export default function OrdersPage() {
     async function loadOrders() {
       try {
         const data = await getOrders();
-        setOrders(data);
+        setOrders(data.orders);
       } catch (e) {
         console.error('주문 목록 로드 실패:', e);
       } finally {
@@ -77,6 +77,7 @@ export interface ProductListResponse {
   page: number;
   limit: number;
   has_next: boolean;
+  next_cursor?: string | null; // 다음 페이지 커서 (?cursor= 로 전달)
 }
 
 /**
@@ -112,6 +113,40 @@ export async function getProduct(productId: string): Promise<Product> {
   return fetchAPI<Product>(`/products/${productId}`);
 }
 
+export interface ProductBatchItem {
+  id: string;
+  found: boolean;
+  product: Product | null;
+}
+
+/**
+ * 여러 상품 한 번에 조회
+ *
+ * @param productIds 상품 ID 목록 (최대 100개)
+ */
+export async function getProductsBatch(
+  productIds: string[]
+): Promise<ProductBatchItem[]> {
+  const params = new URLSearchParams({ ids: productIds.join(',') });
+  return fetchAPI<ProductBatchItem[]>(`/products/batch?${params}`);
+}
+
+/**
+ * 상품 검색 (상품명/태그/카테고리명)
+ */
+export async function searchProducts(
+  query: string,
+  page: number = 1,
+  limit: number = 20
+): Promise<ProductListResponse> {
+  const params = new URLSearchParams({
+    q: query,
+    page: String(page),
+    limit: String(limit),
+  });
+  return fetchAPI<ProductListResponse>(`/products/search?${params}`);
+}
+
 /**
  * 카테고리 목록 조회
  */
@@ -154,6 +189,9 @@ export interface Cart {
 
 /**
  * 장바구니 조회
+ *
+ * 아직 상품을 담지 않았으면 빈 장바구니(id가 빈 문자열)를 반환합니다.
+ * 장바구니는 처음 상품을 담을 때 만들어집니다.
  */
 export async function getCart(): Promise<Cart> {
   return fetchAPI<Cart>('/cart');
@@ -208,6 +246,52 @@ export async function removeFromCart(itemId: string): Promise<Cart> {
   });
 }
 
+export type CartOperation =
+  | { op: 'add'; product_id: string; variant_id?: string; quantity?: number }
+  | { op: 'update'; item_id: string; quantity: number }
+  | { op: 'remove'; item_id: string };
+
+/**
+ * 장바구니 일괄 변경 (재주문, 코디 한 번에 담기 등)
+ *
+ * 하나라도 실패하면 아무것도 바뀌지 않습니다. (최대 100개)
+ *
+ * @param operations 추가/수량 변경/삭제 작업 목록
+ */
+export async function batchCartItems(operations: CartOperation[]): Promise<Cart> {
+  return fetchAPI<Cart>('/cart/items:batch', {
+    method: 'POST',
+    body: JSON.stringify({ operations }),
+  });
+}
+
+export interface CartChange {
+  item_id: string;
+  product_id: string;
+  title: string;
+  reason: 'price_changed' | 'sold_out' | 'not_found';
+  old_price?: {
+    amount: string;
+    currency_code: string;
+  };
+  new_price?: {
+    amount: string;
+    currency_code: string;
+  };
+}
+
+/**
+ * 결제 전 장바구니 확인
+ *
+ * 가격/재고를 카페24 기준으로 다시 확인합니다.
+ * changes가 있으면 장바구니가 바뀐 것이므로 사용자에게 다시 보여줘야 합니다.
+ */
+export async function validateCart(): Promise<{ cart: Cart; changes: CartChange[] }> {
+  return fetchAPI<{ cart: Cart; changes: CartChange[] }>('/cart/validate', {
+    method: 'POST',
+  });
+}
+
 // ========== 결제 API ==========
 
 /**
@@ -275,6 +359,9 @@ export interface Order {
 /**
  * 주문 생성
  *
+ * 서버가 장바구니를 다시 확인해서 가격/재고가 바뀌었거나 결제 금액과 다르면
+ * 결제를 취소하고 409로 거절합니다.
+ *
  * @param cartId 장바구니 ID
  * @param shippingAddress 배송 주소
  * @param paymentKey 결제 키
@@ -293,11 +380,20 @@ export async function createOrder(
   });
 }
 
+export interface OrderListResponse {
+  orders: Order[];
+  total: number;
+  page: number;
+  limit: number;
+  has_next: boolean;
+  next_cursor?: string | null; // 다음 페이지 커서 (?cursor= 로 전달)
+}
+
 /**
  * 주문 목록 조회
  */
 export async function getOrders(page: number = 1, limit: number = 10) {
-  return fetchAPI<Order[]>(`/orders?page=${page}&limit=${limit}`);
+  return fetchAPI<OrderListResponse>(`/orders?page=${page}&limit=${limit}`);
 }
 
 /**